@@ -0,0 +1,564 @@
+"""
+A local stand-in for the Devopness API, serving the endpoints used by the
+services with generated records, configurable latency, sizes and error rate.
+
+It can be used in-process, as an httpx transport (see `transport`), or served
+over HTTP for a server started with `DEVOPNESS_API_URL` pointing to it:
+
+    python -m mcp_server.bench.fake_api --port 8900
+"""
+
+import argparse
+import asyncio
+import enum
+import json
+import random
+import re
+import types
+import typing
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable
+
+import devopness.models as models
+import httpx
+from pydantic import BaseModel
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+ACCESS_TOKEN = "fake-access-token"
+REFRESH_TOKEN = "fake-refresh-token"
+TOKEN_EXPIRES_IN = 3600
+
+# (status, JSON body or None, headers)
+Reply = tuple[int, Any, dict[str, str]]
+
+
+@dataclass
+class FakeApiConfig:
+    projects: int = 2
+    environments_per_project: int = 2
+    servers_per_environment: int = 25
+    applications_per_environment: int = 2
+    credentials_per_environment: int = 2
+    regions: list[str] = field(
+        default_factory=lambda: ["us-east-1", "eu-west-1", "eu-central-1"]
+    )
+    instance_types_per_region: int = 30
+    # Polls until an action completes
+    action_polls: int = 3
+    # Seconds each response is delayed by, plus up to `latency_jitter`
+    latency: float = 0.01
+    latency_jitter: float = 0.0
+    # Fraction of the requests (other than logins) failing with a 503
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+def sample_value(annotation: Any) -> Any:
+    """
+    A valid value of the given type, for the required fields of a record.
+    """
+    origin = typing.get_origin(annotation)
+
+    if origin is typing.Annotated:
+        return sample_value(typing.get_args(annotation)[0])
+
+    if origin in (typing.Union, types.UnionType):
+        args = typing.get_args(annotation)
+        if type(None) in args:
+            return None
+
+        return sample_value(args[0])
+
+    if origin is list:
+        return []
+
+    if origin is dict:
+        return {}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation)).value
+
+        if issubclass(annotation, BaseModel):
+            return build_record(annotation)
+
+        if annotation is bool:
+            return True
+
+        if annotation in (int, float):
+            return annotation(1)
+
+        if annotation is str:
+            return "sample"
+
+    return None
+
+
+def build_record(model: type[BaseModel], **values: Any) -> dict[str, Any]:
+    record = {
+        model_field.alias or name: sample_value(model_field.annotation)
+        for name, model_field in model.model_fields.items()
+        if model_field.is_required()
+    }
+
+    return {**record, **values}
+
+
+class FakeDevopnessApi:
+    """
+    Resource IDs are derived from their parents' ones, so a client can build
+    valid arguments from the config alone (see `project_ids` and friends).
+    """
+
+    def __init__(self, config: FakeApiConfig | None = None) -> None:
+        self.config = config or FakeApiConfig()
+        self.random = random.Random(self.config.seed)
+
+        self.calls: Counter[str] = Counter()
+        self.action_polls: Counter[int] = Counter()
+        self.next_id = 1_000_000
+
+        self.routes: list[tuple[str, re.Pattern[str], Callable[..., Reply]]] = [
+            ("POST", re.compile(r"/users/login"), self.login),
+            ("POST", re.compile(r"/users/refresh-token"), self.login),
+            ("GET", re.compile(r"/projects"), self.list_projects),
+            ("GET", re.compile(r"/projects/(\d+)"), self.get_project),
+            (
+                "GET",
+                re.compile(r"/projects/(\d+)/environments"),
+                self.list_environments,
+            ),
+            ("GET", re.compile(r"/environments/(\d+)/servers"), self.list_servers),
+            ("POST", re.compile(r"/environments/(\d+)/servers"), self.create_server),
+            (
+                "GET",
+                re.compile(r"/environments/(\d+)/applications"),
+                self.list_applications,
+            ),
+            (
+                "POST",
+                re.compile(r"/environments/(\d+)/applications"),
+                self.create_application,
+            ),
+            (
+                "GET",
+                re.compile(r"/environments/(\d+)/credentials"),
+                self.list_credentials,
+            ),
+            ("GET", re.compile(r"/pipelines/(\d+)"), self.get_pipeline),
+            ("GET", re.compile(r"/pipelines/([\w-]+)/(\d+)"), self.list_pipelines),
+            ("POST", re.compile(r"/pipelines/(\d+)/actions"), self.add_action),
+            ("GET", re.compile(r"/actions/(\d+)"), self.get_action),
+            ("POST", re.compile(r"/servers/(\d+)/stop"), self.server_action),
+            ("DELETE", re.compile(r"/servers/(\d+)"), self.server_action),
+            (
+                "GET",
+                re.compile(r"/static/cloud-provider-service-options/([\w-]+)"),
+                self.get_provider_service,
+            ),
+            (
+                "GET",
+                re.compile(
+                    r"/static/cloud-provider-service-options/([\w-]+)"
+                    r"/regions/([\w-]+)/instances"
+                ),
+                self.list_instance_types,
+            ),
+        ]
+
+    # IDs of the resources, by parent
+
+    def project_ids(self) -> list[int]:
+        return list(range(1, self.config.projects + 1))
+
+    def environment_ids(self, project_id: int) -> list[int]:
+        count = self.config.environments_per_project
+        return [project_id * 100 + index for index in range(1, count + 1)]
+
+    def server_ids(self, environment_id: int) -> list[int]:
+        count = self.config.servers_per_environment
+        return [environment_id * 1000 + index for index in range(1, count + 1)]
+
+    def application_ids(self, environment_id: int) -> list[int]:
+        count = self.config.applications_per_environment
+        return [environment_id * 1000 + 500 + index for index in range(1, count + 1)]
+
+    def pipeline_id(self, application_id: int) -> int:
+        return application_id * 10 + 1
+
+    def all_environment_ids(self) -> list[int]:
+        return [
+            environment_id
+            for project_id in self.project_ids()
+            for environment_id in self.environment_ids(project_id)
+        ]
+
+    # Endpoints
+
+    async def reply(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+    ) -> Reply:
+        self.calls[f"{method} {path}"] += 1
+
+        delay = self.config.latency
+        if self.config.latency_jitter:
+            delay += self.random.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method != method or match is None:
+                continue
+
+            if not path.startswith("/users/"):
+                if headers.get("authorization") != f"Bearer {ACCESS_TOKEN}":
+                    return 401, {"message": "Unauthenticated."}, {}
+
+                if self.random.random() < self.config.error_rate:
+                    return 503, {"message": "Service Unavailable"}, {}
+
+            return handler(params, *match.groups())
+
+        return 404, {"message": f"Not found: {method} {path}"}, {}
+
+    def paginate(self, params: dict[str, str], records: list[Any]) -> Reply:
+        page = int(params.get("page", 1))
+        per_page = int(params.get("per_page", 10))
+        last_page = max((len(records) + per_page - 1) // per_page, 1)
+
+        return (
+            200,
+            records[(page - 1) * per_page : page * per_page],
+            {"link": f'<?page={last_page}>; rel="last"'},
+        )
+
+    def login(self, params: dict[str, str]) -> Reply:
+        return (
+            200,
+            {
+                "token_type": "Bearer",
+                "expires_in": TOKEN_EXPIRES_IN,
+                "access_token": ACCESS_TOKEN,
+                "refresh_token": REFRESH_TOKEN,
+            },
+            {},
+        )
+
+    def list_projects(self, params: dict[str, str]) -> Reply:
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.ProjectRelation, id=project_id, name=f"project-{project_id}"
+                )
+                for project_id in self.project_ids()
+            ],
+        )
+
+    def get_project(self, params: dict[str, str], project_id: str) -> Reply:
+        if int(project_id) not in self.project_ids():
+            return 404, {"message": "Project not found."}, {}
+
+        return (
+            200,
+            build_record(
+                models.Project, id=int(project_id), name=f"project-{project_id}"
+            ),
+            {},
+        )
+
+    def list_environments(self, params: dict[str, str], project_id: str) -> Reply:
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.EnvironmentRelation,
+                    id=environment_id,
+                    name=f"environment-{environment_id}",
+                )
+                for environment_id in self.environment_ids(int(project_id))
+            ],
+        )
+
+    def list_servers(self, params: dict[str, str], environment_id: str) -> Reply:
+        regions = self.config.regions
+
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.ServerRelation,
+                    id=server_id,
+                    name=f"server-{server_id}",
+                    hostname=f"server-{server_id}",
+                    region=regions[server_id % len(regions)],
+                )
+                for server_id in self.server_ids(int(environment_id))
+            ],
+        )
+
+    def create_server(self, params: dict[str, str], environment_id: str) -> Reply:
+        self.next_id += 1
+        return 200, build_record(models.Server, id=self.next_id), {}
+
+    def list_applications(
+        self,
+        params: dict[str, str],
+        environment_id: str,
+    ) -> Reply:
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.ApplicationRelation,
+                    id=application_id,
+                    name=f"application-{application_id % 1000 - 500}",
+                    environment_id=int(environment_id),
+                )
+                for application_id in self.application_ids(int(environment_id))
+            ],
+        )
+
+    def create_application(
+        self,
+        params: dict[str, str],
+        environment_id: str,
+    ) -> Reply:
+        self.next_id += 1
+        return 200, build_record(models.Application, id=self.next_id), {}
+
+    def list_credentials(
+        self,
+        params: dict[str, str],
+        environment_id: str,
+    ) -> Reply:
+        count = self.config.credentials_per_environment
+
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.CredentialRelation,
+                    id=int(environment_id) * 10 + index,
+                    name=f"credential-{index}",
+                )
+                for index in range(1, count + 1)
+            ],
+        )
+
+    def list_pipelines(
+        self,
+        params: dict[str, str],
+        resource_type: str,
+        resource_id: str,
+    ) -> Reply:
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.PipelineRelation,
+                    id=self.pipeline_id(int(resource_id)),
+                    name="Deploy",
+                    operation="deploy",
+                    resource_id=int(resource_id),
+                    resource_type=resource_type,
+                    max_parallel_actions=1,
+                )
+            ],
+        )
+
+    def get_pipeline(self, params: dict[str, str], pipeline_id: str) -> Reply:
+        return (
+            200,
+            build_record(
+                models.Pipeline,
+                id=int(pipeline_id),
+                name="Deploy",
+                operation="deploy",
+                resource_id=int(pipeline_id) // 10,
+                resource_type="application",
+                max_parallel_actions=1,
+            ),
+            {},
+        )
+
+    def add_action(self, params: dict[str, str], pipeline_id: str) -> Reply:
+        self.next_id += 1
+        action = build_record(models.Action, id=self.next_id, status="queued")
+
+        return 200, action, {}
+
+    def get_action(self, params: dict[str, str], action_id: str) -> Reply:
+        self.action_polls[int(action_id)] += 1
+
+        # Each poll finds one more of its `action_polls` steps done
+        polls = self.action_polls[int(action_id)]
+        finished = polls >= self.config.action_polls
+        status = "completed" if finished else "in-progress"
+
+        steps = [
+            build_record(
+                models.ActionStep,
+                id=int(action_id) * 100 + order,
+                action_id=int(action_id),
+                order=order,
+                name=f"Step {order}",
+                status=(
+                    "completed"
+                    if finished or order < polls
+                    else "in-progress"
+                    if order == polls
+                    else "pending"
+                ),
+            )
+            for order in range(1, self.config.action_polls + 1)
+        ]
+
+        target = build_record(
+            models.ActionTarget,
+            status=status,
+            total_steps=len(steps),
+            current_step=None if finished else steps[polls - 1],
+            steps=steps,
+        )
+
+        action = build_record(
+            models.Action, id=int(action_id), status=status, targets=[target]
+        )
+
+        return 200, action, {}
+
+    def server_action(self, params: dict[str, str], server_id: str) -> Reply:
+        self.next_id += 1
+        return 204, None, {"x-devopness-action-id": str(self.next_id)}
+
+    def get_provider_service(self, params: dict[str, str], code: str) -> Reply:
+        regions = [
+            build_record(models.CloudProviderServiceRegion, code=region, name=region)
+            for region in self.config.regions
+        ]
+
+        service = build_record(models.CloudProviderService, code=code, regions=regions)
+
+        return 200, service, {}
+
+    def list_instance_types(
+        self,
+        params: dict[str, str],
+        code: str,
+        region: str,
+    ) -> Reply:
+        return self.paginate(
+            params,
+            [
+                build_record(
+                    models.CloudInstanceRelation,
+                    name=f"t{index}.{region}",
+                    type=f"t{index}",
+                    family="t",
+                    vcpus=1 + index % 8,
+                    memory=1024 * (1 + index % 16),
+                    price_hourly=round(0.01 * (index + 1), 4),
+                    price_monthly=round(7.3 * (index + 1), 2),
+                    price_currency="USD",
+                )
+                for index in range(self.config.instance_types_per_region)
+            ],
+        )
+
+    # Adapters
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        status, body, headers = await self.reply(
+            request.method,
+            request.url.path,
+            dict(request.url.params),
+            {name.lower(): value for name, value in request.headers.items()},
+        )
+
+        if body is None:
+            return httpx.Response(status, headers=headers, request=request)
+
+        return httpx.Response(status, json=body, headers=headers, request=request)
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return httpx.MockTransport(self.handle)
+
+    def app(self) -> Starlette:
+        async def endpoint(request: Request) -> Response:
+            status, body, headers = await self.reply(
+                request.method,
+                request.url.path,
+                dict(request.query_params),
+                dict(request.headers),
+            )
+
+            content = None if body is None else json.dumps(body)
+            return Response(content, status, headers, media_type="application/json")
+
+        return Starlette(
+            routes=[
+                Route(
+                    "/{path:path}",
+                    endpoint,
+                    methods=["GET", "POST", "PUT", "DELETE"],
+                )
+            ]
+        )
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = FakeApiConfig()
+
+    for config_field in fields(FakeApiConfig):
+        if config_field.name == "regions":
+            continue
+
+        parser.add_argument(
+            f"--{config_field.name.replace('_', '-')}",
+            type=type(getattr(defaults, config_field.name)),
+            default=getattr(defaults, config_field.name),
+        )
+
+    parser.add_argument(
+        "--regions",
+        type=lambda value: value.split(","),
+        default=defaults.regions,
+        help="Comma separated region codes",
+    )
+
+
+def get_config(args: argparse.Namespace) -> FakeApiConfig:
+    return FakeApiConfig(
+        **{
+            config_field.name: getattr(args, config_field.name)
+            for config_field in fields(FakeApiConfig)
+        }
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m mcp_server.bench.fake_api")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    add_config_arguments(parser)
+
+    args = parser.parse_args(argv)
+    api = FakeDevopnessApi(get_config(args))
+
+    uvicorn.run(api.app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Benchmarks the server by performing a workload of operations through an MCP
+client, reporting throughput and latency percentiles.
+
+By default the server runs in-process against a `FakeDevopnessApi`:
+
+    python -m mcp_server.bench --workload lists --requests 1000 --concurrency 32
+
+With `--mcp-url`, a running server is benchmarked instead (start it with
+`DEVOPNESS_API_URL` pointing to `python -m mcp_server.bench.fake_api`, run
+with the same sizes given here, so the generated arguments exist).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastmcp import Client
+
+from .fake_api import FakeDevopnessApi, add_config_arguments, get_config
+
+GENERIC_TOOL = "devopness_perform_any_operation"
+
+# Builds the args of a call, given the random generator and the fake API
+ArgsFactory = Callable[[random.Random, FakeDevopnessApi], dict[str, Any]]
+
+
+def environment_id(rng: random.Random, api: FakeDevopnessApi) -> int:
+    return rng.choice(api.all_environment_ids())
+
+
+def application_id(rng: random.Random, api: FakeDevopnessApi) -> int:
+    return rng.choice(api.application_ids(environment_id(rng, api)))
+
+
+def server_name(rng: random.Random, api: FakeDevopnessApi) -> str:
+    return f"server-{rng.choice(api.server_ids(environment_id(rng, api)))}"
+
+
+def region(rng: random.Random, api: FakeDevopnessApi) -> str:
+    return rng.choice(api.config.regions)
+
+
+WORKLOADS: dict[str, list[tuple[str, ArgsFactory]]] = {
+    "lists": [
+        ("list_projects", lambda rng, api: {}),
+        (
+            "list_environments",
+            lambda rng, api: {"project_id": rng.choice(api.project_ids())},
+        ),
+        (
+            "list_servers",
+            lambda rng, api: {"environment_id": environment_id(rng, api)},
+        ),
+        (
+            "list_applications",
+            lambda rng, api: {"environment_id": environment_id(rng, api)},
+        ),
+        (
+            "list_pipelines",
+            lambda rng, api: {
+                "resource_type": "application",
+                "resource_id": application_id(rng, api),
+            },
+        ),
+        (
+            "list_credentials",
+            lambda rng, api: {"environment_id": environment_id(rng, api)},
+        ),
+    ],
+    "catalog": [
+        (
+            "list_regions_of_provider_service",
+            lambda rng, api: {"provider_service": "aws-ec2"},
+        ),
+        (
+            "list_instance_types_of_provider_service_region",
+            lambda rng, api: {
+                "provider_service": "aws-ec2",
+                "region": region(rng, api),
+            },
+        ),
+        (
+            "find_instance_types",
+            lambda rng, api: {
+                "provider_service": "aws-ec2",
+                "regions": [region(rng, api)],
+                "min_vcpus": rng.randint(1, 4),
+            },
+        ),
+    ],
+    "names": [
+        (
+            "list_servers",
+            lambda rng, api: {
+                "environment_name": f"environment-{environment_id(rng, api)}"
+            },
+        ),
+        (
+            "resolve",
+            lambda rng, api: {"kind": "server", "name": server_name(rng, api)},
+        ),
+    ],
+    "deploys": [
+        (
+            "deploy_application",
+            lambda rng, api: {
+                "deploy_pipeline_id": api.pipeline_id(application_id(rng, api)),
+                "deploy_source_type": "branch",
+                "deploy_source_value": "main",
+            },
+        ),
+        (
+            "list_servers",
+            lambda rng, api: {"environment_id": environment_id(rng, api)},
+        ),
+    ],
+}
+WORKLOADS["mixed"] = [call for calls in WORKLOADS.values() for call in calls]
+
+
+@dataclass
+class Sample:
+    operation: str
+    seconds: float
+    error: str | None = None
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank percentile of sorted `values`.
+    """
+    index = max(int(round(q * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    seconds = sorted(sample.seconds for sample in samples)
+
+    return {
+        "requests": len(samples),
+        "errors": sum(sample.error is not None for sample in samples),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            name: round(percentile(seconds, q) * 1000, 2)
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1))
+        },
+    }
+
+
+async def run_benchmark(
+    client: Client,
+    calls: list[tuple[str, dict[str, Any]]],
+    concurrency: int,
+) -> tuple[list[Sample], float]:
+    tools = {tool.name for tool in await client.list_tools()}
+    queue = iter(calls)
+    samples: list[Sample] = []
+
+    async def call(operation: str, args: dict[str, Any]) -> None:
+        if GENERIC_TOOL in tools:
+            name, arguments = GENERIC_TOOL, {"operation": operation, "args": args}
+        else:
+            name, arguments = f"devopness_{operation}", args
+
+        started = time.perf_counter()
+        error = None
+
+        try:
+            await client.call_tool(name, arguments)
+        except Exception as exception:
+            error = str(exception)
+
+        samples.append(Sample(operation, time.perf_counter() - started, error))
+
+    async def worker() -> None:
+        for operation, args in queue:
+            await call(operation, args)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+
+    return samples, time.perf_counter() - started
+
+
+def build_calls(
+    workload: str,
+    requests: int,
+    api: FakeDevopnessApi,
+    seed: int,
+) -> list[tuple[str, dict[str, Any]]]:
+    rng = random.Random(seed)
+    choices = WORKLOADS[workload]
+
+    calls = []
+    for _ in range(requests):
+        operation, build_args = rng.choice(choices)
+        calls.append((operation, build_args(rng, api)))
+
+    return calls
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    api = FakeDevopnessApi(get_config(args))
+    calls = build_calls(args.workload, args.warmup + args.requests, api, args.seed)
+
+    if args.mcp_url:
+        client = Client(args.mcp_url)
+    else:
+        os.environ.setdefault("DEVOPNESS_USER_EMAIL", "bench@example.com")
+        os.environ.setdefault("DEVOPNESS_USER_PASSWORD", "bench")
+        # The fake catalogs must not end up in the cache of the real ones
+        os.environ.pop("DEVOPNESS_MCP_CACHE_DIR", None)
+
+        from ..dispatch import client_pool
+        from ..main import server
+
+        client_pool.create_transport = api.transport
+        client = Client(server)
+
+    async with client:
+        await run_benchmark(client, calls[: args.warmup], args.concurrency)
+        warmup_calls = sum(api.calls.values())
+
+        samples, elapsed = await run_benchmark(
+            client, calls[args.warmup :], args.concurrency
+        )
+
+    by_operation: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_operation[sample.operation].append(sample)
+
+    errors = [sample.error for sample in samples if sample.error is not None]
+
+    return {
+        "workload": args.workload,
+        "concurrency": args.concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        **summarize(samples, elapsed),
+        "upstream_calls": (
+            None if args.mcp_url else sum(api.calls.values()) - warmup_calls
+        ),
+        "operations": {
+            operation: summarize(operation_samples, elapsed)
+            for operation, operation_samples in sorted(by_operation.items())
+        },
+        "first_errors": errors[:5],
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [
+        f"workload: {report['workload']}, concurrency: {report['concurrency']},"
+        f" elapsed: {report['elapsed_seconds']}s,"
+        f" upstream calls: {report['upstream_calls']}",
+        "",
+        f"{'operation':<48} {'requests':>8} {'errors':>6} {'rps':>8}"
+        f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}",
+    ]
+
+    rows = [*report["operations"].items(), ("total", report)]
+    for name, row in rows:
+        latency = row["latency_ms"]
+        lines.append(
+            f"{name:<48} {row['requests']:>8} {row['errors']:>6}"
+            f" {row['throughput_rps']:>8} {latency['p50']:>8} {latency['p95']:>8}"
+            f" {latency['p99']:>8} {latency['max']:>8}"
+        )
+
+    for error in report["first_errors"]:
+        lines.append(f"error: {error}")
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m mcp_server.bench")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="mixed")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mcp-url", help="Benchmark the server running there")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    add_config_arguments(parser)
+
+    args = parser.parse_args(argv)
+    report = asyncio.run(benchmark(args))
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
@@ -0,0 +1,213 @@
+"""
+Replays recorded operations as load, to find the concurrency at which the
+server saturates.
+
+Record the operations performed by real agents, and the Devopness API calls
+they made, by running the server with:
+
+    DEVOPNESS_MCP_RECORD_CALLS=calls.jsonl
+    DEVOPNESS_MCP_RECORD_UPSTREAM=upstream.jsonl.gz
+
+Then replay them with N agents performing the whole sequence concurrently,
+for each N given, against an in-process server served by the recorded API
+responses (or against a running server, with `--mcp-url`):
+
+    python -m mcp_server.bench.replay --calls calls.jsonl \
+        --upstream upstream.jsonl.gz --concurrency 1,4,16,64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Any
+
+from fastmcp import Client
+
+from ..services.recording import REPLAY_SPEED, ReplayTransport, read_recording
+from .harness import GENERIC_TOOL, Sample, format_report, summarize
+
+
+async def replay_calls(
+    client: Client,
+    calls: list[dict[str, Any]],
+    agents: int,
+    speed: float,
+) -> tuple[list[Sample], float]:
+    """
+    Perform `calls` once per agent, all agents at once, keeping the recorded
+    time between the calls of each agent (divided by `speed`; back to back
+    with 0).
+    """
+    tools = {tool.name for tool in await client.list_tools()}
+    samples: list[Sample] = []
+
+    async def agent() -> None:
+        started = time.perf_counter()
+
+        for call in calls:
+            if speed > 0:
+                delay = call["at"] / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if GENERIC_TOOL in tools:
+                name = GENERIC_TOOL
+                arguments = {"operation": call["operation"], "args": call["args"]}
+            else:
+                name, arguments = f"devopness_{call['operation']}", call["args"]
+
+            call_started = time.perf_counter()
+            error = None
+
+            try:
+                await client.call_tool(name, arguments)
+            except Exception as exception:
+                error = str(exception)
+
+            samples.append(
+                Sample(call["operation"], time.perf_counter() - call_started, error)
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(agent() for _ in range(agents)))
+
+    return samples, time.perf_counter() - started
+
+
+def load_calls(path: str) -> list[dict[str, Any]]:
+    calls = list(read_recording(path))
+
+    # Relative to the first call, for recordings spanning several runs
+    first = calls[0]["at"] if calls else 0
+    return [{**call, "at": max(call["at"] - first, 0)} for call in calls]
+
+
+async def replay(args: argparse.Namespace) -> list[dict[str, Any]]:
+    calls = load_calls(args.calls)
+    transport = None
+
+    if args.mcp_url:
+        client = Client(args.mcp_url)
+    else:
+        os.environ.setdefault("DEVOPNESS_USER_EMAIL", "replay@example.com")
+        os.environ.setdefault("DEVOPNESS_USER_PASSWORD", "replay")
+        os.environ.pop("DEVOPNESS_MCP_CACHE_DIR", None)
+
+        from ..dispatch import client_pool
+        from ..main import server
+        from ..services.static import clear_catalog_caches
+
+        transport = ReplayTransport(args.upstream, args.upstream_speed)
+        client_pool.create_transport = lambda: transport
+        client = Client(server)
+
+    reports = []
+
+    async with client:
+        for agents in args.concurrency:
+            if transport is not None:
+                # Each level starts without the clients (and caches) of the last
+                # one, nor the catalogs they cached, as a newly started server
+                await client_pool.aclose()
+                clear_catalog_caches()
+                transport.reset()
+
+            samples, elapsed = await replay_calls(client, calls, agents, args.speed)
+
+            by_operation: dict[str, list[Sample]] = {}
+            for sample in samples:
+                by_operation.setdefault(sample.operation, []).append(sample)
+
+            reports.append(
+                {
+                    "workload": args.calls,
+                    "concurrency": agents,
+                    "elapsed_seconds": round(elapsed, 3),
+                    **summarize(samples, elapsed),
+                    "upstream_calls": None,
+                    "unmatched_upstream_calls": (
+                        transport.unmatched if transport is not None else None
+                    ),
+                    "operations": {
+                        operation: summarize(operation_samples, elapsed)
+                        for operation, operation_samples in sorted(by_operation.items())
+                    },
+                    "first_errors": [
+                        sample.error for sample in samples if sample.error is not None
+                    ][:5],
+                }
+            )
+
+    return reports
+
+
+def format_saturation(reports: list[dict[str, Any]]) -> str:
+    best = max(reports, key=lambda report: report["throughput_rps"] or 0)
+
+    lines = [
+        f"{'agents':>8} {'requests':>8} {'errors':>6} {'rps':>8}"
+        f" {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    ]
+    for report in reports:
+        latency = report["latency_ms"]
+        lines.append(
+            f"{report['concurrency']:>8} {report['requests']:>8}"
+            f" {report['errors']:>6} {report['throughput_rps']:>8}"
+            f" {latency['p50']:>8} {latency['p95']:>8} {latency['p99']:>8}"
+        )
+
+    lines.append(
+        f"\nhighest throughput: {best['throughput_rps']} rps"
+        f" with {best['concurrency']} agents"
+    )
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m mcp_server.bench.replay")
+    parser.add_argument("--calls", required=True, help="Recorded operations")
+    parser.add_argument("--upstream", help="Recorded Devopness API calls")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(agents) for agents in value.split(",")],
+        default=[1],
+        help="Comma separated numbers of concurrent agents, replayed in turn",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0,
+        help="Speed up of the time between calls; 0 performs them back to back",
+    )
+    parser.add_argument(
+        "--upstream-speed",
+        type=float,
+        default=REPLAY_SPEED,
+        help="Speed up of the recorded API latency; 0 answers immediately",
+    )
+    parser.add_argument("--mcp-url", help="Load the server running there")
+    parser.add_argument("--verbose", action="store_true", help="Report operations")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+
+    args = parser.parse_args(argv)
+    if not args.mcp_url and not args.upstream:
+        parser.error("--upstream is required unless --mcp-url is given")
+
+    reports = asyncio.run(replay(args))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return
+
+    if args.verbose:
+        for report in reports:
+            print(format_report(report), end="\n\n")
+
+    print(format_saturation(reports))
+
+
+if __name__ == "__main__":
+    main()
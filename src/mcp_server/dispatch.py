@@ -0,0 +1,71 @@
+"""
+Performs the registered operations with the client of the calling account.
+
+Importing this module imports the Devopness SDK, so the server only does it
+once the first operation is performed.
+"""
+
+from typing import Any
+
+from .registry import Operation
+from .services.clients import ClientPool
+from .services.read_cache import get_read_cache
+from .services.resolver import resolve_names
+from .services.session import call_with_session
+from .services.singleflight import SingleFlight
+from .services.snapshots import get_args_key, get_snapshot_store
+from .services.tenants import get_tenant
+
+# One client per account, shared by all its requests handled by this process
+client_pool = ClientPool()
+
+# Identical concurrent calls of read-only operations share one upstream call
+single_flight = SingleFlight()
+
+
+async def perform_registered_operation(
+    registered: Operation,
+    args: dict[str, Any] | None,
+) -> Any:
+    operation = registered.name
+    tenant = get_tenant()
+    devopness = client_pool.get(tenant)
+
+    async def handle() -> Any:
+        # Names given instead of IDs (e.g. `server_name`) are resolved first
+        resolved_args = await resolve_names(devopness, registered.args_model, args)
+
+        read_cache = get_read_cache(devopness)
+
+        if registered.cache_tags is not None:
+            return await read_cache.get(
+                (operation, get_args_key(resolved_args)),
+                registered.cache_tags(devopness, resolved_args or {}),
+                lambda: registered.handler(devopness, resolved_args),
+            )
+
+        if registered.invalidates is None:
+            return await registered.handler(devopness, resolved_args)
+
+        # Computed beforehand, as the write may remove what they are based on
+        dirty = registered.invalidates(devopness, resolved_args or {})
+
+        try:
+            return await registered.handler(devopness, resolved_args)
+        finally:
+            read_cache.invalidate(dirty)
+
+    def call() -> Any:
+        return call_with_session(devopness, handle)
+
+    if registered.read_only and registered.coalesce:
+        result = await single_flight.do(
+            (tenant.key, operation, get_args_key(args)), call
+        )
+    else:
+        result = await call()
+
+    if registered.snapshot:
+        return get_snapshot_store(devopness).apply(operation, args, result)
+
+    return result
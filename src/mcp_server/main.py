@@ -1,60 +1,33 @@
-import logging
-from typing import Any
+import argparse
+import json
+import os
+from typing import Any, Literal, get_args
 
-from devopness import DevopnessClientAsync
+import fastmcp
 from fastmcp import FastMCP
-
-from .services.static import (
-    ListInstanceTypesOfProviderServiceRegion,
-    ListRegionsOfProviderService,
-    ListSupportedProviders,
-    list_instance_types_of_provider_service_region,
-    list_regions_of_provider_service,
-    list_supported_providers,
-)
-
-from .services.applications import (
-    DeployApplication,
-    ListApplications,
-    deploy_application,
-    list_applications,
-)
-from .services.environments import (
-    ListEnvironments,
-    list_environments,
-)
-from .services.pipelines import (
-    ListPipelines,
-    list_pipelines,
+from fastmcp.server.http import StarletteWithLifespan, create_streamable_http_app
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+from .registry import OPERATIONS, Operations, get_operation_help
+from .services.batch import BATCH_MAX_CONCURRENCY, BatchItem, run_batch
+from .services.log import (
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_SAMPLE_RATE,
+    LogFormat,
+    configure_logging,
+    log_operation,
 )
-from .services.projects import (
-    ListProjects,
-    list_projects,
-)
-from .services.servers import (
-    CreateServer,
-    DeleteServer,
-    ListServers,
-    StopServer,
-    delete_server,
-    devopness_create_server,
-    list_servers,
-    stop_server,
-)
-from .services.static import list_supported_os_versions, ListSupportedOsVersions
-from .services.credentials import list_credentials, ListCredentials
-from .services.utils import Operations, get_helper
+from .services.metrics import metrics, to_prometheus_sample
+from .services.recording import call_recorder
+from .startup import profile_startup
+from .tools import TOOLS_MODE, register_operation_tools
 
 server: FastMCP = FastMCP()
 
-devopness = DevopnessClientAsync(
-    {
-        "base_url": "https://api.devopness.com",
-        "debug": True,
-    }
-)
-
-logger = logging.getLogger()
+# Path of the metrics in the Prometheus format, over HTTP; empty to disable it
+METRICS_PATH = os.environ.get("DEVOPNESS_MCP_METRICS_PATH", "/metrics")
 
 
 def operation_helper(args: dict[str, Any] | None) -> str:
@@ -65,56 +38,14 @@ def operation_helper(args: dict[str, Any] | None) -> str:
         msg = "Please specify an operation in args {'operation': <operation_name>}.\n"
 
         msg += "Available operations:\n"
-        msg += Operations.__str__()
+        msg += "\n".join(f"- {name}" for name in OPERATIONS)
 
         return msg
 
-    operation: Operations = args["operation"]
-    match operation:
-        case "deploy_application":
-            return get_helper(operation, DeployApplication)
-
-        case "list_applications":
-            return get_helper(operation, ListApplications)
-
-        case "list_projects":
-            return get_helper(operation, ListProjects)
-
-        case "list_environments":
-            return get_helper(operation, ListEnvironments)
-
-        case "list_servers":
-            return get_helper(operation, ListServers)
-
-        case "list_pipelines":
-            return get_helper(operation, ListPipelines)
-
-        case "create_server":
-            return get_helper(operation, CreateServer)
-
-        case "list_supported_providers":
-            return get_helper(operation, ListSupportedProviders)
-
-        case "list_regions_of_provider_service":
-            return get_helper(operation, ListRegionsOfProviderService)
-
-        case "list_instance_types_of_provider_service_region":
-            return get_helper(operation, ListInstanceTypesOfProviderServiceRegion)
-
-        case "list_credentials":
-            return get_helper(operation, ListCredentials)
+    if args["operation"] not in OPERATIONS:
+        return f"Unknown operation: {args['operation']}"
 
-        case "list_supported_os_versions":
-            return get_helper(operation, ListSupportedOsVersions)
-
-        case "stop_server":
-            return get_helper(operation, StopServer)
-
-        case "delete_server":
-            return get_helper(operation, DeleteServer)
-
-        case _:
-            return f"Unknown operation: {args['operation']}"
+    return get_operation_help(args["operation"])
 
 
 @server.tool()
@@ -130,59 +61,225 @@ async def devopness_perform_any_operation(
        with the operation you want to perform as an argument, to get the list
        of arguments for that operation.
        - Example: `devopness_perform_any_operation('deploy_application')`
+
+    List operations return a `snapshot` token. To get only the records added,
+    changed or removed since then, repeat the call with the same args plus
+    `"since": <snapshot>` (or `"diff": true` to compare with the latest one).
     """
-    match operation:
-        case "__help__":
-            return operation_helper(args)
+    return await perform_operation(operation, args)
 
-        case "list_projects":
-            return await list_projects(devopness, args)
 
-        case "list_environments":
-            return await list_environments(devopness, args)
+@server.tool()
+async def devopness_perform_batch_operations(
+    operations: list[BatchItem],
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Perform several operations using Devopness API concurrently, in a single call.
 
-        case "list_servers":
-            return await list_servers(devopness, args)
+    Each item is `{"operation": <operation_name>, "args": {...}}`, accepting
+    the same operations and arguments as `devopness_perform_any_operation`.
+    Results are returned in the same order as the items, each one with either
+    a `result` or an `error`.
 
-        case "list_applications":
-            return await list_applications(devopness, args)
+    Rules:
+    1. Only batch operations that do not depend on each other's results.
+    2. The rules of each individual operation still apply.
+    """
+    return await run_batch(operations, perform_operation, max_concurrency)
 
-        case "list_pipelines":
-            return await list_pipelines(devopness, args)
 
-        case "deploy_application":
-            return await deploy_application(devopness, args)
+async def perform_operation(operation: Operations, args: dict[str, Any] | None) -> Any:
+    if operation == "__help__":
+        return operation_helper(args)
 
-        case "create_server":
-            return await devopness_create_server(devopness, args)
+    if operation not in OPERATIONS:
+        return f"Unknown operation: {operation}"
 
-        case "list_supported_providers":
-            return await list_supported_providers(devopness, args)
+    if call_recorder is not None:
+        call_recorder.record(operation, args)
 
-        case "list_regions_of_provider_service":
-            return await list_regions_of_provider_service(devopness, args)
+    # Imports the services and the SDK, on the first operation performed
+    from .dispatch import perform_registered_operation
 
-        case "list_instance_types_of_provider_service_region":
-            return await list_instance_types_of_provider_service_region(devopness, args)
+    async with log_operation(operation), metrics.track(operation):
+        return await perform_registered_operation(OPERATIONS[operation], args)
 
-        case "list_credentials":
-            return await list_credentials(devopness, args)
 
-        case "list_supported_os_versions":
-            return await list_supported_os_versions(devopness, args)
+@server.resource("devopness://metrics", mime_type="application/json")
+def metrics_resource() -> dict[str, Any]:
+    """
+    Calls, errors, latency percentiles and Devopness API calls of each
+    operation performed by this server process, the calls coalesced with
+    identical concurrent ones, and the hits and misses of the provider
+    catalog caches.
+    """
+    return get_metrics()
 
-        case "stop_server":
-            return await stop_server(devopness, args)
 
-        case "delete_server":
-            return await delete_server(devopness, args)
+@server.tool()
+def devopness_get_metrics() -> dict[str, Any]:
+    """
+    Get the calls, errors, latency percentiles (p50/p95/p99) and Devopness
+    API calls (and bytes received) of each operation performed so far, the
+    calls coalesced with identical concurrent ones, and the hits and misses
+    of the provider catalog caches.
+    """
+    return get_metrics()
 
-        case _:
-            return f"Unknown operation: {operation}"
 
+def get_metrics() -> dict[str, Any]:
+    from .dispatch import client_pool, single_flight
+    from .services.static import get_catalog_cache_stats
+
+    return {
+        **metrics.to_dict(),
+        "clients": client_pool.stats(),
+        "single_flight": single_flight.stats(),
+        "catalog_caches": get_catalog_cache_stats(),
+    }
 
-def main() -> None:
-    server.run()
+
+def get_prometheus_metrics() -> str:
+    from .dispatch import single_flight
+
+    single_flight_stats = single_flight.stats()
+
+    return (
+        metrics.to_prometheus()
+        + to_prometheus_sample(
+            "devopness_mcp_single_flight_calls_total",
+            "counter",
+            single_flight_stats["calls"],
+        )
+        + to_prometheus_sample(
+            "devopness_mcp_single_flight_coalesced_total",
+            "counter",
+            single_flight_stats["coalesced"],
+        )
+    )
+
+
+if METRICS_PATH:
+
+    @server.custom_route(METRICS_PATH, methods=["GET"])
+    async def prometheus_metrics(request: Request) -> Response:
+        # Served with the HTTP transports only; each worker has its own metrics
+        return PlainTextResponse(
+            get_prometheus_metrics(), media_type="text/plain; version=0.0.4"
+        )
+
+
+if TOOLS_MODE in ("operations", "all"):
+    register_operation_tools(server, perform_operation)
+
+if TOOLS_MODE == "operations":
+    server.remove_tool(devopness_perform_any_operation.name)
+
+
+Transport = Literal["stdio", "streamable-http", "sse"]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="mcp-server")
+
+    parser.add_argument(
+        "--transport",
+        choices=get_args(Transport),
+        default=os.environ.get("DEVOPNESS_MCP_TRANSPORT", "stdio"),
+    )
+    parser.add_argument(
+        "--host",
+        default=os.environ.get("DEVOPNESS_MCP_HOST", "127.0.0.1"),
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get("DEVOPNESS_MCP_PORT", "8000")),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("DEVOPNESS_MCP_WORKERS", "1")),
+        help="Worker processes serving the HTTP transport",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str.upper,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default=LOG_LEVEL,
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=get_args(LogFormat),
+        default=LOG_FORMAT,
+    )
+    parser.add_argument(
+        "--log-sample-rate",
+        type=float,
+        default=LOG_SAMPLE_RATE,
+        help="Fraction of the requests whose debug and info records are logged",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the time taken by each step of a cold start, and exit",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.workers > 1 and args.transport != "streamable-http":
+        parser.error("--workers requires the streamable-http transport")
+
+    return args
+
+
+def create_http_app() -> StarletteWithLifespan:
+    """
+    The app run by each worker process when serving HTTP with many workers.
+
+    Requests of a client may reach any worker, so no MCP session state is
+    kept between them.
+    """
+    configure_logging()
+
+    # FastMCP.http_app ignores its stateless_http argument (fastmcp 2.8)
+    return create_streamable_http_app(
+        server=server,
+        streamable_http_path=fastmcp.settings.streamable_http_path,
+        auth=server.auth,
+        stateless_http=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    if args.profile_startup:
+        print(json.dumps(profile_startup(), indent=2))
+        return
+
+    configure_logging(args.log_level, args.log_format, args.log_sample_rate)
+
+    if args.transport == "stdio":
+        server.run()
+    elif args.workers <= 1:
+        server.run(transport=args.transport, host=args.host, port=args.port)
+    else:
+        import uvicorn
+
+        # Worker processes configure their logging from the environment
+        os.environ["DEVOPNESS_MCP_LOG_LEVEL"] = args.log_level
+        os.environ["DEVOPNESS_MCP_LOG_FORMAT"] = args.log_format
+        os.environ["DEVOPNESS_MCP_LOG_SAMPLE_RATE"] = str(args.log_sample_rate)
+
+        uvicorn.run(
+            "mcp_server.main:create_http_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+        )
 
 
 if __name__ == "__main__":
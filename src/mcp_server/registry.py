@@ -0,0 +1,248 @@
+from dataclasses import dataclass
+from functools import cache, cached_property
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal
+
+if TYPE_CHECKING:
+    from .services.utils import DevopnessClientAsync, ListArgs
+
+Handler = Callable[["DevopnessClientAsync", "ListArgs"], Awaitable[Any]]
+Tags = Callable[["DevopnessClientAsync", dict[str, Any]], list[str]]
+
+
+def load(reference: str) -> Any:
+    """
+    The attribute named by a "module:attribute" reference to a service
+    module, importing the module (and the SDK with it) on first use.
+    """
+    module, attribute = reference.split(":")
+    return getattr(import_module(f"{__package__}.services.{module}"), attribute)
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    An operation, referring to its arguments model, handler and cache tags
+    as "module:attribute" references, so the services (and the SDK) are
+    only imported once an operation is performed or described.
+    """
+
+    name: str
+    args_model_reference: str
+    handler_reference: str
+    # Read-only operations can be coalesced and cached
+    read_only: bool = False
+    # List results can be diffed against a previous snapshot
+    snapshot: bool = False
+    # Results are kept in the read cache, tagged with the resources they cover
+    cache_tags_reference: str | None = None
+    # Read cache tags made stale by this (write) operation
+    invalidates_reference: str | None = None
+    # Read-only calls are coalesced unless each caller must get its own
+    # progress notifications
+    coalesce: bool = True
+
+    @cached_property
+    def args_model(self) -> type:
+        return load(self.args_model_reference)
+
+    @cached_property
+    def handler(self) -> Handler:
+        return load(self.handler_reference)
+
+    @cached_property
+    def cache_tags(self) -> Tags | None:
+        if self.cache_tags_reference is None:
+            return None
+
+        return load(self.cache_tags_reference)
+
+    @cached_property
+    def invalidates(self) -> Tags | None:
+        if self.invalidates_reference is None:
+            return None
+
+        return load(self.invalidates_reference)
+
+
+OPERATIONS: dict[str, Operation] = {}
+
+
+def register(
+    name: str,
+    args_model: str,
+    handler: str,
+    read_only: bool = False,
+    snapshot: bool = False,
+    cache_tags: str | None = None,
+    invalidates: str | None = None,
+    coalesce: bool = True,
+) -> None:
+    if name in OPERATIONS:
+        raise ValueError(f"Operation already registered: {name}")
+
+    OPERATIONS[name] = Operation(
+        name,
+        args_model,
+        handler,
+        read_only,
+        snapshot,
+        cache_tags,
+        invalidates,
+        coalesce,
+    )
+
+
+register(
+    "list_projects",
+    "projects:ListProjects",
+    "projects:list_projects",
+    read_only=True,
+    snapshot=True,
+)
+register(
+    "list_environments",
+    "environments:ListEnvironments",
+    "environments:list_environments",
+    read_only=True,
+    snapshot=True,
+)
+register(
+    "list_servers",
+    "servers:ListServers",
+    "servers:list_servers",
+    read_only=True,
+    snapshot=True,
+    cache_tags="read_cache:list_servers_tags",
+)
+register(
+    "list_applications",
+    "applications:ListApplications",
+    "applications:list_applications",
+    read_only=True,
+    snapshot=True,
+    cache_tags="read_cache:list_applications_tags",
+)
+register(
+    "list_pipelines",
+    "pipelines:ListPipelines",
+    "pipelines:list_pipelines",
+    read_only=True,
+    snapshot=True,
+    cache_tags="read_cache:list_pipelines_tags",
+)
+register(
+    "list_supported_providers",
+    "static:ListSupportedProviders",
+    "static:list_supported_providers",
+    read_only=True,
+)
+register(
+    "list_regions_of_provider_service",
+    "static:ListRegionsOfProviderService",
+    "static:list_regions_of_provider_service",
+    read_only=True,
+)
+register(
+    "list_instance_types_of_provider_service_region",
+    "static:ListInstanceTypesOfProviderServiceRegion",
+    "static:list_instance_types_of_provider_service_region",
+    read_only=True,
+)
+register(
+    "deploy_application",
+    "applications:DeployApplication",
+    "applications:deploy_application",
+    invalidates="read_cache:deploy_application_tags",
+)
+register(
+    "create_application",
+    "applications:CreateApplication",
+    "applications:create_application",
+    invalidates="read_cache:create_application_tags",
+)
+register(
+    "create_server",
+    "servers:CreateServer",
+    "servers:devopness_create_server",
+    invalidates="read_cache:create_server_tags",
+)
+register(
+    "list_credentials",
+    "credentials:ListCredentials",
+    "credentials:list_credentials",
+    read_only=True,
+    snapshot=True,
+    cache_tags="read_cache:list_credentials_tags",
+)
+register(
+    "list_supported_os_versions",
+    "static:ListSupportedOsVersions",
+    "static:list_supported_os_versions",
+    read_only=True,
+)
+register(
+    "stop_server",
+    "servers:StopServer",
+    "servers:stop_server",
+    invalidates="read_cache:stop_server_tags",
+)
+register(
+    "delete_server",
+    "servers:DeleteServer",
+    "servers:delete_server",
+    invalidates="read_cache:delete_server_tags",
+)
+register("inventory", "inventory:Inventory", "inventory:inventory", read_only=True)
+register(
+    "find_instance_types",
+    "instance_search:FindInstanceTypes",
+    "instance_search:find_instance_types",
+    read_only=True,
+)
+register("resolve", "resolver:Resolve", "resolver:resolve", read_only=True)
+register(
+    "wait_for_action",
+    "actions:WaitForAction",
+    "actions:wait_for_action",
+    read_only=True,
+    coalesce=False,
+)
+register(
+    "deploy_applications",
+    "deployments:DeployApplications",
+    "deployments:deploy_applications",
+    invalidates="read_cache:deploy_applications_tags",
+)
+register(
+    "compare_instance_types_across_regions",
+    "instance_search:CompareInstanceTypesAcrossRegions",
+    "instance_search:compare_instance_types_across_regions",
+    read_only=True,
+)
+
+
+def load_operations() -> None:
+    """
+    Import what every operation refers to, as performing them all would.
+    """
+    for operation in OPERATIONS.values():
+        for attribute in ("args_model", "handler", "cache_tags", "invalidates"):
+            getattr(operation, attribute)
+
+
+Operations = Literal[("__help__", *OPERATIONS)]  # type: ignore[valid-type]
+
+
+@cache
+def get_operation_help(name: str) -> str:
+    from .services.resolver import get_name_arguments_help
+    from .services.utils import get_helper
+
+    args_model = OPERATIONS[name].args_model
+
+    names_help = get_name_arguments_help(args_model)
+    if names_help:
+        return get_helper(name, args_model) + "\n\n" + names_help
+
+    return get_helper(name, args_model)
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from devopness.models import Action, ActionStatus, ActionTarget
+from fastmcp import Context
+from fastmcp.server.dependencies import get_context
+
+from .utils import (
+    DevopnessClientAsync,
+    ListArgs,
+    ensure_authenticated,
+    get_args_from_helper,
+)
+
+ACTION_WAIT_TIMEOUT_SECONDS = float(
+    os.environ.get("DEVOPNESS_MCP_ACTION_WAIT_TIMEOUT", "600")
+)
+ACTION_POLL_MIN_SECONDS = float(os.environ.get("DEVOPNESS_MCP_ACTION_POLL_MIN", "1"))
+ACTION_POLL_MAX_SECONDS = float(os.environ.get("DEVOPNESS_MCP_ACTION_POLL_MAX", "15"))
+ACTION_POLL_BACKOFF = 1.5
+
+TERMINAL_STATUSES = {
+    ActionStatus.COMPLETED,
+    ActionStatus.FAILED,
+    ActionStatus.SKIPPED,
+}
+
+
+def get_progress_context() -> Context | None:
+    """
+    The context of the MCP request being handled, used to send progress
+    notifications, if any.
+    """
+    try:
+        return get_context()
+    except RuntimeError:
+        return None
+
+
+def get_steps_done(target: ActionTarget) -> int:
+    """
+    The steps of an action target that are done: the finished ones if its
+    steps are listed, else the ones before its current step.
+    """
+    if target.status in TERMINAL_STATUSES:
+        return target.total_steps or 0
+
+    if target.steps:
+        return sum(
+            1 for step in target.steps if step and step.status in TERMINAL_STATUSES
+        )
+
+    if target.current_step:
+        return target.current_step.order - 1
+
+    return 0
+
+
+def get_steps(action: Action) -> tuple[int, int]:
+    """
+    The steps done and the total steps of all the targets of an action.
+    """
+    done = 0
+    total = 0
+
+    for target in action.targets or []:
+        done += get_steps_done(target)
+        total += target.total_steps or 0
+
+    return done, total
+
+
+def summarize_action(action: Action) -> dict[str, Any]:
+    done, total = get_steps(action)
+
+    return {
+        "id": action.id,
+        "type": action.type_human_readable,
+        "status": action.status,
+        "status_reason": action.status_reason_human_readable,
+        "steps": {"done": done, "total": total} if total else None,
+        "targets": [
+            {
+                "resource_type": target.resource_type,
+                "resource_id": target.resource_id,
+                "status": target.status,
+                "current_step": (
+                    target.current_step.name if target.current_step else None
+                ),
+                "total_steps": target.total_steps,
+            }
+            for target in action.targets or []
+        ],
+        "started_at": action.started_at,
+        "completed_at": action.completed_at,
+        "url": action.url_web_permalink,
+    }
+
+
+async def watch_action(
+    devopness: DevopnessClientAsync,
+    action_id: int,
+    timeout: float = ACTION_WAIT_TIMEOUT_SECONDS,
+    context: Context | None = None,
+) -> dict[str, Any]:
+    """
+    Poll an action until it reaches a terminal status or `timeout` seconds
+    pass, sending a progress notification whenever it changes.
+
+    Polling starts every ACTION_POLL_MIN_SECONDS and slows down (up to
+    ACTION_POLL_MAX_SECONDS) while nothing changes, speeding up again as soon
+    as something does.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    interval = ACTION_POLL_MIN_SECONDS
+
+    polls = 0
+    last_state = None
+
+    while True:
+        await ensure_authenticated(devopness)
+
+        action = (await devopness.actions.get_action(action_id)).data
+        polls += 1
+
+        done, total = get_steps(action)
+        state = (action.status, done, total)
+
+        if state != last_state:
+            interval = ACTION_POLL_MIN_SECONDS
+            last_state = state
+
+            if context is not None:
+                await context.report_progress(
+                    done,
+                    total or None,
+                    f"{action.type_human_readable}: {action.status_human_readable}",
+                )
+        else:
+            interval = min(interval * ACTION_POLL_BACKOFF, ACTION_POLL_MAX_SECONDS)
+
+        finished = action.status in TERMINAL_STATUSES
+        remaining = deadline - time.monotonic()
+
+        if finished or remaining <= 0:
+            return {
+                **summarize_action(action),
+                "finished": finished,
+                "timed_out": not finished,
+                "polls": polls,
+                "elapsed_seconds": round(time.monotonic() - started, 1),
+            }
+
+        await asyncio.sleep(min(interval, remaining))
+
+
+@dataclass
+class WaitForAction:
+    """
+    Waits until an action (e.g. a deployment, or a server being created,
+    stopped or deleted) finishes and returns its final status, reporting its
+    progress meanwhile. Gives up after `timeout_seconds` (by default, and at
+    most, the limit set by the server), returning the latest status with
+    `timed_out` set.
+
+    Use it instead of polling list operations to follow an action.
+    """
+
+    action_id: int
+    timeout_seconds: Optional[float] = None
+
+
+def get_wait_timeout(timeout_seconds: float | None) -> float:
+    """
+    The seconds to wait for actions, never more than
+    ACTION_WAIT_TIMEOUT_SECONDS, so a call can not hold its request open for
+    longer, whatever the caller asks for.
+    """
+    if timeout_seconds is None:
+        return ACTION_WAIT_TIMEOUT_SECONDS
+
+    return min(max(timeout_seconds, 0), ACTION_WAIT_TIMEOUT_SECONDS)
+
+
+async def wait_for_action(devopness: DevopnessClientAsync, args: ListArgs):
+    parsed = get_args_from_helper(args, WaitForAction)
+
+    return await watch_action(
+        devopness,
+        parsed.action_id,
+        get_wait_timeout(parsed.timeout_seconds),
+        get_progress_context(),
+    )
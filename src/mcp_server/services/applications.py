@@ -4,9 +4,13 @@ from typing import Optional
 from devopness.models import (
     ActionPipelineCreatePlain,
     ApplicationEnvironmentCreatePlain,
+    ApplicationRelation,
     SourceType,
 )
 
+from .names import get_name_index
+from .pagination import PaginationArgs, is_complete, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -15,8 +19,30 @@ from .utils import (
 )
 
 
+APPLICATION_FIELDS: FieldGetters[ApplicationRelation] = {
+    "id": lambda application: application.id,
+    "name": lambda application: application.name,
+    "repository_url": lambda application: application.repository,
+    "stack": lambda application: {
+        "language": application.programming_language_human_readable,
+        "version": application.engine_version,
+        "framework": application.framework_human_readable,
+    },
+    # "last_deployments": lambda application: application.last_deployments,
+    "credential": lambda application: (
+        {
+            "id": application.credential.id,
+            "name": application.credential.name,
+            "provider": application.credential.provider.code_human_readable,
+        }
+        if application.credential
+        else None
+    ),
+}
+
+
 @dataclass
-class ListApplications:
+class ListApplications(PaginationArgs, ProjectionArgs):
     environment_id: int
 
 
@@ -24,38 +50,25 @@ async def list_applications(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
     parsed = get_args_from_helper(args, ListApplications)
+    fields = select_fields(APPLICATION_FIELDS, parsed)
 
-    response = await devopness.applications.list_environment_applications(
-        parsed.environment_id
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.applications.list_environment_applications(
+            parsed.environment_id, page, per_page
+        ),
+        parsed,
     )
 
-    applications = [
-        {
-            "id": application.id,
-            "name": application.name,
-            "repository_url": application.repository,
-            "stack": {
-                "language": application.programming_language_human_readable,
-                "version": application.engine_version,
-                "framework": application.framework_human_readable,
-            },
-            # "last_deployments": application.last_deployments,
-            "credential": (
-                {
-                    "id": application.credential.id,
-                    "name": application.credential.name,
-                    "provider": application.credential.provider.code_human_readable,
-                }
-                if application.credential
-                else None
-            ),
-        }
-        for application in response.data
-    ]
+    get_name_index(devopness).record(
+        "application",
+        ("environment", parsed.environment_id),
+        ((application.id, application.name) for application in data),
+        is_complete(pagination),
+    )
 
     return {
-        "data": applications,
-        "count": len(applications),
+        **project(data, fields, parsed),
+        "pagination": pagination,
     }
 
 
@@ -121,4 +134,8 @@ async def create_application(devopness: DevopnessClientAsync, args: ListArgs):
         parsed.environment_id, data
     )
 
+    get_name_index(devopness).invalidate(
+        "application", ("environment", parsed.environment_id)
+    )
+
     return response.data
@@ -0,0 +1,42 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, NotRequired, TypedDict
+
+from ..registry import Operations
+
+BATCH_MAX_CONCURRENCY = int(os.environ.get("DEVOPNESS_MCP_BATCH_CONCURRENCY", "8"))
+
+
+class BatchItem(TypedDict):
+    operation: Operations
+    args: NotRequired[dict[str, Any] | None]
+
+
+async def run_batch(
+    items: list[BatchItem],
+    perform: Callable[[Operations, dict[str, Any] | None], Awaitable[Any]],
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """
+    Perform every item concurrently, at most `max_concurrency` at a time
+    (never more than BATCH_MAX_CONCURRENCY, whatever the caller asks for).
+
+    Results keep the order of `items`; a failing item reports its error
+    without affecting the others.
+    """
+    semaphore = asyncio.Semaphore(
+        min(max(max_concurrency, 1), BATCH_MAX_CONCURRENCY)
+    )
+
+    async def run_item(item: BatchItem) -> dict[str, Any]:
+        operation = item["operation"]
+
+        async with semaphore:
+            try:
+                result = await perform(operation, item.get("args"))
+            except Exception as error:
+                return {"operation": operation, "error": str(error)}
+
+        return {"operation": operation, "result": result}
+
+    return await asyncio.gather(*(run_item(item) for item in items))
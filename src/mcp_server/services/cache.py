@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from .disk_cache import DiskCache
+from .singleflight import SingleFlight
+
+ValueType = TypeVar("ValueType")
+
+logger = logging.getLogger(__name__)
+
+STATIC_CACHE_TTL_SECONDS = float(
+    os.environ.get("DEVOPNESS_MCP_STATIC_CACHE_TTL", "3600")
+)
+STATIC_CACHE_MAX_ENTRIES = int(
+    os.environ.get("DEVOPNESS_MCP_STATIC_CACHE_MAX_ENTRIES", "256")
+)
+
+
+class TTLCache(Generic[ValueType]):
+    """
+    In-memory cache with a per-entry time to live and LRU eviction once
+    `max_entries` is reached.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, ValueType]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> ValueType | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: ValueType, ttl: float | None = None) -> None:
+        if ttl is None:
+            ttl = self.ttl
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CatalogCache(Generic[ValueType]):
+    """
+    Read-through cache for catalogs: memory first, then the optional on-disk
+    cache shared between processes, then the upstream fetch.
+
+    Expired on-disk entries are still served, while a background task fetches
+    a fresh copy, so a restarted process never waits on a stale catalog.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        memory: TTLCache[ValueType],
+        disk: DiskCache | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.memory = memory
+        self.disk = disk
+
+        self.disk_hits = 0
+        self.revalidations = 0
+
+        self._flight = SingleFlight()
+        self._revalidating: set[tuple[str, ...]] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def get(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[ValueType]],
+    ) -> ValueType:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        # Concurrent misses for the same key share a single load.
+        return await self._flight.do(key, lambda: self._load(key, fetch))
+
+    async def _load(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[ValueType]],
+    ) -> ValueType:
+        if self.disk is not None:
+            entry = await self.disk.get(self.namespace, "/".join(key))
+
+            if entry is not None:
+                value, fetched_at = entry
+                self.disk_hits += 1
+
+                age = time.time() - fetched_at
+                if age < self.memory.ttl:
+                    self.memory.set(key, value, self.memory.ttl - age)
+                else:
+                    self._revalidate(key, fetch)
+
+                return value
+
+        value = await fetch()
+        await self._store(key, value)
+
+        return value
+
+    async def _store(self, key: tuple[str, ...], value: ValueType) -> None:
+        self.memory.set(key, value)
+
+        if self.disk is not None:
+            await self.disk.set(self.namespace, "/".join(key), value)
+
+    def _revalidate(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], Awaitable[ValueType]],
+    ) -> None:
+        if key in self._revalidating:
+            return
+
+        async def revalidate() -> None:
+            try:
+                await self._store(key, await fetch())
+                self.revalidations += 1
+            except Exception:
+                logger.warning("Failed to revalidate %s %s", self.namespace, key)
+            finally:
+                self._revalidating.discard(key)
+
+        self._revalidating.add(key)
+
+        task = asyncio.create_task(revalidate())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.memory.stats(),
+            "disk_enabled": self.disk is not None,
+            "disk_hits": self.disk_hits,
+            "revalidations": self.revalidations,
+            "coalesced": self._flight.coalesced,
+        }
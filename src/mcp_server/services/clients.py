@@ -0,0 +1,197 @@
+import os
+import ssl
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cache
+from typing import Callable, Iterator
+
+import httpx
+import httpx._transports.default
+from devopness import DevopnessClientAsync
+
+from .log import log_response
+from .metrics import metrics
+from .recording import (
+    RECORD_UPSTREAM,
+    REPLAY_UPSTREAM,
+    RecordingTransport,
+    ReplayTransport,
+)
+from .session import get_services, start_session
+from .tenants import Tenant
+
+DEVOPNESS_API_URL = os.environ.get("DEVOPNESS_API_URL", "https://api.devopness.com")
+
+HTTP_MAX_CONNECTIONS = int(os.environ.get("DEVOPNESS_MCP_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("DEVOPNESS_MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.environ.get("DEVOPNESS_MCP_HTTP_KEEPALIVE_EXPIRY", "60")
+)
+
+TENANT_MAX_CLIENTS = int(os.environ.get("DEVOPNESS_MCP_TENANT_MAX_CLIENTS", "256"))
+TENANT_IDLE_TTL_SECONDS = float(
+    os.environ.get("DEVOPNESS_MCP_TENANT_IDLE_TTL", "1800")
+)
+
+
+def create_http_transport() -> httpx.AsyncBaseTransport:
+    if REPLAY_UPSTREAM:
+        return ReplayTransport(REPLAY_UPSTREAM)
+
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+    )
+
+    if RECORD_UPSTREAM:
+        return RecordingTransport(transport, RECORD_UPSTREAM)
+
+    return transport
+
+
+@cache
+def get_default_ssl_context() -> ssl.SSLContext:
+    return httpx.create_ssl_context()
+
+
+@contextmanager
+def shared_ssl_context() -> Iterator[None]:
+    """
+    Let the httpx clients created meanwhile share one default SSL context.
+
+    Each SDK service creates its own httpx client, whose transport loads the
+    CA certificates anew (~45ms each, over a second per Devopness client),
+    only to be replaced by the shared transport (see `create_client`).
+    """
+    create_ssl_context = httpx._transports.default.create_ssl_context
+
+    def create_shared_ssl_context(
+        verify: ssl.SSLContext | str | bool = True, **kwargs: object
+    ) -> ssl.SSLContext:
+        if verify is True and not kwargs.get("cert"):
+            return get_default_ssl_context()
+
+        return create_ssl_context(verify, **kwargs)  # type: ignore[arg-type]
+
+    httpx._transports.default.create_ssl_context = create_shared_ssl_context
+    try:
+        yield
+    finally:
+        httpx._transports.default.create_ssl_context = create_ssl_context
+
+
+def create_client(transport: httpx.AsyncBaseTransport) -> DevopnessClientAsync:
+    with shared_ssl_context():
+        devopness = DevopnessClientAsync(
+            {
+                "base_url": DEVOPNESS_API_URL,
+                # Calls are logged by log_response instead, to stderr and only
+                # when debug records are enabled
+                "debug": False,
+                # Tokens are managed by the shared AuthSession (see
+                # services/session.py)
+                "auto_refresh_token": False,
+            }
+        )
+
+    # Every SDK service has its own httpx client; route them all through one
+    # transport, so they share a single pool of keep-alive connections, and
+    # count and log the calls they make.
+    for service in get_services(devopness):
+        service._client._transport = transport
+        # Ahead of the hook of the SDK, which raises on error responses
+        service._client.event_hooks["response"][:0] = [
+            metrics.record_response,
+            log_response,
+        ]
+
+    return devopness
+
+
+class ClientPool:
+    """
+    Devopness clients of the process, one per account (tenant), created on
+    first use and sharing one HTTP connection pool, so the login and the
+    connections set up for one request (or MCP session) are reused by all
+    the following ones.
+
+    Everything kept for an account (its session and caches) belongs to its
+    client. Clients unused for `idle_ttl` seconds, and the least recently
+    used ones beyond `max_clients`, are dropped along with all of it; the
+    connections, not bound to any account, stay in the shared pool until
+    they expire.
+    """
+
+    def __init__(
+        self,
+        create_transport: Callable[[], httpx.AsyncBaseTransport] = create_http_transport,
+        max_clients: int = TENANT_MAX_CLIENTS,
+        idle_ttl: float = TENANT_IDLE_TTL_SECONDS,
+    ) -> None:
+        self.create_transport = create_transport
+        self.max_clients = max_clients
+        self.idle_ttl = idle_ttl
+
+        self.evictions = 0
+
+        self._transport: httpx.AsyncBaseTransport | None = None
+        # Tenant key -> (last use, client), least recently used first
+        self._clients: OrderedDict[str, tuple[float, DevopnessClientAsync]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, tenant: Tenant) -> DevopnessClientAsync:
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        entry = self._clients.pop(tenant.key, None)
+
+        if entry is None:
+            if self._transport is None:
+                self._transport = self.create_transport()
+
+            devopness = create_client(self._transport)
+            start_session(devopness, tenant.email, tenant.password)
+        else:
+            devopness = entry[1]
+
+        self._clients[tenant.key] = (now, devopness)
+
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+            self.evictions += 1
+
+        return devopness
+
+    def _evict_idle(self, now: float) -> None:
+        while self._clients:
+            last_used, _ = next(iter(self._clients.values()))
+            if now - last_used < self.idle_ttl:
+                return
+
+            self._clients.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "idle_ttl": self.idle_ttl,
+            "evictions": self.evictions,
+        }
+
+    async def aclose(self) -> None:
+        if self._transport is not None:
+            await self._transport.aclose()
+
+        self._transport = None
+        self._clients.clear()
@@ -1,4 +1,9 @@
 from dataclasses import dataclass
+
+from devopness.models import CredentialRelation
+
+from .pagination import PaginationArgs, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -7,8 +12,19 @@ from .utils import (
 )
 
 
+CREDENTIAL_FIELDS: FieldGetters[CredentialRelation] = {
+    "id": lambda credential: credential.id,
+    "name": lambda credential: credential.name,
+    "provider": lambda credential: credential.provider.code_human_readable,
+    "provider_type": lambda credential: credential.provider_type_human_readable,
+    "active": lambda credential: credential.active,
+    "created_at": lambda credential: credential.created_at,
+    "updated_at": lambda credential: credential.updated_at,
+}
+
+
 @dataclass
-class ListCredentials:
+class ListCredentials(PaginationArgs, ProjectionArgs):
     environment_id: int
 
 
@@ -16,9 +32,16 @@ async def list_credentials(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
     parsed = get_args_from_helper(args, ListCredentials)
+    fields = select_fields(CREDENTIAL_FIELDS, parsed)
 
-    response = await devopness.credentials.list_environment_credentials(
-        parsed.environment_id
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.credentials.list_environment_credentials(
+            parsed.environment_id, page, per_page
+        ),
+        parsed,
     )
 
-    return response.data
+    return {
+        **project(data, fields, parsed),
+        "pagination": pagination,
+    }
@@ -0,0 +1,246 @@
+import asyncio
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional
+from weakref import WeakValueDictionary
+
+from devopness.models import ActionPipelineCreatePlain, SourceType
+
+from .actions import get_progress_context, get_wait_timeout, watch_action
+from .pagination import fetch_all
+from .resolver import find, get_ancestor
+from .session import get_session
+from .utils import (
+    DevopnessClientAsync,
+    EnvironmentResourceType,
+    ListArgs,
+    ensure_authenticated,
+    get_args_from_helper,
+)
+
+DEPLOY_CONCURRENCY = int(os.environ.get("DEVOPNESS_MCP_DEPLOY_CONCURRENCY", "8"))
+
+DEPLOY_OPERATION = "deploy"
+
+# Deployments in progress per (account, pipeline), shared by all the calls, so
+# together they never run more than a pipeline's `max_parallel_actions`
+_pipeline_limits: WeakValueDictionary[tuple[str, int], asyncio.Semaphore] = (
+    WeakValueDictionary()
+)
+
+
+@dataclass
+class DeployTarget:
+    pipeline_id: int
+    pipeline_name: str | None = None
+    resource_id: int | None = None
+    max_parallel_actions: int = 1
+
+
+@dataclass
+class DeployApplications:
+    """
+    Deploys several pipelines at once, e.g. to roll a release out across
+    environments. The targets are the given `pipeline_ids`, or the deploy
+    pipeline of every application named `application_name` (in the whole
+    account, or only within the given project or environment).
+
+    At most `max_concurrency` deployments are started at a time, and never
+    more than a pipeline's `max_parallel_actions` on the same pipeline. With
+    `wait`, it returns once every deployment finished (or `timeout_seconds`
+    passed, by default and at most the limit set by the server).
+
+    Rules:
+    - DO NOT execute this tool without first confirming with the user which
+      pipelines (or applications) will be deployed, and the source to deploy.
+    - BEFORE executing this tool, show to the user every pipeline that will
+      be deployed.
+    """
+
+    deploy_source_type: SourceType
+    deploy_source_value: str
+    pipeline_ids: Optional[list[int]] = None
+    application_name: Optional[str] = None
+    project_id: Optional[int] = None
+    environment_id: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    wait: Optional[bool] = None
+    timeout_seconds: Optional[float] = None
+
+
+async def get_pipeline_targets(
+    devopness: DevopnessClientAsync,
+    pipeline_ids: list[int],
+) -> list[DeployTarget]:
+    async def get_target(pipeline_id: int) -> DeployTarget:
+        pipeline = (await devopness.pipelines.get_pipeline(pipeline_id)).data
+
+        return DeployTarget(
+            pipeline_id,
+            pipeline.name,
+            pipeline.resource_id,
+            pipeline.max_parallel_actions or 1,
+        )
+
+    await ensure_authenticated(devopness)
+
+    return await asyncio.gather(
+        *(get_target(pipeline_id) for pipeline_id in pipeline_ids)
+    )
+
+
+async def get_application_targets(
+    devopness: DevopnessClientAsync,
+    application_name: str,
+    args: dict[str, Any],
+) -> list[DeployTarget]:
+    within = await get_ancestor(devopness, "application", args)
+    applications = await find(devopness, "application", application_name, within)
+
+    if not applications:
+        raise ValueError(f"No application named '{application_name}' was found")
+
+    async def get_targets(application_id: int) -> list[DeployTarget]:
+        pipelines, _ = await fetch_all(
+            lambda page, per_page: devopness.pipelines.list_pipelines_by_resource_type(
+                application_id, EnvironmentResourceType.APPLICATION, page, per_page
+            )
+        )
+
+        return [
+            DeployTarget(
+                pipeline.id,
+                pipeline.name,
+                application_id,
+                pipeline.max_parallel_actions or 1,
+            )
+            for pipeline in pipelines
+            if pipeline.operation == DEPLOY_OPERATION
+        ]
+
+    await ensure_authenticated(devopness)
+
+    targets = await asyncio.gather(
+        *(get_targets(application.id) for application in applications)
+    )
+
+    return [
+        target for application_targets in targets for target in application_targets
+    ]
+
+
+def get_pipeline_limit(
+    devopness: DevopnessClientAsync,
+    target: DeployTarget,
+) -> asyncio.Semaphore:
+    key = (get_session(devopness).tenant_key, target.pipeline_id)
+
+    limit = _pipeline_limits.get(key)
+    if limit is None:
+        limit = asyncio.Semaphore(max(target.max_parallel_actions, 1))
+        _pipeline_limits[key] = limit
+
+    return limit
+
+
+async def deploy_applications(devopness: DevopnessClientAsync, args: ListArgs):
+    parsed = get_args_from_helper(args, DeployApplications)
+
+    if parsed.pipeline_ids:
+        # Each pipeline is deployed once, however many times it is given
+        targets = await get_pipeline_targets(
+            devopness, list(dict.fromkeys(parsed.pipeline_ids))
+        )
+    elif parsed.application_name:
+        targets = await get_application_targets(
+            devopness, parsed.application_name, args or {}
+        )
+    else:
+        raise ValueError(
+            "Missing argument: either 'pipeline_ids' or 'application_name'"
+        )
+
+    deploy_config: ActionPipelineCreatePlain = {
+        "source_type": parsed.deploy_source_type,
+        "source_ref": parsed.deploy_source_value,
+    }
+
+    started = time.monotonic()
+    timeout = get_wait_timeout(parsed.timeout_seconds)
+
+    # Never more than DEPLOY_CONCURRENCY, whatever the caller asks for
+    launches = asyncio.Semaphore(
+        min(max(parsed.max_concurrency or DEPLOY_CONCURRENCY, 1), DEPLOY_CONCURRENCY)
+    )
+    # Held (and so kept) for the whole call
+    pipeline_limits = {
+        target.pipeline_id: get_pipeline_limit(devopness, target) for target in targets
+    }
+
+    context = get_progress_context() if parsed.wait else None
+    finished = 0
+
+    async def deploy(target: DeployTarget) -> dict[str, Any]:
+        nonlocal finished
+
+        result: dict[str, Any] = {
+            "pipeline_id": target.pipeline_id,
+            "pipeline_name": target.pipeline_name,
+            "resource_id": target.resource_id,
+        }
+
+        # The pipeline slot is held until the action finished, when waiting
+        async with pipeline_limits[target.pipeline_id]:
+            try:
+                async with launches:
+                    await ensure_authenticated(devopness)
+
+                    action = (
+                        await devopness.actions.add_pipeline_action(
+                            target.pipeline_id, deploy_config
+                        )
+                    ).data
+
+                result["action_id"] = action.id
+
+                if parsed.wait:
+                    remaining = started + timeout - time.monotonic()
+                    result["action"] = await watch_action(
+                        devopness, action.id, max(remaining, 0)
+                    )
+            except Exception as error:
+                result["error"] = str(error)
+
+        if context is not None:
+            finished += 1
+            await context.report_progress(
+                finished,
+                len(targets),
+                f"{finished}/{len(targets)} deployments finished",
+            )
+
+        return result
+
+    results = await asyncio.gather(*(deploy(target) for target in targets))
+
+    return {
+        "data": results,
+        "count": len(results),
+        "outcomes": dict(Counter(get_outcome(result) for result in results)),
+        "elapsed_seconds": round(time.monotonic() - started, 1),
+    }
+
+
+def get_outcome(result: dict[str, Any]) -> str:
+    if "error" in result:
+        return "error"
+
+    if "action" not in result:
+        return "started"
+
+    if result["action"]["timed_out"]:
+        return "timed_out"
+
+    return str(result["action"]["status"].value)
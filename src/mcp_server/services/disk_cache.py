@@ -0,0 +1,83 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = os.environ.get("DEVOPNESS_MCP_CACHE_DIR")
+
+
+class DiskCache:
+    """
+    SQLite backed key/value store used to persist catalogs between process
+    restarts.
+
+    The database runs in WAL mode, so several MCP server processes can share
+    the same file: readers never block, and concurrent writers wait for each
+    other (up to `busy_timeout` seconds) instead of failing.
+    """
+
+    def __init__(self, path: Path, busy_timeout: float = 5.0) -> None:
+        self.path = path
+        self.busy_timeout = busy_timeout
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._execute("PRAGMA journal_mode=WAL")
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ")"
+        )
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout)
+        try:
+            with connection:
+                return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+    def _get(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        rows = self._execute(
+            "SELECT value, fetched_at FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        )
+
+        if not rows:
+            return None
+
+        value, fetched_at = rows[0]
+
+        return json.loads(value), fetched_at
+
+    def _set(self, namespace: str, key: str, value: Any, fetched_at: float) -> None:
+        self._execute(
+            "INSERT INTO entries (namespace, key, value, fetched_at)"
+            " VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (namespace, key) DO UPDATE SET"
+            " value = excluded.value, fetched_at = excluded.fetched_at",
+            (namespace, key, json.dumps(value), fetched_at),
+        )
+
+    async def get(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        """
+        Return the stored value and the unix time it was fetched at.
+        """
+        return await asyncio.to_thread(self._get, namespace, key)
+
+    async def set(self, namespace: str, key: str, value: Any) -> None:
+        await asyncio.to_thread(self._set, namespace, key, value, time.time())
+
+
+def open_disk_cache(name: str) -> DiskCache | None:
+    if not CACHE_DIR:
+        return None
+
+    return DiskCache(Path(CACHE_DIR).expanduser() / f"{name}.sqlite3")
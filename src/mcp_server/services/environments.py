@@ -1,4 +1,10 @@
 from dataclasses import dataclass
+
+from devopness.models import EnvironmentRelation
+
+from .names import get_name_index
+from .pagination import PaginationArgs, is_complete, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -7,8 +13,16 @@ from .utils import (
 )
 
 
+ENVIRONMENT_FIELDS: FieldGetters[EnvironmentRelation] = {
+    "id": lambda environment: environment.id,
+    "name": lambda environment: environment.name,
+    "type": lambda environment: environment.type,
+    "description": lambda environment: environment.description,
+}
+
+
 @dataclass
-class ListEnvironments:
+class ListEnvironments(PaginationArgs, ProjectionArgs):
     project_id: int
 
 
@@ -16,20 +30,23 @@ async def list_environments(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
     parsed = get_args_from_helper(args, ListEnvironments)
-
-    response = await devopness.environments.list_project_environments(parsed.project_id)
-
-    environments = [
-        {
-            "id": environment.id,
-            "name": environment.name,
-            "type": environment.type,
-            "description": environment.description,
-        }
-        for environment in response.data
-    ]
+    fields = select_fields(ENVIRONMENT_FIELDS, parsed)
+
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.environments.list_project_environments(
+            parsed.project_id, page, per_page
+        ),
+        parsed,
+    )
+
+    get_name_index(devopness).record(
+        "environment",
+        ("project", parsed.project_id),
+        ((environment.id, environment.name) for environment in data),
+        is_complete(pagination),
+    )
 
     return {
-        "data": environments,
-        "count": len(environments),
+        **project(data, fields, parsed),
+        "pagination": pagination,
     }
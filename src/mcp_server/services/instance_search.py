@@ -0,0 +1,274 @@
+import asyncio
+import heapq
+import os
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from devopness.models import CloudProviderServiceCode
+
+from .cache import STATIC_CACHE_MAX_ENTRIES, STATIC_CACHE_TTL_SECONDS, TTLCache
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
+from .static import INSTANCE_TYPE_FIELDS, get_instance_types, get_regions
+from .utils import (
+    DevopnessClientAsync,
+    ListArgs,
+    get_args_from_helper,
+)
+
+INSTANCE_SEARCH_LIMIT = 10
+REGION_CONCURRENCY = int(os.environ.get("DEVOPNESS_MCP_REGION_CONCURRENCY", "8"))
+
+# A match is the region it was found in and the cached instance type
+Match = tuple[str, dict[str, Any]]
+
+
+def match_getter(get: Callable[[dict[str, Any]], Any]) -> Callable[[Match], Any]:
+    return lambda match: get(match[1])
+
+
+MATCH_FIELDS: FieldGetters[Match] = {
+    "region": lambda match: match[0],
+    **{name: match_getter(get) for name, get in INSTANCE_TYPE_FIELDS.items()},
+}
+
+
+class InstanceTypeSort(str, Enum):
+    PRICE_HOURLY = "price_hourly"
+    PRICE_MONTHLY = "price_monthly"
+    VCPUS = "vcpus"
+    MEMORY = "memory"
+
+
+class InstanceTypeIndex:
+    """
+    Sorted views of a region catalog, so requirements on vCPUs, memory and
+    price are answered with binary searches instead of a full scan.
+    """
+
+    ATTRIBUTES = ("vcpus", "memory", "price_hourly")
+
+    def __init__(self, instance_types: list[dict[str, Any]]) -> None:
+        self.instance_types = instance_types
+
+        self._sorted: dict[str, tuple[list[Any], list[dict[str, Any]]]] = {}
+
+        for attribute in self.ATTRIBUTES:
+            ordered = sorted(
+                (
+                    instance_type
+                    for instance_type in instance_types
+                    if instance_type.get(attribute) is not None
+                ),
+                key=lambda instance_type: instance_type[attribute],
+            )
+
+            self._sorted[attribute] = (
+                [instance_type[attribute] for instance_type in ordered],
+                ordered,
+            )
+
+    def range(
+        self,
+        attribute: str,
+        low: float | None = None,
+        high: float | None = None,
+    ) -> list[dict[str, Any]]:
+        keys, ordered = self._sorted[attribute]
+
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+
+        return ordered[start:end]
+
+    def query(
+        self,
+        ranges: dict[str, tuple[float | None, float | None]],
+    ) -> list[dict[str, Any]]:
+        """
+        Return the instance types within every (low, high) range, starting
+        from the narrowest range and filtering it by the others.
+        """
+        ranges = {
+            attribute: bounds
+            for attribute, bounds in ranges.items()
+            if bounds != (None, None)
+        }
+
+        if not ranges:
+            return self.instance_types
+
+        candidates = {
+            attribute: self.range(attribute, *bounds)
+            for attribute, bounds in ranges.items()
+        }
+        narrowest = min(candidates, key=lambda attribute: len(candidates[attribute]))
+
+        return [
+            instance_type
+            for instance_type in candidates[narrowest]
+            if all(
+                (low is None or instance_type[attribute] >= low)
+                and (high is None or instance_type[attribute] <= high)
+                for attribute, (low, high) in ranges.items()
+                if attribute != narrowest
+            )
+        ]
+
+
+# Indexes are rebuilt whenever the catalog cache returns a different catalog.
+_indexes: TTLCache[tuple[list[dict[str, Any]], InstanceTypeIndex]] = TTLCache(
+    STATIC_CACHE_TTL_SECONDS, STATIC_CACHE_MAX_ENTRIES
+)
+
+
+async def get_instance_type_index(
+    devopness: DevopnessClientAsync,
+    provider_service: CloudProviderServiceCode,
+    region: str,
+) -> InstanceTypeIndex:
+    instance_types = await get_instance_types(devopness, provider_service, region)
+
+    key = (provider_service.value, region)
+    entry = _indexes.get(key)
+
+    if entry is None or entry[0] is not instance_types:
+        entry = (instance_types, InstanceTypeIndex(instance_types))
+        _indexes.set(key, entry)
+
+    return entry[1]
+
+
+@dataclass
+class FindInstanceTypes(ProjectionArgs):
+    """
+    Finds the instance types of one or more regions that meet the given
+    requirements, returning only the best `limit` matches (cheapest first,
+    unless `sort_by` says otherwise).
+    """
+
+    provider_service: CloudProviderServiceCode
+    regions: list[str]
+    min_vcpus: Optional[int] = None
+    max_vcpus: Optional[int] = None
+    min_memory_gb: Optional[float] = None
+    max_memory_gb: Optional[float] = None
+    max_price_hourly: Optional[float] = None
+    architecture: Optional[str] = None
+    family: Optional[str] = None
+    sort_by: Optional[InstanceTypeSort] = None
+    limit: Optional[int] = None
+
+
+def gb_to_mb(value: float | None) -> float | None:
+    return None if value is None else value * 1024
+
+
+async def find_instance_types(devopness: DevopnessClientAsync, args: ListArgs):
+    parsed = get_args_from_helper(args, FindInstanceTypes)
+    fields = select_fields(MATCH_FIELDS, parsed)
+
+    indexes = await asyncio.gather(
+        *(
+            get_instance_type_index(devopness, parsed.provider_service, region)
+            for region in parsed.regions
+        )
+    )
+
+    ranges = {
+        "vcpus": (parsed.min_vcpus, parsed.max_vcpus),
+        "memory": (gb_to_mb(parsed.min_memory_gb), gb_to_mb(parsed.max_memory_gb)),
+        "price_hourly": (None, parsed.max_price_hourly),
+    }
+
+    matches: list[Match] = [
+        (region, instance_type)
+        for region, index in zip(parsed.regions, indexes)
+        for instance_type in index.query(ranges)
+        if parsed.architecture in (None, instance_type.get("architecture"))
+        and parsed.family in (None, instance_type.get("family"))
+    ]
+
+    sort_by = (parsed.sort_by or InstanceTypeSort.PRICE_HOURLY).value
+    limit = parsed.limit if parsed.limit is not None else INSTANCE_SEARCH_LIMIT
+
+    # Missing values are sorted last
+    best = heapq.nsmallest(
+        max(limit, 0),
+        matches,
+        key=lambda match: (match[1].get(sort_by) is None, match[1].get(sort_by) or 0),
+    )
+
+    return {
+        **project(best, fields, parsed),
+        "matched": len(matches),
+    }
+
+
+@dataclass
+class CompareInstanceTypesAcrossRegions(ProjectionArgs):
+    """
+    Fetches the instance types of all (or the given) regions of a cloud
+    provider service concurrently and merges them into a single table, with
+    the fetch time and error (if any) of each region.
+    """
+
+    provider_service: CloudProviderServiceCode
+    regions: Optional[list[str]] = None
+    instance_types: Optional[list[str]] = None
+    max_concurrency: Optional[int] = None
+
+
+async def compare_instance_types_across_regions(
+    devopness: DevopnessClientAsync, args: ListArgs
+):
+    parsed = get_args_from_helper(args, CompareInstanceTypesAcrossRegions)
+    fields = select_fields(MATCH_FIELDS, parsed)
+
+    regions = parsed.regions
+    if regions is None:
+        regions = [
+            region["code"]
+            for region in await get_regions(devopness, parsed.provider_service)
+        ]
+
+    limit = asyncio.Semaphore(max(parsed.max_concurrency or REGION_CONCURRENCY, 1))
+
+    async def fetch(region: str) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        async with limit:
+            started = time.perf_counter()
+            report: dict[str, Any] = {"region": region}
+
+            try:
+                instance_types = await get_instance_types(
+                    devopness, parsed.provider_service, region
+                )
+            except Exception as error:
+                instance_types = []
+                report["error"] = str(error)
+
+            report["count"] = len(instance_types)
+            report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+            return instance_types, report
+
+    results = await asyncio.gather(*(fetch(region) for region in regions))
+
+    wanted = set(parsed.instance_types or ())
+
+    matches: list[Match] = [
+        (region, instance_type)
+        for region, (instance_types, _) in zip(regions, results)
+        for instance_type in instance_types
+        if not wanted or instance_type.get("type") in wanted
+    ]
+
+    reports = [report for _, report in results]
+
+    return {
+        **project(matches, fields, parsed),
+        "regions": reports,
+        "failed_regions": sum(1 for report in reports if "error" in report),
+    }
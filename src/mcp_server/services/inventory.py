@@ -0,0 +1,170 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Optional
+
+from .applications import list_applications
+from .environments import list_environments
+from .pipelines import list_pipelines
+from .projects import get_project, list_projects
+from .servers import list_servers
+from .utils import (
+    DevopnessClientAsync,
+    EnvironmentResourceType,
+    ListArgs,
+    ensure_authenticated,
+    get_args_from_helper,
+)
+
+INVENTORY_CONCURRENCY = int(os.environ.get("DEVOPNESS_MCP_INVENTORY_CONCURRENCY", "8"))
+
+
+@dataclass
+class Inventory:
+    """
+    Returns the projects, their environments and the servers and applications
+    of each environment (optionally with their pipelines), in a single call.
+    """
+
+    project_id: Optional[int] = None
+    include_pipelines: Optional[bool] = None
+    max_concurrency: Optional[int] = None
+
+
+class InventoryCrawler:
+    def __init__(
+        self,
+        devopness: DevopnessClientAsync,
+        include_pipelines: bool,
+        max_concurrency: int,
+    ) -> None:
+        self.devopness = devopness
+        self.include_pipelines = include_pipelines
+
+        # One limit per level, so a wide level can not starve the next one.
+        self.environments_limit = asyncio.Semaphore(max_concurrency)
+        self.resources_limit = asyncio.Semaphore(max_concurrency)
+        self.pipelines_limit = asyncio.Semaphore(max_concurrency)
+
+        self.list_calls = 0
+        self.errors = 0
+
+    async def _call(self, semaphore: asyncio.Semaphore, call: Awaitable[Any]) -> Any:
+        async with semaphore:
+            self.list_calls += 1
+            return await call
+
+    async def _node(
+        self, node: dict[str, Any], children: Awaitable[dict[str, Any]]
+    ) -> dict[str, Any]:
+        started = time.perf_counter()
+
+        try:
+            node.update(await children)
+        except Exception as error:
+            self.errors += 1
+            node["error"] = str(error)
+
+        node["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        return node
+
+    async def project(self, project: dict[str, Any]) -> dict[str, Any]:
+        async def children() -> dict[str, Any]:
+            environments = await self._call(
+                self.environments_limit,
+                list_environments(self.devopness, {"project_id": project["id"]}),
+            )
+
+            return {
+                "environments": await asyncio.gather(
+                    *(self.environment(env) for env in environments["data"])
+                )
+            }
+
+        return await self._node(dict(project), children())
+
+    async def environment(self, environment: dict[str, Any]) -> dict[str, Any]:
+        async def children() -> dict[str, Any]:
+            args = {"environment_id": environment["id"]}
+
+            servers, applications = await asyncio.gather(
+                self._call(self.resources_limit, list_servers(self.devopness, args)),
+                self._call(
+                    self.resources_limit, list_applications(self.devopness, args)
+                ),
+            )
+
+            return {
+                "servers": await asyncio.gather(
+                    *(
+                        self.resource(server, EnvironmentResourceType.SERVER)
+                        for server in servers["data"]
+                    )
+                ),
+                "applications": await asyncio.gather(
+                    *(
+                        self.resource(application, EnvironmentResourceType.APPLICATION)
+                        for application in applications["data"]
+                    )
+                ),
+            }
+
+        return await self._node(dict(environment), children())
+
+    async def resource(
+        self,
+        resource: dict[str, Any],
+        resource_type: EnvironmentResourceType,
+    ) -> dict[str, Any]:
+        if not self.include_pipelines:
+            return resource
+
+        async def children() -> dict[str, Any]:
+            pipelines = await self._call(
+                self.pipelines_limit,
+                list_pipelines(
+                    self.devopness,
+                    {"resource_id": resource["id"], "resource_type": resource_type.value},
+                ),
+            )
+
+            return {"pipelines": pipelines["data"]}
+
+        return await self._node(dict(resource), children())
+
+
+async def inventory(devopness: DevopnessClientAsync, args: ListArgs):
+    await ensure_authenticated(devopness)
+
+    parsed = get_args_from_helper(args, Inventory)
+
+    crawler = InventoryCrawler(
+        devopness,
+        include_pipelines=bool(parsed.include_pipelines),
+        # Never more than INVENTORY_CONCURRENCY, whatever the caller asks for
+        max_concurrency=min(
+            max(parsed.max_concurrency or INVENTORY_CONCURRENCY, 1),
+            INVENTORY_CONCURRENCY,
+        ),
+    )
+
+    started = time.perf_counter()
+
+    if parsed.project_id is not None:
+        projects = [await get_project(devopness, parsed.project_id)]
+    else:
+        projects = (await list_projects(devopness, {}))["data"]
+
+    crawler.list_calls += 1
+
+    data = await asyncio.gather(*(crawler.project(project) for project in projects))
+
+    return {
+        "data": data,
+        "count": len(data),
+        "list_calls": crawler.list_calls,
+        "errors": crawler.errors,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
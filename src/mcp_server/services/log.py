@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Literal
+
+import httpx
+
+LogFormat = Literal["json", "text"]
+
+LOG_LEVEL = os.environ.get("DEVOPNESS_MCP_LOG_LEVEL", "WARNING").upper()
+LOG_FORMAT: LogFormat = os.environ.get(  # type: ignore[assignment]
+    "DEVOPNESS_MCP_LOG_FORMAT", "json"
+)
+# Fraction of the requests whose debug and info records are logged; warnings
+# and errors are always logged
+LOG_SAMPLE_RATE = float(os.environ.get("DEVOPNESS_MCP_LOG_SAMPLE_RATE", "1"))
+
+logger = logging.getLogger("mcp_server")
+upstream_logger = logging.getLogger("mcp_server.upstream")
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+operation_name: ContextVar[str | None] = ContextVar("operation_name", default=None)
+sampled: ContextVar[bool] = ContextVar("sampled", default=True)
+
+# Attributes of every LogRecord; any other one was given in `extra`
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class ContextFilter(logging.Filter):
+    """
+    Adds the request and operation being handled to every record, and drops
+    the debug and info records of the requests left out of the sample.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING and not sampled.get():
+            return False
+
+        record.request_id = request_id.get()
+        record.operation = operation_name.get()
+
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line: dict[str, Any] = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for name, value in vars(record).items():
+            if name not in RECORD_ATTRIBUTES and value is not None:
+                line[name] = value
+
+        if record.exc_info:
+            line["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(line, default=str)
+
+
+def configure_logging(
+    level: str = LOG_LEVEL,
+    log_format: LogFormat = LOG_FORMAT,
+    sample_rate: float = LOG_SAMPLE_RATE,
+) -> None:
+    """
+    Log the records of the server to stderr (stdout carries the MCP messages
+    over stdio), one JSON object per line or as plain text.
+    """
+    global LOG_SAMPLE_RATE
+    LOG_SAMPLE_RATE = sample_rate
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.addFilter(ContextFilter())
+
+    if log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s %(levelname)s %(name)s [%(request_id)s %(operation)s]"
+                " %(message)s"
+            )
+        )
+
+    logger.handlers[:] = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+@asynccontextmanager
+async def log_operation(operation: str) -> AsyncIterator[None]:
+    """
+    Tag the records logged while performing `operation` with a new request
+    ID, and log its outcome and duration.
+    """
+    tokens = (
+        request_id.set(uuid.uuid4().hex[:16]),
+        operation_name.set(operation),
+        sampled.set(LOG_SAMPLE_RATE >= 1 or random.random() < LOG_SAMPLE_RATE),
+    )
+    started = time.perf_counter()
+
+    try:
+        yield
+    except Exception as error:
+        logger.warning(
+            "Operation failed: %s",
+            error,
+            extra={"duration_ms": elapsed_ms(started)},
+        )
+        raise
+    else:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Operation performed",
+                extra={"duration_ms": elapsed_ms(started)},
+            )
+    finally:
+        request_id.reset(tokens[0])
+        operation_name.reset(tokens[1])
+        sampled.reset(tokens[2])
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def log_response(response: httpx.Response) -> None:
+    """
+    httpx response hook logging the Devopness API calls, at debug level.
+    """
+    if not upstream_logger.isEnabledFor(logging.DEBUG):
+        return
+
+    upstream_logger.debug(
+        "%s %s -> %s",
+        response.request.method,
+        response.request.url.path,
+        response.status_code,
+        extra={"status_code": response.status_code},
+    )
@@ -0,0 +1,207 @@
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator
+
+import httpx
+
+# Upper bounds (in seconds) of the latency buckets, as in Prometheus histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 600)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# The operation being performed, to which upstream calls are attributed
+current_operation: ContextVar[str | None] = ContextVar(
+    "current_operation", default=None
+)
+
+
+class Histogram:
+    """
+    Latencies counted in fixed buckets, so recording is O(log buckets) and
+    memory constant however many calls are recorded. Quantiles are
+    interpolated within their bucket, as Prometheus' `histogram_quantile`.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[index - 1] if index else 0.0
+                # Values beyond the last bucket are only known to be <= max
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+
+            seen += count
+
+        return self.max
+
+
+class OperationMetrics:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self.upstream_bytes = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms": {
+                **{
+                    f"p{round(q * 100)}": to_ms(self.latency.quantile(q))
+                    for q in QUANTILES
+                },
+                "max": to_ms(self.latency.max) if self.latency.count else None,
+                "mean": (
+                    to_ms(self.latency.sum / self.latency.count)
+                    if self.latency.count
+                    else None
+                ),
+            },
+            "upstream_calls": self.upstream_calls,
+            "upstream_errors": self.upstream_errors,
+            "upstream_bytes": self.upstream_bytes,
+        }
+
+
+def to_ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class Metrics:
+    """
+    Calls, errors and latencies of the operations performed by this process,
+    with the Devopness API calls (and bytes received) each one made.
+
+    Upstream calls made outside of any operation are counted under "-".
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.operations: dict[str, OperationMetrics] = {}
+
+    def get(self, operation: str | None) -> OperationMetrics:
+        operation = operation or "-"
+
+        metrics = self.operations.get(operation)
+        if metrics is None:
+            metrics = self.operations[operation] = OperationMetrics()
+
+        return metrics
+
+    @asynccontextmanager
+    async def track(self, operation: str) -> AsyncIterator[None]:
+        metrics = self.get(operation)
+        token = current_operation.set(operation)
+        started = time.perf_counter()
+
+        try:
+            yield
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.calls += 1
+            metrics.latency.observe(time.perf_counter() - started)
+            current_operation.reset(token)
+
+    async def record_response(self, response: httpx.Response) -> None:
+        """
+        httpx response hook counting an upstream call and its bytes (the SDK
+        reads every body whole anyway).
+        """
+        metrics = self.get(current_operation.get())
+
+        metrics.upstream_calls += 1
+        if response.is_error:
+            metrics.upstream_errors += 1
+
+        metrics.upstream_bytes += len(await response.aread())
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self.operations.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at),
+            "operations": {
+                name: metrics.to_dict()
+                for name, metrics in sorted(self.operations.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        The metrics in the Prometheus text exposition format.
+        """
+        operations = sorted(self.operations.items())
+        lines = []
+
+        for family, get_value in PROMETHEUS_COUNTERS.items():
+            lines.append(f"# TYPE {family} counter")
+            lines.extend(
+                f'{family}{{operation="{name}"}} {get_value(metrics)}'
+                for name, metrics in operations
+            )
+
+        family = "devopness_mcp_operation_duration_seconds"
+        lines.append(f"# TYPE {family} histogram")
+
+        for name, metrics in operations:
+            histogram = metrics.latency
+            cumulative = 0
+
+            for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                cumulative += count
+                lines.append(
+                    f'{family}_bucket{{operation="{name}",le="{bound}"}} {cumulative}'
+                )
+
+            lines.append(f'{family}_sum{{operation="{name}"}} {histogram.sum}')
+            lines.append(f'{family}_count{{operation="{name}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def to_prometheus_sample(family: str, kind: str, value: float) -> str:
+    """
+    A metric without labels in the Prometheus text exposition format.
+    """
+    return f"# TYPE {family} {kind}\n{family} {value}\n"
+
+
+PROMETHEUS_COUNTERS = {
+    "devopness_mcp_operation_calls_total": lambda m: m.calls,
+    "devopness_mcp_operation_errors_total": lambda m: m.errors,
+    "devopness_mcp_upstream_calls_total": lambda m: m.upstream_calls,
+    "devopness_mcp_upstream_errors_total": lambda m: m.upstream_errors,
+    "devopness_mcp_upstream_bytes_total": lambda m: m.upstream_bytes,
+}
+
+
+metrics = Metrics()
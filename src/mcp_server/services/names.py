@@ -0,0 +1,150 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from devopness import DevopnessClientAsync
+
+from .session import PerClient
+
+NAME_INDEX_TTL_SECONDS = float(os.environ.get("DEVOPNESS_MCP_NAME_INDEX_TTL", "300"))
+
+# A resource, as (kind, id); `None` is the account itself (parent of projects)
+Ref = Optional[tuple[str, int]]
+
+
+@dataclass(frozen=True)
+class NameEntry:
+    kind: str
+    id: int
+    name: str
+    parent: Ref
+
+
+class NameIndex:
+    """
+    Maps resource names (project, environment, application and pipeline
+    names, server hostnames) to their IDs and parents.
+
+    It is fed by the list operations: each complete listing of a kind under a
+    parent (a "scope") replaces what was known about that scope, so the index
+    stays current without ever listing everything again. Scopes older than
+    `ttl` are considered stale and get listed again on the next lookup.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+
+        self._entries: dict[tuple[str, int], NameEntry] = {}
+        # (kind, parent) -> (refreshed_at, ids); refreshed_at is 0 when the
+        # scope was only partially listed or has been invalidated
+        self._scopes: dict[tuple[str, Ref], tuple[float, set[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(
+        self,
+        kind: str,
+        parent: Ref,
+        items: Iterable[tuple[int, str]],
+        complete: bool,
+    ) -> None:
+        refreshed_at, ids = self._scopes.get((kind, parent), (0.0, set()))
+
+        listed = set()
+        for item_id, name in items:
+            listed.add(item_id)
+            self._entries[(kind, item_id)] = NameEntry(kind, item_id, name, parent)
+
+        if not complete:
+            self._scopes[(kind, parent)] = (refreshed_at, ids | listed)
+            return
+
+        for item_id in ids - listed:
+            self.forget(kind, item_id)
+
+        self._scopes[(kind, parent)] = (time.monotonic(), listed)
+
+    def is_fresh(self, kind: str, parent: Ref) -> bool:
+        refreshed_at, _ = self._scopes.get((kind, parent), (0.0, set()))
+
+        return refreshed_at > 0 and time.monotonic() - refreshed_at < self.ttl
+
+    def children(self, kind: str, parent: Ref) -> list[NameEntry]:
+        _, ids = self._scopes.get((kind, parent), (0.0, set()))
+
+        return [self._entries[(kind, item_id)] for item_id in ids]
+
+    def get(self, kind: str, item_id: int) -> NameEntry | None:
+        return self._entries.get((kind, item_id))
+
+    def invalidate(self, kind: str, parent: Ref) -> None:
+        """
+        Mark a scope as stale, e.g. after a resource was created in it.
+        """
+        scope = self._scopes.get((kind, parent))
+
+        if scope is not None:
+            self._scopes[(kind, parent)] = (0.0, scope[1])
+
+    def forget(self, kind: str, item_id: int) -> None:
+        """
+        Remove a deleted resource, along with everything indexed under it.
+        """
+        entry = self._entries.pop((kind, item_id), None)
+
+        if entry is not None:
+            scope = self._scopes.get((kind, entry.parent))
+            if scope is not None:
+                scope[1].discard(item_id)
+
+        for child_kind, parent in list(self._scopes):
+            if parent == (kind, item_id):
+                for child_id in list(self._scopes[(child_kind, parent)][1]):
+                    self.forget(child_kind, child_id)
+
+                del self._scopes[(child_kind, parent)]
+
+    def describe(self, entry: NameEntry) -> dict[str, Any]:
+        """
+        The entry as returned to clients, with the chain of its parents
+        (closest first).
+        """
+        parents = []
+
+        parent = entry.parent
+        while parent is not None:
+            parent_entry = self.get(*parent)
+            if parent_entry is None:
+                parents.append({"kind": parent[0], "id": parent[1]})
+                break
+
+            parents.append(
+                {"kind": parent_entry.kind, "id": parent_entry.id, "name": parent_entry.name}
+            )
+            parent = parent_entry.parent
+
+        return {
+            "kind": entry.kind,
+            "id": entry.id,
+            "name": entry.name,
+            "parents": parents,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "scopes": len(self._scopes),
+            "ttl": self.ttl,
+        }
+
+
+# Each account has its own index, as names are only unique within an account
+name_indexes: PerClient[NameIndex] = PerClient(
+    lambda: NameIndex(NAME_INDEX_TTL_SECONDS)
+)
+
+
+def get_name_index(devopness: DevopnessClientAsync) -> NameIndex:
+    return name_indexes.get(devopness)
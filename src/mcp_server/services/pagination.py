@@ -0,0 +1,147 @@
+import asyncio
+import os
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional, TypeVar
+
+from devopness.core import DevopnessResponse
+
+ItemType = TypeVar("ItemType")
+
+PageFetcher = Callable[[int, int], Awaitable[DevopnessResponse[list[ItemType]]]]
+
+PAGE_SIZE = int(os.environ.get("DEVOPNESS_MCP_PAGE_SIZE", "50"))
+PAGE_PREFETCH = int(os.environ.get("DEVOPNESS_MCP_PAGE_PREFETCH", "4"))
+
+
+@dataclass(kw_only=True)
+class PaginationArgs:
+    """
+    Pagination:
+    - Without `page`, all pages are fetched (up to `limit` items).
+    - With `page`, only that page is fetched; use the returned `next_page`
+      to continue.
+    """
+
+    page: Optional[int] = None
+    per_page: Optional[int] = None
+    limit: Optional[int] = None
+
+
+def check_pagination(
+    page: int | None, per_page: int | None, limit: int | None
+) -> None:
+    for name, value, minimum in (
+        ("page", page, 1),
+        ("per_page", per_page, 1),
+        ("limit", limit, 0),
+    ):
+        if value is not None and value < minimum:
+            raise ValueError(f"`{name}` must be {minimum} or more, not {value}")
+
+
+async def iter_pages(
+    fetch_page: PageFetcher[ItemType],
+    per_page: int = PAGE_SIZE,
+    prefetch: int = PAGE_PREFETCH,
+    max_pages: int | None = None,
+) -> AsyncGenerator[DevopnessResponse[list[ItemType]], None]:
+    """
+    Yield the responses of each page, in order.
+
+    The first page tells how many pages exist, after which up to `prefetch`
+    of the following pages are requested concurrently while the caller
+    consumes the current one.
+    """
+    first = await fetch_page(1, per_page)
+    yield first
+
+    last_page = first.page_count
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+
+    pending: deque[asyncio.Task[DevopnessResponse[list[ItemType]]]] = deque()
+    next_page = 2
+
+    try:
+        while next_page <= last_page or pending:
+            while next_page <= last_page and len(pending) < max(prefetch, 1):
+                pending.append(asyncio.ensure_future(fetch_page(next_page, per_page)))
+                next_page += 1
+
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def fetch_all(
+    fetch_page: PageFetcher[ItemType],
+    per_page: int = PAGE_SIZE,
+    limit: int | None = None,
+) -> tuple[list[ItemType], bool]:
+    """
+    Fetch every page, stopping early once `limit` items were collected.
+
+    Returns the items and whether more items exist beyond them.
+    """
+    check_pagination(None, per_page, limit)
+
+    max_pages = None
+    if limit is not None:
+        max_pages = -(-limit // per_page)
+
+    items: list[ItemType] = []
+    page_count = 1
+
+    async with aclosing(iter_pages(fetch_page, per_page, max_pages=max_pages)) as pages:
+        async for response in pages:
+            page_count = response.page_count
+            items.extend(response.data)
+
+    if limit is None:
+        return items, False
+
+    truncated = len(items) > limit or (max_pages or 0) < page_count
+
+    return items[:limit], truncated
+
+
+async def paginate(
+    fetch_page: PageFetcher[ItemType],
+    pagination: PaginationArgs,
+) -> tuple[list[ItemType], dict[str, Any]]:
+    """
+    Fetch the items selected by `pagination`, returning them along with the
+    pagination details to include in the operation result.
+    """
+    check_pagination(pagination.page, pagination.per_page, pagination.limit)
+
+    per_page = pagination.per_page or PAGE_SIZE
+
+    if pagination.page is None:
+        items, truncated = await fetch_all(fetch_page, per_page, pagination.limit)
+
+        return items, {"truncated": truncated}
+
+    response = await fetch_page(pagination.page, per_page)
+    items = response.data[: pagination.limit]
+
+    next_page = None
+    if pagination.page < response.page_count:
+        next_page = pagination.page + 1
+
+    return items, {
+        "page": pagination.page,
+        "per_page": per_page,
+        "page_count": response.page_count,
+        "next_page": next_page,
+    }
+
+
+def is_complete(pagination: dict[str, Any]) -> bool:
+    """
+    Whether the pagination details of a result cover every existing item.
+    """
+    return pagination.get("truncated") is False
@@ -1,4 +1,10 @@
 from dataclasses import dataclass
+
+from devopness.models import PipelineRelation
+
+from .names import get_name_index
+from .pagination import PaginationArgs, is_complete, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -8,8 +14,20 @@ from .utils import (
 )
 
 
+PIPELINE_FIELDS: FieldGetters[PipelineRelation] = {
+    "id": lambda pipeline: pipeline.id,
+    "name": lambda pipeline: pipeline.name,
+    "operation": lambda pipeline: pipeline.operation_human_readable,
+    "max_parallel_actions": lambda pipeline: pipeline.max_parallel_actions,
+    "resource": lambda pipeline: {
+        "id": pipeline.resource_id,
+        "type": pipeline.resource_type_human_readable,
+    },
+}
+
+
 @dataclass
-class ListPipelines:
+class ListPipelines(PaginationArgs, ProjectionArgs):
     resource_id: int
     resource_type: EnvironmentResourceType
 
@@ -18,26 +36,23 @@ async def list_pipelines(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
     parsed = get_args_from_helper(args, ListPipelines)
+    fields = select_fields(PIPELINE_FIELDS, parsed)
 
-    response = await devopness.pipelines.list_pipelines_by_resource_type(
-        parsed.resource_id, parsed.resource_type
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.pipelines.list_pipelines_by_resource_type(
+            parsed.resource_id, parsed.resource_type, page, per_page
+        ),
+        parsed,
     )
 
-    pipelines = [
-        {
-            "id": pipeline.id,
-            "name": pipeline.name,
-            "operation": pipeline.operation_human_readable,
-            "max_parallel_actions": pipeline.max_parallel_actions,
-            "resource": {
-                "id": pipeline.resource_id,
-                "type": pipeline.resource_type_human_readable,
-            },
-        }
-        for pipeline in response.data
-    ]
+    get_name_index(devopness).record(
+        "pipeline",
+        (parsed.resource_type.value, parsed.resource_id),
+        ((pipeline.id, pipeline.name) for pipeline in data),
+        is_complete(pagination),
+    )
 
     return {
-        "data": pipelines,
-        "count": len(pipelines),
+        **project(data, fields, parsed),
+        "pagination": pagination,
     }
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+ItemType = TypeVar("ItemType")
+
+# Output field name -> how to read it from an item (SDK model or cached dict)
+FieldGetters = dict[str, Callable[[ItemType], Any]]
+
+
+class OutputFormat(str, Enum):
+    RECORDS = "records"
+    COLUMNS = "columns"
+
+
+@dataclass(kw_only=True)
+class ProjectionArgs:
+    """
+    Output:
+    - `fields` selects which fields of each item are returned (default: all).
+    - `output_format` "records" (default) returns a list of objects in `data`;
+      "columns" returns the field names once in `columns` and one list of
+      values per item in `rows`, which is much smaller for long lists.
+    """
+
+    fields: Optional[list[str]] = None
+    output_format: Optional[OutputFormat] = None
+
+
+def item_getter(name: str) -> Callable[[dict[str, Any]], Any]:
+    return lambda item: item.get(name)
+
+
+def item_getters(names: Iterable[str]) -> FieldGetters[dict[str, Any]]:
+    return {name: item_getter(name) for name in names}
+
+
+def select_fields(
+    getters: FieldGetters[ItemType],
+    projection: ProjectionArgs,
+) -> FieldGetters[ItemType]:
+    """
+    Pick the getters of the requested fields, failing on unknown ones before
+    anything is fetched.
+    """
+    fields = projection.fields
+    if not fields:
+        return getters
+
+    unknown = [name for name in fields if name not in getters]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}"
+            " (expected any of: " + ", ".join(getters) + ")"
+        )
+
+    return {name: getters[name] for name in dict.fromkeys(fields)}
+
+
+def project(
+    items: list[ItemType],
+    selected: FieldGetters[ItemType],
+    projection: ProjectionArgs,
+) -> dict[str, Any]:
+    """
+    Build the `data` (or `columns` and `rows`) of a list result, reading only
+    the selected fields of each item.
+    """
+    if projection.output_format == OutputFormat.COLUMNS:
+        values = tuple(selected.values())
+
+        return {
+            "columns": list(selected),
+            "rows": [[get(item) for get in values] for item in items],
+            "count": len(items),
+        }
+
+    return {
+        "data": [{name: get(item) for name, get in selected.items()} for item in items],
+        "count": len(items),
+    }
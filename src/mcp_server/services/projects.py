@@ -1,25 +1,66 @@
 from dataclasses import dataclass
-from .utils import DevopnessClientAsync, ListArgs, ensure_authenticated
+from typing import Any
+
+from devopness.models import ProjectRelation
+
+from .names import get_name_index
+from .pagination import PaginationArgs, is_complete, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
+from .utils import (
+    DevopnessClientAsync,
+    ListArgs,
+    ensure_authenticated,
+    get_args_from_helper,
+)
+
+
+PROJECT_FIELDS: FieldGetters[ProjectRelation] = {
+    "id": lambda project: project.id,
+    "name": lambda project: project.name,
+}
 
 
 @dataclass
-class ListProjects: ...
+class ListProjects(PaginationArgs, ProjectionArgs): ...
 
 
 async def list_projects(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
-    response = await devopness.projects.list_projects()
+    parsed = get_args_from_helper(args, ListProjects)
+    fields = select_fields(PROJECT_FIELDS, parsed)
+
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.projects.list_projects(page, per_page),
+        parsed,
+    )
 
-    projects = [
-        {
-            "id": project.id,
-            "name": project.name,
-        }
-        for project in response.data
-    ]
+    get_name_index(devopness).record(
+        "project",
+        None,
+        ((project.id, project.name) for project in data),
+        is_complete(pagination),
+    )
 
     return {
-        "data": projects,
-        "count": len(projects),
+        **project(data, fields, parsed),
+        "pagination": pagination,
     }
+
+
+async def get_project(
+    devopness: DevopnessClientAsync,
+    project_id: int,
+) -> dict[str, Any]:
+    """
+    A single project, with the fields listed by `list_projects`.
+    """
+    await ensure_authenticated(devopness)
+
+    project = (await devopness.projects.get_project(project_id)).data
+
+    get_name_index(devopness).record(
+        "project", None, [(project.id, project.name)], False
+    )
+
+    return {"id": project.id, "name": project.name}
@@ -0,0 +1,294 @@
+import os
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from devopness import DevopnessClientAsync
+
+from .names import get_name_index
+from .session import PerClient
+
+READ_CACHE_TTL_SECONDS = float(os.environ.get("DEVOPNESS_MCP_READ_CACHE_TTL", "600"))
+READ_CACHE_MAX_ENTRIES = int(
+    os.environ.get("DEVOPNESS_MCP_READ_CACHE_MAX_ENTRIES", "1024")
+)
+
+
+class TaggedCache:
+    """
+    Cache of read results, each tagged with the resources it covers (e.g.
+    "environment/1/servers"), so a write drops exactly the entries it made
+    stale instead of the whole cache.
+
+    A result loaded while one of its tags was invalidated is not stored, as
+    it may predate the write.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any, tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._keys_by_tag: dict[str, set[Hashable]] = {}
+        self._generation = 0
+        # Generation at which each load in flight started, and at which tags
+        # were invalidated while loads were in flight (only those loads need
+        # to know, so the tags are dropped once they are all done)
+        self._loading: Counter[int] = Counter()
+        self._invalidated_at: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(
+        self,
+        key: Hashable,
+        tags: Iterable[str],
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        entry = self._entries.get(key)
+
+        if entry is not None and time.monotonic() < entry[0]:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+
+        generation = self._generation
+        self._loading[generation] += 1
+
+        try:
+            value = await load()
+
+            tags = tuple(tags)
+            if all(self._invalidated_at.get(tag, 0) <= generation for tag in tags):
+                self._set(key, value, tags)
+        finally:
+            self._done_loading(generation)
+
+        return value
+
+    def _done_loading(self, generation: int) -> None:
+        self._loading[generation] -= 1
+        if not self._loading[generation]:
+            del self._loading[generation]
+
+        if not self._invalidated_at:
+            return
+
+        # Invalidations no load in flight predates are of no use anymore
+        oldest = min(self._loading, default=self._generation)
+        self._invalidated_at = {
+            tag: invalidated_at
+            for tag, invalidated_at in self._invalidated_at.items()
+            if invalidated_at > oldest
+        }
+
+    def _set(self, key: Hashable, value: Any, tags: tuple[str, ...]) -> None:
+        self._delete(key)
+
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._delete(next(iter(self._entries)))
+
+    def _delete(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """
+        Drop every entry tagged with any of `tags`, returning how many.
+        """
+        self._generation += 1
+        dropped = 0
+
+        for tag in tags:
+            if self._loading:
+                self._invalidated_at[tag] = self._generation
+
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._delete(key)
+                dropped += 1
+
+        self.invalidations += dropped
+
+        return dropped
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "tags": len(self._keys_by_tag),
+        }
+
+
+read_caches: PerClient[TaggedCache] = PerClient(
+    lambda: TaggedCache(READ_CACHE_TTL_SECONDS, READ_CACHE_MAX_ENTRIES)
+)
+
+
+def get_read_cache(devopness: DevopnessClientAsync) -> TaggedCache:
+    return read_caches.get(devopness)
+
+
+# Tags of the cached list operations: the scope they list, plus the kind of
+# resources, for writes whose scope is unknown.
+
+
+def list_servers_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    environment_id = args.get("environment_id")
+
+    return ["servers", f"environment/{environment_id}/servers"]
+
+
+def list_applications_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    environment_id = args.get("environment_id")
+
+    return ["applications", f"environment/{environment_id}/applications"]
+
+
+def list_credentials_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    environment_id = args.get("environment_id")
+
+    return ["credentials", f"environment/{environment_id}/credentials"]
+
+
+def list_pipelines_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    resource_type = args.get("resource_type")
+    resource_id = args.get("resource_id")
+
+    return ["pipelines", f"{resource_type}/{resource_id}/pipelines"]
+
+
+# Tags dirtied by the write operations. The parents of servers and pipelines
+# come from the name index; unknown ones dirty every entry of the kind.
+
+
+def get_environment_id(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    item_id: int | None,
+) -> int | None:
+    name_index = get_name_index(devopness)
+    entry = name_index.get(kind, item_id) if item_id is not None else None
+
+    while entry is not None and entry.parent is not None:
+        if entry.parent[0] == "environment":
+            return entry.parent[1]
+
+        entry = name_index.get(*entry.parent)
+
+    return None
+
+
+def environment_tags(environment_id: int | None, *kinds: str) -> list[str]:
+    if environment_id is None:
+        return list(kinds)
+
+    return [f"environment/{environment_id}/{kind}" for kind in kinds]
+
+
+def create_server_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    return environment_tags(args.get("environment_id"), "servers")
+
+
+def stop_server_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    server_id = args.get("server_id")
+    environment_id = get_environment_id(devopness, "server", server_id)
+
+    return environment_tags(environment_id, "servers")
+
+
+def delete_server_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    server_id = args.get("server_id")
+    environment_id = get_environment_id(devopness, "server", server_id)
+
+    return [
+        *environment_tags(environment_id, "servers"),
+        f"server/{server_id}/pipelines",
+    ]
+
+
+def create_application_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    return environment_tags(args.get("environment_id"), "applications")
+
+
+def deploy_application_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    # Deployments change the last action of the servers they run on
+    environment_id = get_environment_id(
+        devopness, "pipeline", args.get("deploy_pipeline_id")
+    )
+
+    return environment_tags(environment_id, "servers", "applications")
+
+
+def deploy_applications_tags(
+    devopness: DevopnessClientAsync,
+    args: dict[str, Any],
+) -> list[str]:
+    pipeline_ids = args.get("pipeline_ids")
+    if not pipeline_ids:
+        return environment_tags(None, "servers", "applications")
+
+    return sorted(
+        {
+            tag
+            for pipeline_id in pipeline_ids
+            for tag in deploy_application_tags(
+                devopness, {"deploy_pipeline_id": pipeline_id}
+            )
+        }
+    )
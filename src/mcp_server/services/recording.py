@@ -0,0 +1,233 @@
+import asyncio
+import atexit
+import gzip
+import io
+import json
+import os
+import re
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+import httpx
+
+# Record the Devopness API calls to this file, or serve the calls recorded in
+# it instead of calling the API (`.gz` files are compressed)
+RECORD_UPSTREAM = os.environ.get("DEVOPNESS_MCP_RECORD_UPSTREAM")
+REPLAY_UPSTREAM = os.environ.get("DEVOPNESS_MCP_REPLAY_UPSTREAM")
+# Replayed responses are delayed by their recorded duration divided by this;
+# 0 serves them immediately
+REPLAY_SPEED = float(os.environ.get("DEVOPNESS_MCP_REPLAY_SPEED", "1"))
+# Record the operations performed (and their arguments) to this file
+RECORD_CALLS = os.environ.get("DEVOPNESS_MCP_RECORD_CALLS")
+
+SECRET_KEYS = re.compile(
+    r"password|secret|private_key|access_key|api_key|token$", re.IGNORECASE
+)
+REDACTED = "[REDACTED]"
+
+# Response headers the clients depend on; no other header is recorded
+RECORDED_HEADERS = ("content-type", "link", "x-devopness-action-id")
+
+
+def redact(value: Any) -> Any:
+    """
+    `value` with every field named like a secret (passwords, tokens, keys)
+    replaced, at any depth.
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if SECRET_KEYS.search(key) else redact(item)
+            for key, item in value.items()
+        }
+
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+
+    return value
+
+
+def redact_body(content: bytes) -> Any:
+    if not content:
+        return None
+
+    try:
+        return redact(json.loads(content))
+    except ValueError:
+        return REDACTED
+
+
+def get_request_key(method: str, path: str, query: str) -> str:
+    params = "&".join(sorted(query.split("&"))) if query else ""
+    return f"{method} {path}?{params}"
+
+
+def open_recording(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.GzipFile(path, mode), encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+class JsonLinesWriter:
+    """
+    Appends compact JSON lines to a file, flushing each one so the file can
+    be read while (or after) the process is running.
+    """
+
+    def __init__(self, path: str) -> None:
+        Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+
+        self.started = time.monotonic()
+        self._file = open_recording(str(Path(path).expanduser()), "a")
+        atexit.register(self._file.close)
+
+    def write(self, record: dict[str, Any]) -> None:
+        record = {"at": round(time.monotonic() - self.started, 4), **record}
+
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        self._file.flush()
+
+
+def read_recording(path: str) -> Iterator[dict[str, Any]]:
+    with open_recording(str(Path(path).expanduser()), "r") as file:
+        try:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        except EOFError:
+            # A compressed recording whose process was killed; keep what was written
+            return
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Passes requests to `transport`, recording each exchange (without its
+    secrets) for `ReplayTransport` to serve later.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, path: str) -> None:
+        self.transport = transport
+        self.writer = JsonLinesWriter(path)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+
+        self.writer.write(
+            {
+                "key": get_request_key(
+                    request.method,
+                    request.url.path,
+                    request.url.query.decode(),
+                ),
+                "request": redact_body(request.content),
+                "status": response.status_code,
+                "headers": {
+                    name: response.headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in response.headers
+                },
+                "response": redact_body(content),
+                "seconds": round(time.perf_counter() - started, 4),
+            }
+        )
+
+        # The body was consumed (and decoded), so a new response carries it on
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves the responses recorded by `RecordingTransport`, never calling the
+    API. The responses of each request (method, path and query) are served
+    in the recorded order, starting over once all were served, so a short
+    recording can serve any amount of load.
+    """
+
+    def __init__(self, path: str, speed: float = REPLAY_SPEED) -> None:
+        self.speed = speed
+
+        self._recorded: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for exchange in read_recording(path):
+            self._recorded[exchange["key"]].append(exchange)
+
+        self.reset()
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self._recorded.values())
+
+    def reset(self) -> None:
+        """
+        Serve the responses of each request from the first recorded again,
+        counting the unmatched requests anew.
+        """
+        self.unmatched = 0
+        self._exchanges = {
+            key: deque(exchanges) for key, exchanges in self._recorded.items()
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = get_request_key(
+            request.method, request.url.path, request.url.query.decode()
+        )
+        exchanges = self._exchanges.get(key)
+
+        if not exchanges:
+            self.unmatched += 1
+            return httpx.Response(
+                404,
+                json={"message": f"Not in the recording: {key}"},
+                request=request,
+            )
+
+        exchange = exchanges[0]
+        exchanges.rotate(-1)
+
+        if self.speed > 0:
+            await asyncio.sleep(exchange["seconds"] / self.speed)
+
+        body = exchange["response"]
+        content = b"" if body is None else json.dumps(body).encode()
+
+        return httpx.Response(
+            exchange["status"],
+            headers=exchange["headers"],
+            content=content,
+            request=request,
+        )
+
+
+class CallRecorder:
+    """
+    Records the operations performed, with their arguments (without their
+    secrets), to replay them as a load test (see mcp_server.bench.replay).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.writer = JsonLinesWriter(path)
+
+    def record(self, operation: str, args: dict[str, Any] | None) -> None:
+        self.writer.write({"operation": operation, "args": redact(args or {})})
+
+
+call_recorder = CallRecorder(RECORD_CALLS) if RECORD_CALLS else None
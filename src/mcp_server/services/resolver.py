@@ -0,0 +1,296 @@
+import asyncio
+import os
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+from .applications import list_applications
+from .environments import list_environments
+from .names import NameEntry, Ref, get_name_index
+from .pipelines import list_pipelines
+from .projects import list_projects
+from .servers import list_servers
+from .session import get_session
+from .singleflight import SingleFlight
+from .utils import (
+    DevopnessClientAsync,
+    ListArgs,
+    get_args_from_helper,
+)
+
+RESOLVE_CONCURRENCY = int(os.environ.get("DEVOPNESS_MCP_RESOLVE_CONCURRENCY", "8"))
+
+
+class ResourceKind(str, Enum):
+    PROJECT = "project"
+    ENVIRONMENT = "environment"
+    SERVER = "server"
+    APPLICATION = "application"
+    PIPELINE = "pipeline"
+
+
+# Kind -> kind of its parent; only application pipelines are resolved by name
+PARENT_KINDS: dict[str, str | None] = {
+    "project": None,
+    "environment": "project",
+    "server": "environment",
+    "application": "environment",
+    "pipeline": "application",
+}
+
+# Lists the resources of a kind under a parent, which records them in the index
+LISTERS: dict[str, Callable[[DevopnessClientAsync, Ref], Awaitable[Any]]] = {
+    "project": lambda devopness, parent: list_projects(devopness, {}),
+    "environment": lambda devopness, parent: list_environments(
+        devopness, {"project_id": parent[1]}  # type: ignore[index]
+    ),
+    "server": lambda devopness, parent: list_servers(
+        devopness, {"environment_id": parent[1]}  # type: ignore[index]
+    ),
+    "application": lambda devopness, parent: list_applications(
+        devopness, {"environment_id": parent[1]}  # type: ignore[index]
+    ),
+    "pipeline": lambda devopness, parent: list_pipelines(
+        devopness,
+        {"resource_id": parent[1], "resource_type": parent[0]},  # type: ignore[index]
+    ),
+}
+
+# ID argument of an operation -> (name argument accepted instead, kind)
+NAME_ARGUMENTS = {
+    "project_id": ("project_name", "project"),
+    "environment_id": ("environment_name", "environment"),
+    "server_id": ("server_name", "server"),
+    "deploy_pipeline_id": ("pipeline_name", "pipeline"),
+}
+
+_refreshes = SingleFlight()
+
+
+async def refresh(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    scopes: list[Ref],
+    force: bool = False,
+) -> bool:
+    """
+    List the stale (or, with `force`, all) scopes again, returning whether
+    anything was listed.
+    """
+    name_index = get_name_index(devopness)
+    stale = [
+        scope for scope in scopes if force or not name_index.is_fresh(kind, scope)
+    ]
+    semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+
+    async def refresh_scope(scope: Ref) -> None:
+        async with semaphore:
+            # Listings are per account
+            await _refreshes.do(
+                (get_session(devopness).tenant_key, kind, scope),
+                lambda: LISTERS[kind](devopness, scope),
+            )
+
+    await asyncio.gather(*(refresh_scope(scope) for scope in stale))
+
+    return bool(stale)
+
+
+async def get_scopes(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    within: Ref,
+) -> list[Ref]:
+    """
+    The parents whose children of `kind` must be searched, given the closest
+    known ancestor (`None` to search the whole account).
+    """
+    parent_kind = PARENT_KINDS[kind]
+
+    if parent_kind is None:
+        return [None]
+
+    if within is not None and within[0] == parent_kind:
+        return [within]
+
+    parents, _ = await find_all(devopness, parent_kind, within)
+
+    return [(parent_kind, parent.id) for parent in parents]
+
+
+async def find_all(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    within: Ref = None,
+    force: bool = False,
+) -> tuple[list[NameEntry], bool]:
+    scopes = await get_scopes(devopness, kind, within)
+
+    refreshed = await refresh(devopness, kind, scopes, force)
+
+    name_index = get_name_index(devopness)
+    entries = [entry for scope in scopes for entry in name_index.children(kind, scope)]
+
+    return entries, refreshed
+
+
+async def find(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    name: str,
+    within: Ref = None,
+) -> list[NameEntry]:
+    entries, refreshed = await find_all(devopness, kind, within)
+    matches = [entry for entry in entries if entry.name == name]
+
+    # The resource may have been created since its scope was listed
+    if not matches and not refreshed:
+        entries, _ = await find_all(devopness, kind, within, force=True)
+        matches = [entry for entry in entries if entry.name == name]
+
+    return matches
+
+
+async def get_ancestor(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    args: dict[str, Any],
+) -> Ref:
+    """
+    The closest ancestor of `kind` given in `args` by ID or name.
+    """
+    ancestor = PARENT_KINDS[kind]
+
+    while ancestor is not None:
+        ancestor_id = args.get(f"{ancestor}_id")
+        if ancestor_id is not None:
+            return (ancestor, ancestor_id)
+
+        ancestor_name = args.get(f"{ancestor}_name")
+        if ancestor_name is not None:
+            entry = await resolve_one(devopness, ancestor, ancestor_name, args)
+            return (ancestor, entry.id)
+
+        ancestor = PARENT_KINDS[ancestor]
+
+    return None
+
+
+async def resolve_one(
+    devopness: DevopnessClientAsync,
+    kind: str,
+    name: str,
+    args: dict[str, Any],
+) -> NameEntry:
+    matches = await find(devopness, kind, name, await get_ancestor(devopness, kind, args))
+
+    if not matches:
+        raise ValueError(f"No {kind} named '{name}' was found")
+
+    if len(matches) > 1:
+        name_index = get_name_index(devopness)
+        candidates = [name_index.describe(entry) for entry in matches]
+        raise ValueError(
+            f"Found {len(matches)} {kind}s named '{name}', specify one of their"
+            f" parents (by ID or name) or use the ID directly: {candidates}"
+        )
+
+    return matches[0]
+
+
+async def resolve_names(
+    devopness: DevopnessClientAsync,
+    args_model: type,
+    args: ListArgs,
+) -> ListArgs:
+    """
+    Replace the name arguments (e.g. `server_name`) accepted by `args_model`
+    with the IDs they refer to (e.g. `server_id`).
+    """
+    if not args:
+        return args
+
+    resolved = dict(args)
+
+    for field in fields(args_model):
+        if field.name not in NAME_ARGUMENTS or args.get(field.name) is not None:
+            continue
+
+        name_argument, kind = NAME_ARGUMENTS[field.name]
+        name = args.get(name_argument)
+
+        if name is not None:
+            resolved[field.name] = (await resolve_one(devopness, kind, name, args)).id
+
+    return resolved
+
+
+def get_name_arguments(args_model: type) -> dict[str, str]:
+    """
+    The name arguments accepted by `args_model`, with their descriptions.
+    """
+    field_names = [field.name for field in fields(args_model)]
+    arguments = {}
+
+    for id_argument in field_names:
+        if id_argument not in NAME_ARGUMENTS:
+            continue
+
+        name_argument, kind = NAME_ARGUMENTS[id_argument]
+        arguments[name_argument] = f"Name of the {kind}, instead of `{id_argument}`"
+
+        ancestor = PARENT_KINDS[kind]
+        while ancestor is not None:
+            if f"{ancestor}_id" not in field_names:
+                arguments.setdefault(
+                    f"{ancestor}_name",
+                    f"Name of the {ancestor} to look for the {kind} in",
+                )
+
+            ancestor = PARENT_KINDS[ancestor]
+
+    return arguments
+
+
+def get_name_arguments_help(args_model: type) -> str:
+    arguments = get_name_arguments(args_model)
+
+    if not arguments:
+        return ""
+
+    msg = "Names (optional, resolved to IDs before performing the operation):"
+
+    for name, description in arguments.items():
+        msg += f"\n- {name}: {description}"
+
+    return msg
+
+
+@dataclass
+class Resolve:
+    """
+    Finds the ID of a resource by its name (the hostname, for servers), along
+    with the chain of its parents. Narrow the search by giving the ID or name
+    of any of its parents.
+    """
+
+    kind: ResourceKind
+    name: str
+    project_id: Optional[int] = None
+    project_name: Optional[str] = None
+    environment_id: Optional[int] = None
+    environment_name: Optional[str] = None
+    application_id: Optional[int] = None
+    application_name: Optional[str] = None
+
+
+async def resolve(devopness: DevopnessClientAsync, args: ListArgs):
+    parsed = get_args_from_helper(args, Resolve)
+
+    within = await get_ancestor(devopness, parsed.kind.value, args or {})
+    matches = await find(devopness, parsed.kind.value, parsed.name, within)
+
+    return {
+        "data": [get_name_index(devopness).describe(entry) for entry in matches],
+        "count": len(matches),
+    }
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from .names import get_name_index
+from .pagination import PaginationArgs, is_complete, paginate
+from .projection import FieldGetters, ProjectionArgs, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -7,11 +10,42 @@ from .utils import (
 )
 
 
-from devopness.models import ServerCloudServiceCode, CloudOsVersionCode
+from devopness.models import ServerCloudServiceCode, CloudOsVersionCode, ServerRelation
+
+
+SERVER_FIELDS: FieldGetters[ServerRelation] = {
+    "id": lambda server: server.id,
+    "name": lambda server: server.hostname,
+    "status": lambda server: server.status,
+    "ip_address": lambda server: server.ip_address,
+    "ssh_port": lambda server: server.ssh_port,
+    "last_action": lambda server: (
+        {
+            "id": server.last_action.id,
+            "type": server.last_action.type_human_readable,
+            "status": server.last_action.status_human_readable,
+            "url": server.last_action.url_web_permalink,
+        }
+        if server.last_action
+        else None
+    ),
+    "provider": lambda server: (
+        {
+            "name": server.credential.provider.code_human_readable,
+            "region": server.region or "Unknown",
+            "credential": {
+                "id": server.credential.id,
+                "name": server.credential.name,
+            },
+        }
+        if server.credential
+        else None
+    ),
+}
 
 
 @dataclass
-class ListServers:
+class ListServers(PaginationArgs, ProjectionArgs):
     environment_id: int
 
 
@@ -19,45 +53,25 @@ async def list_servers(devopness: DevopnessClientAsync, args: ListArgs):
     await ensure_authenticated(devopness)
 
     parsed = get_args_from_helper(args, ListServers)
+    fields = select_fields(SERVER_FIELDS, parsed)
 
-    response = await devopness.servers.list_environment_servers(parsed.environment_id)
+    data, pagination = await paginate(
+        lambda page, per_page: devopness.servers.list_environment_servers(
+            parsed.environment_id, page, per_page
+        ),
+        parsed,
+    )
 
-    servers = [
-        {
-            "id": server.id,
-            "name": server.hostname,
-            "status": server.status,
-            "ip_address": server.ip_address,
-            "ssh_port": server.ssh_port,
-            "last_action": (
-                {
-                    "id": server.last_action.id,
-                    "type": server.last_action.type_human_readable,
-                    "status": server.last_action.status_human_readable,
-                    "url": server.last_action.url_web_permalink,
-                }
-                if server.last_action
-                else None
-            ),
-            "provider": (
-                {
-                    "name": server.credential.provider.code_human_readable,
-                    "region": server.region or "Unknown",
-                    "credential": {
-                        "id": server.credential.id,
-                        "name": server.credential.name,
-                    },
-                }
-                if server.credential
-                else None
-            ),
-        }
-        for server in response.data
-    ]
+    get_name_index(devopness).record(
+        "server",
+        ("environment", parsed.environment_id),
+        ((server.id, server.hostname) for server in data),
+        is_complete(pagination),
+    )
 
     return {
-        "data": servers,
-        "count": len(servers),
+        **project(data, fields, parsed),
+        "pagination": pagination,
     }
 
 
@@ -110,6 +124,10 @@ async def devopness_create_server(
         },
     )
 
+    get_name_index(devopness).invalidate(
+        "server", ("environment", parsed.environment_id)
+    )
+
     return response.data
 
 
@@ -133,7 +151,11 @@ async def stop_server(devopness: DevopnessClientAsync, args: ListArgs):
 
     response = await devopness.servers.stop_server(parsed.server_id)
 
-    return response.data
+    return f"""
+    Server stop initiated.
+    Use the wait_for_action operation with action_id {response.action_id}
+    to wait for it to finish.
+    """
 
 
 @dataclass
@@ -160,8 +182,11 @@ async def delete_server(devopness: DevopnessClientAsync, args: ListArgs):
         parsed.destroy_server_disks,
     )
 
+    get_name_index(devopness).forget("server", parsed.server_id)
+
     return f"""
     Server deletion initiated.
     Go to https://app.devopness.com/actions/{response.action_id} page
-    to see the progress.
+    to see the progress, or use the wait_for_action operation with
+    action_id {response.action_id} to wait for it to finish.
     """
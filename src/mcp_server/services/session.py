@@ -0,0 +1,242 @@
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Generic, TypeVar
+from weakref import WeakKeyDictionary, ref
+
+import httpx
+from devopness import DevopnessClientAsync
+from devopness.base import DevopnessBaseServiceAsync
+from devopness.core import DevopnessApiError
+from devopness.models import UserLoginResponse, UserRefreshTokenResponse
+
+from .tenants import Tenant
+
+ResultType = TypeVar("ResultType")
+ValueType = TypeVar("ValueType")
+
+TOKEN_CHANGE_PATHS = ("/users/login", "/users/refresh-token")
+
+# Renew the access token this many seconds before it actually expires, so a
+# request is never sent with a token that expires while it is in flight.
+REFRESH_MARGIN_SECONDS = int(
+    os.environ.get("DEVOPNESS_MCP_TOKEN_REFRESH_MARGIN", "120")
+)
+
+
+def get_services(
+    devopness: DevopnessClientAsync,
+) -> list[DevopnessBaseServiceAsync]:
+    return [
+        service
+        for service in vars(devopness).values()
+        if isinstance(service, DevopnessBaseServiceAsync)
+    ]
+
+
+class AuthSession:
+    """
+    Keeps one logged in session per `DevopnessClientAsync`.
+
+    The access token is stored on the session and injected into every request
+    made by the client, instead of logging in again before each operation.
+    Renewals are serialized by a lock, so a burst of concurrent tool calls
+    results in a single login (or refresh) request.
+    """
+
+    def __init__(
+        self,
+        devopness: DevopnessClientAsync,
+        email: str,
+        password: str,
+        refresh_margin: int = REFRESH_MARGIN_SECONDS,
+    ) -> None:
+        # Weak, so the session (kept by client) doesn't keep its client alive
+        self._devopness = ref(devopness)
+        self.email = email
+        self.password = password
+        self.refresh_margin = refresh_margin
+
+        # Identifies the account, unlike the client, whose id may be reused
+        # by the client of another account once it is dropped
+        self.tenant_key = Tenant(email, password).key
+
+        self.access_token: str | None = None
+        self.refresh_token: str | None = None
+        self.expires_at = 0.0
+
+        self.login_count = 0
+        self.refresh_count = 0
+
+        self._lock = asyncio.Lock()
+
+        for service in get_services(devopness):
+            service._client._transport = AuthorizingTransport(
+                self, service._client._transport
+            )
+
+    @property
+    def devopness(self) -> DevopnessClientAsync:
+        devopness = self._devopness()
+        assert devopness is not None, "The client of the session was dropped"
+
+        return devopness
+
+    def is_valid(self) -> bool:
+        if self.access_token is None:
+            return False
+
+        return time.monotonic() < self.expires_at - self.refresh_margin
+
+    async def ensure(self) -> str:
+        if self.is_valid():
+            return self.access_token  # type: ignore[return-value]
+
+        async with self._lock:
+            if not self.is_valid():
+                await self._renew()
+
+            return self.access_token  # type: ignore[return-value]
+
+    async def invalidate(self, rejected_token: str | None) -> None:
+        async with self._lock:
+            # Another task may already have replaced the rejected token.
+            if self.access_token == rejected_token:
+                self.access_token = None
+                self.refresh_token = None
+                await self._renew()
+
+    async def _renew(self) -> None:
+        if self.refresh_token is not None:
+            try:
+                response = await self.devopness.users.refresh_token_user(
+                    {"refresh_token": self.refresh_token}
+                )
+                self.refresh_count += 1
+                self._store(response.data)
+                return
+            except DevopnessApiError:
+                self.refresh_token = None
+
+        response = await self.devopness.users.login_user(
+            {
+                "email": self.email,
+                "password": self.password,
+            }
+        )
+        self.login_count += 1
+        self._store(response.data)
+
+    def _store(self, data: UserLoginResponse | UserRefreshTokenResponse) -> None:
+        self.access_token = data.access_token
+        self.refresh_token = data.refresh_token
+        self.expires_at = time.monotonic() + data.expires_in
+
+
+class AuthorizingTransport(httpx.AsyncBaseTransport):
+    """
+    Sends the requests of a client with the access token of its session.
+
+    A request whose token the API rejects with a 401 is sent once more, after
+    the token is renewed, so only that request is repeated, never the other
+    calls (or the writes) of the operation making it.
+    """
+
+    def __init__(
+        self,
+        session: AuthSession,
+        transport: httpx.AsyncBaseTransport,
+    ) -> None:
+        self.session = session
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        token = self.session.access_token
+        if token is None or request.url.path in TOKEN_CHANGE_PATHS:
+            return await self.transport.handle_async_request(request)
+
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code != 401:
+            return response
+
+        await response.aclose()
+        await self.session.invalidate(token)
+
+        request.headers["Authorization"] = f"Bearer {self.session.access_token}"
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+_sessions: WeakKeyDictionary[DevopnessClientAsync, AuthSession] = WeakKeyDictionary()
+
+
+def start_session(
+    devopness: DevopnessClientAsync,
+    email: str,
+    password: str,
+) -> AuthSession:
+    """
+    Make `devopness` log in with the given credentials, instead of the ones
+    of the environment.
+    """
+    session = AuthSession(devopness, email, password)
+    _sessions[devopness] = session
+
+    return session
+
+
+def get_session(devopness: DevopnessClientAsync) -> AuthSession:
+    session = _sessions.get(devopness)
+    if session is not None:
+        return session
+
+    user_email = os.environ.get("DEVOPNESS_USER_EMAIL")
+    user_pass = os.environ.get("DEVOPNESS_USER_PASSWORD")
+
+    if not user_email or not user_pass:
+        raise Exception("DEVOPNESS_USER_EMAIL and DEVOPNESS_USER_PASSWORD must be set")
+
+    return start_session(devopness, user_email, user_pass)
+
+
+class PerClient(Generic[ValueType]):
+    """
+    One value (e.g. a cache) per Devopness client, i.e. per account, created
+    on first use and dropped along with the client.
+    """
+
+    def __init__(self, create: Callable[[], ValueType]) -> None:
+        self.create = create
+
+        self._values: WeakKeyDictionary[DevopnessClientAsync, ValueType] = (
+            WeakKeyDictionary()
+        )
+
+    def get(self, devopness: DevopnessClientAsync) -> ValueType:
+        value = self._values.get(devopness)
+
+        if value is None:
+            value = self.create()
+            self._values[devopness] = value
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+async def call_with_session(
+    devopness: DevopnessClientAsync,
+    call: Callable[[], Awaitable[ResultType]],
+) -> ResultType:
+    """
+    Run `call` with a valid session. Requests rejected with a 401 meanwhile
+    are retried by the session (see `AuthorizingTransport`).
+    """
+    await get_session(devopness).ensure()
+
+    return await call()
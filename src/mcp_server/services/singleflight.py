@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+ResultType = TypeVar("ResultType")
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call for a key is in flight,
+    other callers with the same key wait for it and share its result (or
+    error) instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[ResultType]],
+    ) -> ResultType:
+        future = self._in_flight.get(key)
+
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+
+            def forget(done: asyncio.Future[Any]) -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+                # Mark the error as retrieved, even if every caller gave up.
+                if not done.cancelled():
+                    done.exception()
+
+            future.add_done_callback(forget)
+
+        # Shielded, so one caller giving up does not cancel the shared call.
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from devopness import DevopnessClientAsync
+
+from .cache import TTLCache
+from .session import PerClient
+
+SNAPSHOT_TTL_SECONDS = float(os.environ.get("DEVOPNESS_MCP_SNAPSHOT_TTL", "3600"))
+SNAPSHOT_MAX_ENTRIES = int(os.environ.get("DEVOPNESS_MCP_SNAPSHOT_MAX_ENTRIES", "1024"))
+
+SNAPSHOT_ARGS = ("since", "diff")
+
+
+@dataclass
+class Snapshot:
+    operation: str
+    args_key: str
+    fingerprints: dict[Any, str]
+
+
+def to_plain(record: Any) -> Any:
+    if hasattr(record, "to_dict"):
+        return record.to_dict()
+
+    return record
+
+
+def fingerprint(record: Any) -> str:
+    encoded = json.dumps(to_plain(record), sort_keys=True, default=str)
+
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def get_args_key(args: dict[str, Any] | None) -> str:
+    args = {
+        name: value
+        for name, value in (args or {}).items()
+        if name not in SNAPSHOT_ARGS
+    }
+
+    return json.dumps(args, sort_keys=True, default=str)
+
+
+def get_records(result: Any) -> dict[Any, Any] | None:
+    """
+    The items of a list result (its `data` records, or its `rows` with the
+    "columns" output format) by `id`, or None when it has no items with an
+    `id` (e.g. when `fields` leaves it out).
+    """
+    if not isinstance(result, dict):
+        return None
+
+    if isinstance(result.get("rows"), list):
+        columns = result.get("columns") or []
+        if "id" not in columns:
+            return None
+
+        index = columns.index("id")
+        return {row[index]: row for row in result["rows"]}
+
+    if not isinstance(result.get("data"), list):
+        return None
+
+    records = {}
+    for record in result["data"]:
+        plain = to_plain(record)
+        if not isinstance(plain, dict) or plain.get("id") is None:
+            return None
+
+        records[plain["id"]] = record
+
+    return records
+
+
+class SnapshotStore:
+    """
+    Remembers the records returned by list operations, so later calls can
+    return only what was added, removed or changed since a snapshot.
+
+    Only record fingerprints are kept, indexed by the record `id`.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.snapshots: TTLCache[Snapshot] = TTLCache(ttl, max_entries)
+        self.latest: TTLCache[str] = TTLCache(ttl, max_entries)
+
+    def apply(
+        self,
+        operation: str,
+        args: dict[str, Any] | None,
+        result: Any,
+    ) -> Any:
+        """
+        Record a snapshot of `result` and, when `since` (a snapshot token) or
+        `diff` (compare with the latest snapshot) is in `args`, replace its
+        data by the changes.
+        """
+        records = get_records(result)
+        wants_diff = bool((args or {}).get("since") or (args or {}).get("diff"))
+
+        if records is None:
+            if wants_diff:
+                raise ValueError(
+                    "`since` and `diff` need the `id` of every item: include `id`"
+                    " in `fields`"
+                )
+
+            return result
+
+        args_key = get_args_key(args)
+
+        since = (args or {}).get("since")
+        if since is None and (args or {}).get("diff"):
+            since = self.latest.get((operation, args_key))
+
+        previous = self.snapshots.get(since) if since else None
+
+        token = uuid.uuid4().hex
+        current = Snapshot(
+            operation,
+            args_key,
+            {record_id: fingerprint(record) for record_id, record in records.items()},
+        )
+        self.snapshots.set(token, current)
+        self.latest.set((operation, args_key), token)
+
+        if since is None:
+            return {**result, "snapshot": token}
+
+        if (
+            previous is None
+            or previous.operation != operation
+            or previous.args_key != args_key
+        ):
+            return {
+                **result,
+                "snapshot": token,
+                "diff_error": f"Unknown or expired snapshot '{since}' for these arguments,"
+                " returning the full result",
+            }
+
+        added = []
+        changed = []
+        for record_id, record in records.items():
+            previous_fingerprint = previous.fingerprints.get(record_id)
+
+            if previous_fingerprint is None:
+                added.append(record)
+            elif previous_fingerprint != current.fingerprints[record_id]:
+                changed.append(record)
+
+        removed = [
+            record_id
+            for record_id in previous.fingerprints
+            if record_id not in records
+        ]
+
+        details = {
+            name: value
+            for name, value in result.items()
+            if name not in ("data", "rows", "count")
+        }
+
+        return {
+            **details,
+            "snapshot": token,
+            "since": since,
+            "added": added,
+            "changed": changed,
+            "removed": removed,
+            "unchanged_count": len(records) - len(added) - len(changed),
+            "count": len(records),
+        }
+
+
+snapshot_stores: PerClient[SnapshotStore] = PerClient(
+    lambda: SnapshotStore(SNAPSHOT_TTL_SECONDS, SNAPSHOT_MAX_ENTRIES)
+)
+
+
+def get_snapshot_store(devopness: DevopnessClientAsync) -> SnapshotStore:
+    return snapshot_stores.get(devopness)
@@ -1,4 +1,15 @@
 from dataclasses import dataclass
+from typing import Any
+
+from .cache import (
+    STATIC_CACHE_MAX_ENTRIES,
+    STATIC_CACHE_TTL_SECONDS,
+    CatalogCache,
+    TTLCache,
+)
+from .disk_cache import open_disk_cache
+from .pagination import fetch_all
+from .projection import ProjectionArgs, item_getters, project, select_fields
 from .utils import (
     DevopnessClientAsync,
     ListArgs,
@@ -8,6 +19,101 @@ from .utils import (
 
 from devopness.models import ProviderCode, CloudProviderServiceCode, CloudOsVersionCode
 
+REGION_FIELDS = item_getters(("code", "name"))
+
+INSTANCE_TYPE_FIELDS = item_getters(
+    (
+        "name",
+        "type",
+        "family",
+        "architecture",
+        "vcpus",
+        "memory",
+        "default_disk_size",
+        "price_hourly",
+        "price_monthly",
+        "price_currency",
+    )
+)
+
+# Provider catalogs change rarely, so they are cached by (provider_service, region)
+# in memory and, when DEVOPNESS_MCP_CACHE_DIR is set, on disk.
+#
+# Unlike the read cache of each client, these caches are shared by all the
+# accounts served: the catalogs come from the `/static/` endpoints of the API,
+# which serve the same public data (e.g. the regions of AWS EC2) to everyone.
+catalog_disk_cache = open_disk_cache("catalog")
+
+regions_cache: CatalogCache[list[dict[str, Any]]] = CatalogCache(
+    "regions",
+    TTLCache(STATIC_CACHE_TTL_SECONDS, STATIC_CACHE_MAX_ENTRIES),
+    catalog_disk_cache,
+)
+instance_types_cache: CatalogCache[list[dict[str, Any]]] = CatalogCache(
+    "instance_types",
+    TTLCache(STATIC_CACHE_TTL_SECONDS, STATIC_CACHE_MAX_ENTRIES),
+    catalog_disk_cache,
+)
+
+
+def clear_catalog_caches() -> None:
+    """
+    Forget the catalogs cached in memory (not on disk), as after a restart.
+    """
+    regions_cache.memory.clear()
+    instance_types_cache.memory.clear()
+
+
+def get_catalog_cache_stats() -> dict[str, Any]:
+    return {
+        "regions": regions_cache.stats(),
+        "instance_types": instance_types_cache.stats(),
+    }
+
+
+async def get_regions(
+    devopness: DevopnessClientAsync,
+    provider_service: CloudProviderServiceCode,
+) -> list[dict[str, Any]]:
+    async def fetch() -> list[dict[str, Any]]:
+        await ensure_authenticated(devopness)
+
+        response = await devopness.static.get_static_cloud_provider_service(
+            provider_service
+        )
+
+        return [
+            {
+                "code": region.code,
+                "name": region.name,
+            }
+            for region in (response.data.regions or [])
+        ]
+
+    return await regions_cache.get((provider_service.value,), fetch)
+
+
+async def get_instance_types(
+    devopness: DevopnessClientAsync,
+    provider_service: CloudProviderServiceCode,
+    region: str,
+) -> list[dict[str, Any]]:
+    async def fetch() -> list[dict[str, Any]]:
+        await ensure_authenticated(devopness)
+
+        data, _ = await fetch_all(
+            lambda page, per_page: devopness.static.list_static_cloud_instances_by_cloud_provider_service_code_and_region_code(
+                provider_service, region, page, per_page
+            )
+        )
+
+        return [
+            {name: getattr(instance_type, name) for name in INSTANCE_TYPE_FIELDS}
+            for instance_type in data
+        ]
+
+    return await instance_types_cache.get((provider_service.value, region), fetch)
+
 
 @dataclass
 class ListSupportedProviders:
@@ -22,35 +128,21 @@ async def list_supported_providers(devopness: DevopnessClientAsync, args: ListAr
 
 
 @dataclass
-class ListRegionsOfProviderService:
+class ListRegionsOfProviderService(ProjectionArgs):
     provider_service: CloudProviderServiceCode
 
 
 async def list_regions_of_provider_service(devopness: DevopnessClientAsync, args: ListArgs):
-    await ensure_authenticated(devopness)
-
     parsed = get_args_from_helper(args, ListRegionsOfProviderService)
+    fields = select_fields(REGION_FIELDS, parsed)
 
-    response = await devopness.static.get_static_cloud_provider_service(
-        parsed.provider_service
-    )
-
-    regions = [
-        {
-            "code": region.code,
-            "name": region.name,
-        }
-        for region in (response.data.regions or [])
-    ]
+    regions = await get_regions(devopness, parsed.provider_service)
 
-    return {
-        "data": regions,
-        "count": len(regions),
-    }
+    return project(regions, fields, parsed)
 
 
 @dataclass
-class ListInstanceTypesOfProviderServiceRegion:
+class ListInstanceTypesOfProviderServiceRegion(ProjectionArgs):
     provider_service: CloudProviderServiceCode
     region: str
 
@@ -58,23 +150,14 @@ class ListInstanceTypesOfProviderServiceRegion:
 async def list_instance_types_of_provider_service_region(
     devopness: DevopnessClientAsync, args: ListArgs
 ):
-    await ensure_authenticated(devopness)
-
     parsed = get_args_from_helper(args, ListInstanceTypesOfProviderServiceRegion)
+    fields = select_fields(INSTANCE_TYPE_FIELDS, parsed)
 
-    response = await devopness.static.list_static_cloud_instances_by_cloud_provider_service_code_and_region_code(
-        parsed.provider_service, region_code=parsed.region
+    instance_types = await get_instance_types(
+        devopness, parsed.provider_service, parsed.region
     )
 
-    instance_types = [
-        instance_type  # TODO: reduce amount of data
-        for instance_type in response.data
-    ]
-
-    return {
-        "data": instance_types,
-        "count": len(instance_types),
-    }
+    return project(instance_types, fields, parsed)
 
 
 @dataclass
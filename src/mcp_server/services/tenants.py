@@ -0,0 +1,78 @@
+import hashlib
+import os
+from dataclasses import dataclass, field
+
+from fastmcp.server.dependencies import get_http_headers, get_http_request
+
+# Headers carrying the Devopness account of the requests served over HTTP
+EMAIL_HEADER = "x-devopness-user-email"
+PASSWORD_HEADER = "x-devopness-user-password"
+
+# Whether the requests served over HTTP without those headers act on behalf of
+# the account of the environment. Off by default: anyone able to reach the
+# server would otherwise act as that account.
+HTTP_ENV_ACCOUNT = os.environ.get("DEVOPNESS_MCP_HTTP_ENV_ACCOUNT", "") in ("1", "true")
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """
+    A Devopness account the server acts on behalf of.
+
+    `key` is derived from both the email and the password, so a request
+    never reaches the client (and caches) of an account it did not prove
+    to own.
+    """
+
+    email: str
+    password: str = field(repr=False)
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        digest = hashlib.sha256(f"{self.email}\0{self.password}".encode()).hexdigest()
+        object.__setattr__(self, "key", digest)
+
+
+def is_http_request() -> bool:
+    try:
+        get_http_request()
+    except RuntimeError:
+        return False
+
+    return True
+
+
+def get_tenant() -> Tenant:
+    """
+    The account of the MCP request being handled: the one given in its HTTP
+    headers or, over stdio, the one of the environment (over HTTP too if
+    DEVOPNESS_MCP_HTTP_ENV_ACCOUNT is set).
+    """
+    headers = get_http_headers(include_all=True)
+
+    user_email = headers.get(EMAIL_HEADER)
+    user_pass = headers.get(PASSWORD_HEADER)
+
+    if user_email or user_pass:
+        if not user_email or not user_pass:
+            raise ValueError(
+                f"Both the {EMAIL_HEADER} and {PASSWORD_HEADER} headers must be set"
+            )
+
+        return Tenant(user_email, user_pass)
+
+    if not HTTP_ENV_ACCOUNT and is_http_request():
+        raise ValueError(
+            f"The {EMAIL_HEADER} and {PASSWORD_HEADER} headers must be set"
+        )
+
+    user_email = os.environ.get("DEVOPNESS_USER_EMAIL")
+    user_pass = os.environ.get("DEVOPNESS_USER_PASSWORD")
+
+    if not user_email or not user_pass:
+        raise Exception(
+            "DEVOPNESS_USER_EMAIL and DEVOPNESS_USER_PASSWORD must be set, or the"
+            f" {EMAIL_HEADER} and {PASSWORD_HEADER} headers be sent"
+        )
+
+    return Tenant(user_email, user_pass)
@@ -1,37 +1,24 @@
-from dataclasses import fields, is_dataclass
+from dataclasses import MISSING, dataclass, fields, is_dataclass
 from enum import Enum
-import os
+from functools import cache
+import inspect
+from types import UnionType
 from typing import (
     Any,
+    Callable,
     Dict,
-    Literal,
-    Type,
     TypeVar,
     Union,
+    cast,
     get_args,
     get_origin,
 )
 
 from devopness import DevopnessClientAsync
 
-Operations = Literal[
-    "__help__",
-    "list_projects",
-    "list_environments",
-    "list_servers",
-    "list_applications",
-    "list_pipelines",
-    "list_supported_providers",
-    "list_regions_of_provider_service",
-    "list_instance_types_of_provider_service_region",
-    "deploy_application",
-    "create_server",
-    "list_credentials",
-    "list_supported_os_versions",
-    "stop_server",
-    "delete_server",
-]
-
+from .pagination import PaginationArgs
+from .projection import ProjectionArgs
+from .session import get_session
 
 ListArgs = Dict[str, Any] | None
 ArgType = TypeVar("ArgType")
@@ -45,80 +32,155 @@ class EnvironmentResourceType(str, Enum):
         return self.value
 
 
-def get_arg(arg_name: str, arg_type: Type[ArgType], args: ListArgs) -> ArgType:
-    if args is None:
-        raise ValueError(
-            f"Missing argument: '{arg_name}' with type '{arg_type.__name__}'"
-        )
+@dataclass(frozen=True)
+class ArgValidator:
+    name: str
+    type_name: str
+    required: bool
+    default: Any
+    validate: Callable[[Any], Any]
+    missing_message: str
+
 
-    if arg_name not in args:
-        raise ValueError(
-            f"Missing argument: '{arg_name}' with type '{arg_type.__name__}'"
+def compile_type_validator(
+    arg_name: str,
+    arg_type: Any,
+) -> tuple[Callable[[Any], Any], str]:
+    if get_origin(arg_type) is list:
+        item_types = get_args(arg_type)
+        if len(item_types) != 1:
+            raise TypeError(
+                f"Invalid type for field '{arg_name}': {arg_type} (expected list[<type>])"
+            )
+
+        validate_item, item_type_name = compile_type_validator(
+            f"{arg_name}[]", item_types[0]
         )
+        type_name = f"list[{item_type_name}]"
+        list_error = f"Argument '{arg_name}' must be of type '{type_name}'"
 
-    value = args[arg_name]
+        def validate_list(value: Any) -> list[Any]:
+            if not isinstance(value, list):
+                raise TypeError(f"{list_error}, got '{type(value).__name__}'")
 
-    if isinstance(arg_type, type) and issubclass(arg_type, Enum):
-        try:
-            return arg_type(value)  # type: ignore
-        except ValueError:
-            raise ValueError(
-                f"Invalid value for argument '{arg_name}': '{value}'"
-                " (expected one of: " + ", ".join([el.value for el in arg_type]) + ")"
-            )
+            return [validate_item(item) for item in value]
+
+        return validate_list, type_name
 
-    if not isinstance(value, arg_type):
+    if not isinstance(arg_type, type):
         raise TypeError(
-            f"Argument '{arg_name}' must be of type '{arg_type.__name__}', got '{type(value).__name__}'"
+            f"Invalid type for field '{arg_name}': {arg_type} (expected real Python type)"
         )
 
-    return value
+    if issubclass(arg_type, Enum):
+        members = {member.value: member for member in arg_type}
+        enum_error = (
+            f"Invalid value for argument '{arg_name}': '%s'"
+            " (expected one of: " + ", ".join(str(value) for value in members) + ")"
+        )
 
+        def validate_enum(value: Any) -> Enum:
+            if isinstance(value, arg_type):
+                return value
 
-def get_optional_arg(
-    arg_name: str,
-    arg_type: Type[ArgType],
-    args: ListArgs,
-) -> ArgType | None:
-    if args is None or arg_name not in args:
-        return None
+            try:
+                return members[value]
+            except (KeyError, TypeError):
+                raise ValueError(enum_error % (value,)) from None
 
-    return get_arg(arg_name, arg_type, args)
+        return validate_enum, arg_type.__name__
 
+    type_error = f"Argument '{arg_name}' must be of type '{arg_type.__name__}'"
 
-def get_args_from_helper(
-    args: ListArgs,
-    args_model: type[ArgType],
-) -> ArgType:
+    if arg_type is float:
+        # JSON does not tell integers and floats apart
+        def validate_number(value: Any) -> float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"{type_error}, got '{type(value).__name__}'")
+
+            return float(value)
+
+        return validate_number, arg_type.__name__
+
+    def validate_type(value: Any) -> Any:
+        if not isinstance(value, arg_type):
+            raise TypeError(f"{type_error}, got '{type(value).__name__}'")
+
+        return value
+
+    return validate_type, arg_type.__name__
+
+
+@cache
+def compile_args_model(args_model: type) -> tuple[ArgValidator, ...]:
+    """
+    Build the validators of an args dataclass once, so parsing arguments does
+    not need to inspect its fields and types on every call.
+    """
     if not is_dataclass(args_model):
         raise TypeError("args_model must be a dataclass")
 
-    kwargs = {}
+    validators = []
 
     for field in fields(args_model):
-        arg_name = field.name
         arg_type = field.type
+        optional = False
 
-        origin = get_origin(arg_type)
-
-        if origin is Union:
+        if get_origin(arg_type) in (Union, UnionType):
             inner_types = get_args(arg_type)
             non_none = [t for t in inner_types if t is not type(None)]
-            if len(non_none) == 1:
-                actual_type = non_none[0]
-                if not isinstance(actual_type, type):
-                    raise TypeError(
-                        f"Invalid optional inner type for '{arg_name}': {actual_type}"
-                    )
-                kwargs[arg_name] = get_optional_arg(arg_name, actual_type, args)
-                continue
-
-        if not isinstance(arg_type, type):
-            raise TypeError(
-                f"Invalid type for field '{arg_name}': {arg_type} (expected real Python type)"
+            if len(non_none) == 1 and len(non_none) < len(inner_types):
+                arg_type = non_none[0]
+                optional = True
+
+        validate, type_name = compile_type_validator(field.name, arg_type)
+
+        default = None
+        if field.default is not MISSING:
+            default = field.default
+        elif field.default_factory is not MISSING:
+            default = field.default_factory
+
+        validators.append(
+            ArgValidator(
+                name=field.name,
+                type_name=type_name,
+                required=not optional and default is None,
+                default=default,
+                validate=validate,
+                missing_message=f"Missing argument: '{field.name}' with type '{type_name}'",
             )
+        )
+
+    return tuple(validators)
+
+
+def get_args_from_helper(
+    args: ListArgs,
+    args_model: type[ArgType],
+) -> ArgType:
+    if args is None:
+        args = {}
+
+    kwargs: dict[str, Any] = {}
+
+    # Classes are hashable, but mypy does not know it of type[ArgType]
+    validators = compile_args_model(cast(type, args_model))
+
+    for validator in validators:
+        value = args.get(validator.name)
 
-        kwargs[arg_name] = get_arg(arg_name, arg_type, args)
+        if value is None and (validator.name not in args or not validator.required):
+            if validator.required:
+                raise ValueError(validator.missing_message)
+
+            # Leave it to the dataclass default (None for optional fields)
+            if validator.default is None:
+                kwargs[validator.name] = None
+
+            continue
+
+        kwargs[validator.name] = validator.validate(value)
 
     return args_model(**kwargs)
 
@@ -127,41 +189,25 @@ def get_helper(
     operation: str,
     args_model: type,
 ) -> str:
-    if not is_dataclass(args_model):
-        raise TypeError("args_model must be a dataclass")
-
     doc = args_model.__doc__ or ""
     msg = f"{doc}\n\nTo perform the '{operation}' operation, you must specify the following arguments:"
 
-    for field in fields(args_model):
-        arg_name = field.name
-        arg_type = field.type
+    for validator in compile_args_model(args_model):
         optional_suffix = ""
+        if not validator.required:
+            optional_suffix = " (optional)"
 
-        origin = get_origin(arg_type)
-        if origin is Union:
-            inner_types = get_args(arg_type)
-            non_none = [t for t in inner_types if t is not type(None)]
-            if len(non_none) == 1:
-                arg_type = non_none[0]
-                optional_suffix = " (optional)"
+            if validator.default is not None and not callable(validator.default):
+                optional_suffix = f" (optional, default: {validator.default})"
+
+        msg += f"\n- {validator.name}: {validator.type_name}{optional_suffix}"
 
-        type_name = getattr(arg_type, "__name__", str(arg_type))
-        msg += f"\n- {arg_name}: {type_name}{optional_suffix}"
+    for options_model in (PaginationArgs, ProjectionArgs):
+        if issubclass(args_model, options_model):
+            msg += "\n\n" + inspect.cleandoc(options_model.__doc__ or "")
 
     return msg
 
 
 async def ensure_authenticated(devopness: DevopnessClientAsync) -> None:
-    user_email = os.environ.get("DEVOPNESS_USER_EMAIL")
-    user_pass = os.environ.get("DEVOPNESS_USER_PASSWORD")
-
-    if not user_email or not user_pass:
-        raise Exception("DEVOPNESS_USER_EMAIL and DEVOPNESS_USER_PASSWORD must be set")
-
-    await devopness.users.login_user(
-        {
-            "email": user_email,
-            "password": user_pass,
-        }
-    )
+    await get_session(devopness).ensure()
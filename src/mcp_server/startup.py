@@ -0,0 +1,79 @@
+"""
+Measures the cold start of the server, in a new interpreter:
+
+    mcp-server --profile-startup
+
+Importing the server should not import the services nor the Devopness SDK;
+they are loaded by the first operation performed, along with its client.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Any
+
+
+def elapsed(started: float) -> float:
+    return round(time.perf_counter() - started, 4)
+
+
+def measure() -> dict[str, Any]:
+    """
+    The time taken by each step of the cold start of this interpreter, up to
+    the first operation (without calling the Devopness API).
+    """
+    warnings.simplefilter("ignore")
+    profile: dict[str, Any] = {}
+
+    started = time.perf_counter()
+    from .main import server  # noqa: F401
+
+    profile["import_seconds"] = elapsed(started)
+    profile["sdk_imported_on_start"] = "devopness" in sys.modules
+
+    started = time.perf_counter()
+    from .registry import load_operations
+
+    load_operations()
+    profile["load_operations_seconds"] = elapsed(started)
+
+    started = time.perf_counter()
+    from .services.clients import create_client, create_http_transport
+
+    create_client(create_http_transport())
+    profile["create_client_seconds"] = elapsed(started)
+
+    profile["total_seconds"] = round(
+        profile["import_seconds"]
+        + profile["load_operations_seconds"]
+        + profile["create_client_seconds"],
+        4,
+    )
+
+    return profile
+
+
+def profile_startup() -> dict[str, Any]:
+    # The server is already imported here, so it is measured in a new process
+    # (finding this package where it was found here)
+    path = os.pathsep.join(
+        filter(None, [str(Path(__file__).parents[1]), os.environ.get("PYTHONPATH")])
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-m", "mcp_server.startup"],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": path},
+    )
+
+    return json.loads(completed.stdout)
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure()))
@@ -0,0 +1,95 @@
+import inspect
+import os
+from functools import cache
+from typing import Any, Awaitable, Callable, Literal
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
+from fastmcp.utilities.json_schema import compress_schema
+from mcp.types import ToolAnnotations
+from pydantic import TypeAdapter
+
+from .registry import OPERATIONS, Operation
+
+ToolsMode = Literal["generic", "operations", "all"]
+
+# generic: a single `devopness_perform_any_operation` tool (with `__help__`)
+# operations: one tool per operation, each with its own input schema
+# all: both
+TOOLS_MODE: ToolsMode = os.environ.get("DEVOPNESS_MCP_TOOLS", "generic")  # type: ignore[assignment]
+
+SNAPSHOT_PROPERTIES = {
+    "since": {
+        "anyOf": [{"type": "string"}, {"type": "null"}],
+        "default": None,
+        "description": "Snapshot token of a previous call, to get only the changes since then",
+    },
+    "diff": {
+        "anyOf": [{"type": "boolean"}, {"type": "null"}],
+        "default": None,
+        "description": "Get only the changes since the latest snapshot",
+    },
+}
+
+
+def get_args_doc(args_model: type) -> str:
+    doc = inspect.cleandoc(args_model.__doc__ or "")
+
+    # Dataclasses without a docstring get their signature as __doc__
+    if doc.startswith(f"{args_model.__name__}("):
+        return ""
+
+    return doc
+
+
+@cache
+def get_args_schema(args_model: type) -> dict[str, Any]:
+    return compress_schema(TypeAdapter(args_model).json_schema(), prune_titles=True)
+
+
+def build_operation_tool(
+    operation: Operation,
+    perform: Callable[[Any, dict[str, Any] | None], Awaitable[Any]],
+) -> FunctionTool:
+    # Describing an operation loads its service (and the SDK), see registry
+    from .services.resolver import NAME_ARGUMENTS, get_name_arguments
+
+    schema = dict(get_args_schema(operation.args_model))
+
+    if operation.snapshot:
+        schema["properties"] = {**schema["properties"], **SNAPSHOT_PROPERTIES}
+
+    name_properties = {
+        name: {"type": "string", "description": description}
+        for name, description in get_name_arguments(operation.args_model).items()
+    }
+
+    if name_properties:
+        schema["properties"] = {**schema["properties"], **name_properties}
+        schema["required"] = [
+            argument
+            for argument in schema.get("required", [])
+            if argument not in NAME_ARGUMENTS
+        ]
+
+    async def perform_tool_operation(**arguments: Any) -> Any:
+        return await perform(operation.name, arguments)
+
+    return FunctionTool(
+        fn=perform_tool_operation,
+        name=f"devopness_{operation.name}",
+        description=(
+            f"Perform the '{operation.name}' operation using Devopness API.\n\n"
+            + get_args_doc(operation.args_model)
+        ).strip(),
+        parameters=schema,
+        annotations=ToolAnnotations(readOnlyHint=operation.read_only),
+    )
+
+
+def register_operation_tools(
+    server: FastMCP,
+    perform: Callable[[Any, dict[str, Any] | None], Awaitable[Any]],
+) -> None:
+    for operation in OPERATIONS.values():
+        server.add_tool(build_operation_tool(operation, perform))
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeApiConfig, FakeDevopnessApi
+from mcp_server.dispatch import client_pool
+from mcp_server.services.clients import create_client
+from mcp_server.services.session import start_session
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def api() -> FakeDevopnessApi:
+    return FakeDevopnessApi(FakeApiConfig(latency=0))
+
+
+@pytest.fixture
+def devopness(api: FakeDevopnessApi) -> DevopnessClientAsync:
+    """
+    A client of the fake API, logged in as a test account.
+    """
+    devopness = create_client(api.transport())
+    start_session(devopness, "user@example.com", "secret")
+
+    return devopness
+
+
+@pytest.fixture
+def server_api(
+    api: FakeDevopnessApi,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[FakeDevopnessApi]:
+    """
+    The fake API, serving the operations performed by the server (e.g. with
+    `mcp_server.main.perform_operation`) for the account of the environment.
+    """
+    monkeypatch.setenv("DEVOPNESS_USER_EMAIL", "user@example.com")
+    monkeypatch.setenv("DEVOPNESS_USER_PASSWORD", "secret")
+    monkeypatch.setattr(client_pool, "create_transport", api.transport)
+
+    yield api
+
+    asyncio.run(client_pool.aclose())
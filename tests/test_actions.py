@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from devopness import DevopnessClientAsync
+from devopness import models
+from devopness.models import Action
+
+from mcp_server.bench.fake_api import FakeDevopnessApi, build_record
+from mcp_server.main import perform_operation
+from mcp_server.services.actions import (
+    get_steps,
+    summarize_action,
+    wait_for_action,
+    watch_action,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def step(order: int, status: str) -> dict:
+    return {
+        "id": order,
+        "action_id": 1,
+        "action_target_id": 1,
+        "name": f"Step {order}",
+        "order": order,
+        "status": status,
+    }
+
+
+def build_action(*targets: dict) -> Action:
+    return Action.from_dict(
+        build_record(models.Action, id=1, status="in-progress", targets=list(targets))
+    )
+
+
+def test_steps_of_targets() -> None:
+    action = build_action(
+        # The finished steps are counted, when listed
+        {
+            "status": "in-progress",
+            "total_steps": 3,
+            "current_step": step(2, "in-progress"),
+            "steps": [step(1, "completed"), step(2, "in-progress"), step(3, "pending")],
+        },
+        # Else the ones before the current step
+        {"status": "in-progress", "total_steps": 4, "current_step": step(3, "queued")},
+        {"status": "completed", "total_steps": 2},
+        {"status": "pending", "total_steps": 5},
+    )
+
+    assert get_steps(action) == (1 + 2 + 2 + 0, 3 + 4 + 2 + 5)
+
+    targets = summarize_action(action)["targets"]
+    assert [target["current_step"] for target in targets] == [
+        "Step 2",
+        "Step 3",
+        None,
+        None,
+    ]
+
+
+def test_steps_of_an_action_without_targets() -> None:
+    assert get_steps(build_action()) == (0, 0)
+
+
+async def test_watch_action_until_it_finishes(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.actions.ACTION_POLL_MIN_SECONDS", 0)
+
+    progress = []
+
+    class Context:
+        async def report_progress(self, done, total, message) -> None:
+            progress.append((done, total))
+
+    result = await watch_action(devopness, 7, context=Context())
+
+    assert result["finished"] and not result["timed_out"]
+    assert result["polls"] == api.config.action_polls
+    assert result["steps"] == {"done": 3, "total": 3}
+    assert progress == [(0, 3), (1, 3), (3, 3)]
+
+
+async def test_waits_for_the_same_action_are_not_coalesced(
+    server_api: FakeDevopnessApi,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.actions.ACTION_POLL_MIN_SECONDS", 0)
+
+    # Each caller polls (and is sent progress notifications) on its own
+    results = await asyncio.gather(
+        perform_operation("wait_for_action", {"action_id": 7}),
+        perform_operation("wait_for_action", {"action_id": 7}),
+    )
+
+    assert all(result["finished"] for result in results)
+    polls = sum(result["polls"] for result in results)
+    assert polls == server_api.calls["GET /actions/7"]
+
+
+async def test_wait_is_capped_by_the_server(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.actions.ACTION_WAIT_TIMEOUT_SECONDS", 0)
+
+    result = await wait_for_action(
+        devopness, {"action_id": 7, "timeout_seconds": 1e9}
+    )
+
+    assert result["timed_out"]
+    assert result["polls"] == 1
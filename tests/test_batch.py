@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from mcp_server.services.batch import BATCH_MAX_CONCURRENCY, run_batch
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrency_is_capped_by_the_server() -> None:
+    running = 0
+    peak = 0
+
+    async def perform(operation: Any, args: dict[str, Any] | None) -> Any:
+        nonlocal running, peak
+
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+        if args and args.get("fail"):
+            raise ValueError("failed")
+
+        return args
+
+    items: list[Any] = [
+        {"operation": "list_projects", "args": {"index": index, "fail": index == 3}}
+        for index in range(BATCH_MAX_CONCURRENCY * 4)
+    ]
+
+    results = await run_batch(items, perform, max_concurrency=10_000)
+
+    assert peak == BATCH_MAX_CONCURRENCY
+    assert [result["result"]["index"] for result in results[:3]] == [0, 1, 2]
+    assert results[3] == {"operation": "list_projects", "error": "failed"}
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from mcp_server.services.cache import CatalogCache, TTLCache
+from mcp_server.services.disk_cache import DiskCache
+
+pytestmark = pytest.mark.anyio
+
+
+def open_catalog_cache(path: Path) -> CatalogCache[list[str]]:
+    return CatalogCache("regions", TTLCache(3600, 16), DiskCache(path))
+
+
+async def test_catalog_survives_a_restart(tmp_path: Path) -> None:
+    fetches = []
+
+    async def fetch() -> list[str]:
+        fetches.append(1)
+        return ["us-east-1"]
+
+    first = open_catalog_cache(tmp_path / "catalog.sqlite3")
+    assert await first.get(("aws-ec2",), fetch) == ["us-east-1"]
+
+    # A new process starts with an empty memory cache, but the same file
+    restarted = open_catalog_cache(tmp_path / "catalog.sqlite3")
+    assert await restarted.get(("aws-ec2",), fetch) == ["us-east-1"]
+    assert await restarted.get(("aws-ec2",), fetch) == ["us-east-1"]
+
+    assert len(fetches) == 1
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.stats()["hits"] == 1
+
+
+async def test_expired_disk_entry_is_served_while_revalidated(tmp_path: Path) -> None:
+    disk = DiskCache(tmp_path / "catalog.sqlite3")
+    disk._set("regions", "aws-ec2", ["stale"], time.time() - 7200)
+
+    cache = CatalogCache("regions", TTLCache(3600, 16), disk)
+
+    async def fetch() -> list[str]:
+        return ["fresh"]
+
+    assert await cache.get(("aws-ec2",), fetch) == ["stale"]
+
+    await asyncio.gather(*cache._tasks)
+
+    assert cache.revalidations == 1
+    assert await cache.get(("aws-ec2",), fetch) == ["fresh"]
+
+    entry = await disk.get("regions", "aws-ec2")
+    assert entry is not None and entry[0] == ["fresh"]
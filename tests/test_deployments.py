@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeApiConfig, FakeDevopnessApi
+from mcp_server.services.clients import create_client
+from mcp_server.services.deployments import deploy_applications
+from mcp_server.services.session import start_session
+
+pytestmark = pytest.mark.anyio
+
+
+def deploy_args(pipeline_ids: list[int], **args: object) -> dict[str, object]:
+    return {
+        "deploy_source_type": "branch",
+        "deploy_source_value": "main",
+        "pipeline_ids": pipeline_ids,
+        **args,
+    }
+
+
+async def test_wait_is_capped_by_the_server(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.actions.ACTION_WAIT_TIMEOUT_SECONDS", 0)
+
+    pipeline_id = api.pipeline_id(api.application_ids(101)[0])
+
+    result = await deploy_applications(
+        devopness, deploy_args([pipeline_id], wait=True, timeout_seconds=1e9)
+    )
+
+    assert result["outcomes"] == {"timed_out": 1}
+
+
+async def test_each_pipeline_is_deployed_once(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    pipeline_id = api.pipeline_id(api.application_ids(101)[0])
+
+    result = await deploy_applications(devopness, deploy_args([pipeline_id] * 2))
+
+    assert result["count"] == 1
+    assert api.calls[f"POST /pipelines/{pipeline_id}/actions"] == 1
+
+
+async def test_pipeline_limit_covers_concurrent_calls(
+    api: FakeDevopnessApi,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.actions.ACTION_POLL_MIN_SECONDS", 0)
+
+    transport = api.transport()
+    running = 0
+    peak = 0
+
+    class ActionsTransport(httpx.AsyncBaseTransport):
+        """
+        Counts the actions in progress: launched and not yet seen finished.
+        """
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+
+            response = await transport.handle_async_request(request)
+            path = request.url.path
+
+            if request.method == "POST" and path.endswith("/actions"):
+                running += 1
+                peak = max(peak, running)
+            elif path.startswith("/actions/"):
+                await response.aread()
+                if response.json()["status"] == "completed":
+                    running -= 1
+
+            return response
+
+    devopness = create_client(ActionsTransport())
+    start_session(devopness, "user@example.com", "secret")
+
+    # The pipelines of the fake API allow a single action at a time
+    pipeline_id = api.pipeline_id(api.application_ids(101)[0])
+
+    results = await asyncio.gather(
+        *(
+            deploy_applications(devopness, deploy_args([pipeline_id], wait=True))
+            for _ in range(3)
+        )
+    )
+
+    assert [result["outcomes"] for result in results] == [{"completed": 1}] * 3
+    assert peak == 1
+
+
+async def test_concurrency_is_capped_by_the_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.deployments.DEPLOY_CONCURRENCY", 2)
+
+    api = FakeDevopnessApi(FakeApiConfig(latency=0.002))
+    transport = api.transport()
+    running = 0
+    peak = 0
+
+    class LaunchesTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+
+            if request.method != "POST" or not request.url.path.endswith("/actions"):
+                return await transport.handle_async_request(request)
+
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await transport.handle_async_request(request)
+            finally:
+                running -= 1
+
+    devopness = create_client(LaunchesTransport())
+    start_session(devopness, "user@example.com", "secret")
+
+    pipeline_ids = [
+        api.pipeline_id(application_id)
+        for environment_id in api.all_environment_ids()
+        for application_id in api.application_ids(environment_id)
+    ]
+
+    result = await deploy_applications(
+        devopness, deploy_args(pipeline_ids, max_concurrency=10_000)
+    )
+
+    assert result["outcomes"] == {"started": len(pipeline_ids)}
+    assert peak == 2
@@ -0,0 +1,50 @@
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.services.instance_search import (
+    compare_instance_types_across_regions,
+    find_instance_types,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_compare_across_regions(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    result = await compare_instance_types_across_regions(
+        devopness,
+        {
+            "provider_service": "aws-ec2",
+            "instance_types": ["t1", "t2"],
+            "fields": ["region", "type", "vcpus"],
+        },
+    )
+
+    assert result["failed_regions"] == 0
+    assert [report["region"] for report in result["regions"]] == api.config.regions
+    assert result["data"] == [
+        {"region": region, "type": instance_type, "vcpus": 1 + int(instance_type[1:])}
+        for region in api.config.regions
+        for instance_type in ("t1", "t2")
+    ]
+
+
+async def test_find_instance_types(devopness: DevopnessClientAsync) -> None:
+    result = await find_instance_types(
+        devopness,
+        {
+            "provider_service": "aws-ec2",
+            "regions": ["eu-west-1"],
+            "min_vcpus": 8,
+            "fields": ["type", "vcpus", "price_hourly"],
+        },
+    )
+
+    assert result["data"]
+    assert all(match["vcpus"] >= 8 for match in result["data"])
+
+    prices = [match["price_hourly"] for match in result["data"]]
+    assert prices == sorted(prices)
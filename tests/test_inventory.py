@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeApiConfig, FakeDevopnessApi
+from mcp_server.services.clients import create_client
+from mcp_server.services.inventory import inventory
+from mcp_server.services.session import start_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_whole_inventory(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    result = await inventory(devopness, {})
+
+    assert [project["id"] for project in result["data"]] == api.project_ids()
+    assert result["errors"] == 0
+
+    environment = result["data"][0]["environments"][0]
+    assert [server["id"] for server in environment["servers"]] == api.server_ids(
+        environment["id"]
+    )
+
+
+async def test_single_project_is_fetched_directly(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    result = await inventory(devopness, {"project_id": 2})
+
+    assert [project["id"] for project in result["data"]] == [2]
+    assert [
+        environment["id"] for environment in result["data"][0]["environments"]
+    ] == api.environment_ids(2)
+
+    assert api.calls["GET /projects/2"] == 1
+    assert api.calls["GET /projects"] == 0
+    assert api.calls["GET /projects/1/environments"] == 0
+
+
+async def test_concurrency_is_capped_by_the_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("mcp_server.services.inventory.INVENTORY_CONCURRENCY", 2)
+
+    api = FakeDevopnessApi(FakeApiConfig(latency=0.002))
+    transport = api.transport()
+
+    running = 0
+    peak = 0
+
+    class CountingTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await transport.handle_async_request(request)
+            finally:
+                running -= 1
+
+    devopness = create_client(CountingTransport())
+    start_session(devopness, "user@example.com", "secret")
+
+    result = await inventory(
+        devopness, {"include_pipelines": True, "max_concurrency": 10_000}
+    )
+
+    assert result["errors"] == 0
+    # One limit per level: environments, their resources and their pipelines
+    assert peak <= 3 * 2
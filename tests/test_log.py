@@ -0,0 +1,31 @@
+import logging
+
+import pytest
+from devopness import DevopnessClientAsync
+from devopness.core.api_error import DevopnessApiError
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.services.projects import list_projects
+from mcp_server.services.session import get_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_error_responses_are_logged(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    await get_session(devopness).ensure()
+    api.config.error_rate = 1
+
+    caplog.set_level(logging.DEBUG, logger="mcp_server.upstream")
+
+    with pytest.raises(DevopnessApiError):
+        await list_projects(devopness, {})
+
+    assert [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "mcp_server.upstream"
+    ] == ["GET /projects -> 503"]
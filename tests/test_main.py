@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.main import get_metrics, get_prometheus_metrics, perform_operation
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_coalesced_calls_are_reported(server_api: FakeDevopnessApi) -> None:
+    before = get_metrics()["single_flight"]
+
+    await asyncio.gather(
+        *(perform_operation("list_projects", {}) for _ in range(10))
+    )
+
+    after = get_metrics()["single_flight"]
+
+    assert server_api.calls["GET /projects"] == 1
+    assert after["calls"] - before["calls"] == 1
+    assert after["coalesced"] - before["coalesced"] == 9
+
+    assert (
+        f"devopness_mcp_single_flight_coalesced_total {after['coalesced']}\n"
+        in get_prometheus_metrics()
+    )
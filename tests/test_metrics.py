@@ -0,0 +1,29 @@
+import pytest
+from devopness import DevopnessClientAsync
+from devopness.core.api_error import DevopnessApiError
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.services.metrics import metrics
+from mcp_server.services.projects import list_projects
+from mcp_server.services.session import get_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_error_responses_are_counted(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    await get_session(devopness).ensure()
+    api.config.error_rate = 1
+
+    with pytest.raises(DevopnessApiError):
+        async with metrics.track("test_error_responses_are_counted"):
+            await list_projects(devopness, {})
+
+    operation = metrics.operations["test_error_responses_are_counted"]
+
+    assert operation.errors == 1
+    assert operation.upstream_calls == 1
+    assert operation.upstream_errors == 1
+    assert operation.upstream_bytes > 0
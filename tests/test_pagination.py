@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+
+from mcp_server.bench.fake_api import FakeApiConfig, FakeDevopnessApi
+from mcp_server.services.clients import create_client
+from mcp_server.services.pagination import fetch_all
+from mcp_server.services.servers import list_servers
+from mcp_server.services.session import start_session
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def api() -> FakeDevopnessApi:
+    # Pages answer out of order, as prefetched pages would in practice
+    return FakeDevopnessApi(
+        FakeApiConfig(servers_per_environment=23, latency=0, latency_jitter=0.01)
+    )
+
+
+async def list_server_ids(api: FakeDevopnessApi, **args: int) -> dict[str, Any]:
+    devopness = create_client(api.transport())
+    start_session(devopness, "user@example.com", "secret")
+
+    result = await list_servers(devopness, {"environment_id": 101, **args})
+
+    return {**result, "ids": [server["id"] for server in result["data"]]}
+
+
+async def test_every_page_is_fetched_in_order(api: FakeDevopnessApi) -> None:
+    result = await list_server_ids(api, per_page=4)
+
+    assert result["ids"] == api.server_ids(101)
+    assert result["pagination"] == {"truncated": False}
+    assert api.calls["GET /environments/101/servers"] == 6
+
+
+async def test_limit_stops_fetching_pages(api: FakeDevopnessApi) -> None:
+    result = await list_server_ids(api, per_page=4, limit=10)
+
+    assert result["ids"] == api.server_ids(101)[:10]
+    assert result["pagination"] == {"truncated": True}
+    assert api.calls["GET /environments/101/servers"] == 3
+
+
+async def test_single_page(api: FakeDevopnessApi) -> None:
+    result = await list_server_ids(api, per_page=4, page=6)
+
+    assert result["ids"] == api.server_ids(101)[20:]
+    assert result["pagination"]["page_count"] == 6
+    assert result["pagination"]["next_page"] is None
+
+
+@pytest.mark.parametrize(
+    "args",
+    [{"page": 0}, {"per_page": 0}, {"limit": -1}, {"page": 1, "limit": -1}],
+)
+async def test_invalid_pagination_is_rejected(
+    api: FakeDevopnessApi,
+    args: dict[str, int],
+) -> None:
+    with pytest.raises(ValueError, match="or more"):
+        await list_server_ids(api, **args)
+
+    assert api.calls["GET /environments/101/servers"] == 0
+
+
+async def test_fetch_all_rejects_a_negative_limit() -> None:
+    async def fetch_page(page: int, per_page: int) -> Any:
+        raise AssertionError("No page should be fetched")
+
+    with pytest.raises(ValueError, match="`limit` must be 0 or more"):
+        await fetch_all(fetch_page, 3, -1)
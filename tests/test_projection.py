@@ -0,0 +1,40 @@
+import pytest
+
+from mcp_server.services.projection import (
+    OutputFormat,
+    ProjectionArgs,
+    item_getters,
+    project,
+    select_fields,
+)
+
+GETTERS = item_getters(("id", "name", "region"))
+
+ITEMS = [
+    {"id": 1, "name": "a", "region": "us-east-1"},
+    {"id": 2, "name": "b"},
+]
+
+
+def test_records_with_the_selected_fields() -> None:
+    projection = ProjectionArgs(fields=["name", "id", "name"])
+
+    assert project(ITEMS, select_fields(GETTERS, projection), projection) == {
+        "data": [{"name": "a", "id": 1}, {"name": "b", "id": 2}],
+        "count": 2,
+    }
+
+
+def test_columns() -> None:
+    projection = ProjectionArgs(output_format=OutputFormat.COLUMNS)
+
+    assert project(ITEMS, select_fields(GETTERS, projection), projection) == {
+        "columns": ["id", "name", "region"],
+        "rows": [[1, "a", "us-east-1"], [2, "b", None]],
+        "count": 2,
+    }
+
+
+def test_unknown_fields_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown fields: zone"):
+        select_fields(GETTERS, ProjectionArgs(fields=["id", "zone"]))
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from mcp_server.services.read_cache import TaggedCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_write_drops_the_entries_it_made_stale() -> None:
+    cache = TaggedCache(ttl=60, max_entries=16)
+    loads = []
+
+    async def load(value: str) -> str:
+        loads.append(value)
+        return value
+
+    await cache.get("env 1", ["environment/1/servers"], lambda: load("servers 1"))
+    await cache.get("env 2", ["environment/2/servers"], lambda: load("servers 2"))
+
+    assert cache.invalidate(["environment/1/servers"]) == 1
+
+    await cache.get("env 1", ["environment/1/servers"], lambda: load("servers 1"))
+    await cache.get("env 2", ["environment/2/servers"], lambda: load("servers 2"))
+
+    assert loads == ["servers 1", "servers 2", "servers 1"]
+
+
+async def test_result_loaded_during_a_write_is_not_kept() -> None:
+    cache = TaggedCache(ttl=60, max_entries=16)
+    loading = asyncio.Event()
+    written = asyncio.Event()
+
+    async def load() -> str:
+        loading.set()
+        await written.wait()
+        return "before the write"
+
+    task = asyncio.create_task(cache.get("env 1", ["environment/1/servers"], load))
+
+    await loading.wait()
+    cache.invalidate(["environment/1/servers"])
+    written.set()
+
+    assert await task == "before the write"
+    assert len(cache) == 0
+
+    # Kept only for the loads in flight, so it does not grow with every tag
+    assert cache._invalidated_at == {}
+
+
+async def test_invalidated_tags_are_not_kept() -> None:
+    cache = TaggedCache(ttl=60, max_entries=16)
+
+    async def load() -> str:
+        return "servers"
+
+    for environment_id in range(100):
+        tags = [f"environment/{environment_id}/servers"]
+        await cache.get(environment_id, tags, load)
+        cache.invalidate(tags)
+
+    assert cache._invalidated_at == {}
+    assert cache._loading == {}
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mcp_server.bench.fake_api import ACCESS_TOKEN, FakeDevopnessApi
+from mcp_server.services.recording import RecordingTransport, ReplayTransport
+
+pytestmark = pytest.mark.anyio
+
+API_URL = "https://api.devopness.com"
+
+
+async def record_projects(api: FakeDevopnessApi, path: Path) -> None:
+    """
+    Record two calls listing the projects: accepted, then rejected.
+    """
+    transport = RecordingTransport(api.transport(), str(path))
+
+    async with httpx.AsyncClient(transport=transport, base_url=API_URL) as client:
+        for token in (ACCESS_TOKEN, "revoked"):
+            await client.get("/projects", headers={"Authorization": f"Bearer {token}"})
+
+    transport.writer._file.close()
+
+
+async def replay_statuses(transport: ReplayTransport, *paths: str) -> list[int]:
+    async with httpx.AsyncClient(transport=transport, base_url=API_URL) as client:
+        return [(await client.get(path)).status_code for path in paths]
+
+
+@pytest.mark.parametrize("name", ["upstream.jsonl", "upstream.jsonl.gz"])
+async def test_recording_is_replayed_in_order(
+    api: FakeDevopnessApi,
+    tmp_path: Path,
+    name: str,
+) -> None:
+    await record_projects(api, tmp_path / name)
+
+    transport = ReplayTransport(str(tmp_path / name), speed=0)
+
+    assert len(transport) == 2
+    assert await replay_statuses(
+        transport, "/projects", "/projects", "/projects", "/environments"
+    ) == [200, 401, 200, 404]
+    assert transport.unmatched == 1
+
+
+async def test_reset_replays_from_the_start(
+    api: FakeDevopnessApi,
+    tmp_path: Path,
+) -> None:
+    await record_projects(api, tmp_path / "upstream.jsonl")
+
+    transport = ReplayTransport(str(tmp_path / "upstream.jsonl"), speed=0)
+    assert await replay_statuses(transport, "/projects", "/environments") == [200, 404]
+
+    transport.reset()
+
+    assert transport.unmatched == 0
+    assert await replay_statuses(transport, "/projects") == [200]
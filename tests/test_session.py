@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.services.applications import deploy_application
+from mcp_server.services.inventory import inventory
+from mcp_server.services.projects import list_projects
+from mcp_server.services.session import call_with_session, get_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_calls_log_in_once(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    await asyncio.gather(
+        *(
+            call_with_session(devopness, lambda: list_projects(devopness, {}))
+            for _ in range(10)
+        )
+    )
+
+    assert api.calls["POST /users/login"] == 1
+    assert get_session(devopness).login_count == 1
+
+
+async def test_rejected_token_retries_only_the_rejected_request(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    session = get_session(devopness)
+    await session.ensure()
+    session.access_token = "revoked"
+
+    result = await call_with_session(
+        devopness, lambda: inventory(devopness, {"include_pipelines": True})
+    )
+
+    assert result["errors"] == 0
+    assert session.login_count == 2
+
+    # Only the request sent with the revoked token was sent again
+    assert api.calls["GET /projects"] == 2
+    assert all(
+        count == 1
+        for call, count in api.calls.items()
+        if call.startswith("GET ") and call != "GET /projects"
+    )
+
+
+async def test_rejected_token_does_not_repeat_a_write(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    session = get_session(devopness)
+    await session.ensure()
+    session.access_token = "revoked"
+
+    first_id = api.next_id
+    pipeline_id = api.pipeline_id(api.application_ids(101)[0])
+
+    await call_with_session(
+        devopness,
+        lambda: deploy_application(
+            devopness,
+            {
+                "deploy_pipeline_id": pipeline_id,
+                "deploy_source_type": "branch",
+                "deploy_source_value": "main",
+            },
+        ),
+    )
+
+    # Sent twice (rejected, then accepted), but only one action was launched
+    assert api.calls[f"POST /pipelines/{pipeline_id}/actions"] == 2
+    assert api.next_id == first_id + 1
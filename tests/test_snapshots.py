@@ -0,0 +1,96 @@
+from typing import Any
+
+import pytest
+
+from mcp_server.services.snapshots import SnapshotStore
+
+
+@pytest.fixture
+def store() -> SnapshotStore:
+    return SnapshotStore(ttl=60, max_entries=16)
+
+
+def servers(*records: tuple[int, str]) -> dict[str, Any]:
+    return {
+        "data": [{"id": server_id, "name": name} for server_id, name in records],
+        "count": len(records),
+        "pagination": {"truncated": False},
+    }
+
+
+def test_changes_since_a_snapshot(store: SnapshotStore) -> None:
+    args = {"environment_id": 1}
+
+    first = store.apply("list_servers", args, servers((1, "a"), (2, "b"), (3, "c")))
+
+    diff = store.apply(
+        "list_servers",
+        {**args, "since": first["snapshot"]},
+        servers((1, "a"), (2, "renamed"), (4, "d")),
+    )
+
+    assert diff["added"] == [{"id": 4, "name": "d"}]
+    assert diff["changed"] == [{"id": 2, "name": "renamed"}]
+    assert diff["removed"] == [3]
+    assert diff["unchanged_count"] == 1
+    assert diff["count"] == 3
+    assert diff["pagination"] == {"truncated": False}
+    assert diff["snapshot"] != first["snapshot"]
+
+
+def test_diff_compares_with_the_latest_snapshot(store: SnapshotStore) -> None:
+    args = {"environment_id": 1}
+
+    store.apply("list_servers", args, servers((1, "a")))
+    store.apply("list_servers", args, servers((1, "a"), (2, "b")))
+
+    diff = store.apply(
+        "list_servers", {**args, "diff": True}, servers((1, "a"), (2, "b"))
+    )
+
+    assert diff["added"] == diff["changed"] == diff["removed"] == []
+    assert diff["unchanged_count"] == 2
+
+
+def test_snapshots_of_other_arguments_are_not_compared(store: SnapshotStore) -> None:
+    first = store.apply("list_servers", {"environment_id": 1}, servers((1, "a")))
+
+    result = store.apply(
+        "list_servers",
+        {"environment_id": 2, "since": first["snapshot"]},
+        servers((5, "e")),
+    )
+
+    assert "diff_error" in result
+    assert result["data"] == [{"id": 5, "name": "e"}]
+
+
+def test_columns_output_format(store: SnapshotStore) -> None:
+    args = {"environment_id": 1, "output_format": "columns"}
+
+    first = store.apply(
+        "list_servers",
+        args,
+        {"columns": ["id", "name"], "rows": [[1, "a"], [2, "b"]], "count": 2},
+    )
+
+    diff = store.apply(
+        "list_servers",
+        {**args, "since": first["snapshot"]},
+        {"columns": ["id", "name"], "rows": [[1, "a"], [2, "renamed"]], "count": 2},
+    )
+
+    assert diff["columns"] == ["id", "name"]
+    assert diff["changed"] == [[2, "renamed"]]
+    assert diff["added"] == diff["removed"] == []
+
+
+def test_diff_without_ids_is_an_error(store: SnapshotStore) -> None:
+    args = {"environment_id": 1, "fields": ["name"]}
+    result = {"data": [{"name": "a"}], "count": 1}
+
+    # Without ids nothing can be compared, so no snapshot is taken
+    assert store.apply("list_servers", args, result) == result
+
+    with pytest.raises(ValueError, match="include `id`"):
+        store.apply("list_servers", {**args, "diff": True}, result)
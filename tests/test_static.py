@@ -0,0 +1,31 @@
+import pytest
+from devopness import DevopnessClientAsync
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.main import get_metrics
+from mcp_server.services.static import (
+    instance_types_cache,
+    list_instance_types_of_provider_service_region,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_catalog_cache_hits_are_reported(
+    api: FakeDevopnessApi,
+    devopness: DevopnessClientAsync,
+) -> None:
+    instance_types_cache.memory.clear()
+    before = get_metrics()["catalog_caches"]["instance_types"]
+
+    args = {"provider_service": "aws-ec2", "region": "eu-west-1"}
+    for _ in range(3):
+        result = await list_instance_types_of_provider_service_region(devopness, args)
+        assert result["count"] == api.config.instance_types_per_region
+
+    after = get_metrics()["catalog_caches"]["instance_types"]
+
+    path = "/static/cloud-provider-service-options/aws-ec2/regions/eu-west-1/instances"
+    assert api.calls[f"GET {path}"] == 1
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
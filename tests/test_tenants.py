@@ -0,0 +1,87 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pytest
+from fastmcp.server.http import _current_http_request
+from starlette.requests import Request
+
+from mcp_server.bench.fake_api import FakeDevopnessApi
+from mcp_server.dispatch import client_pool
+from mcp_server.main import perform_operation
+from mcp_server.services import tenants
+from mcp_server.services.tenants import (
+    EMAIL_HEADER,
+    PASSWORD_HEADER,
+    Tenant,
+    get_tenant,
+)
+
+
+@pytest.fixture(autouse=True)
+def env_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DEVOPNESS_USER_EMAIL", "env@example.com")
+    monkeypatch.setenv("DEVOPNESS_USER_PASSWORD", "secret")
+
+
+@contextmanager
+def http_request(headers: dict[str, str]) -> Iterator[None]:
+    """
+    Handle an HTTP request with the given headers meanwhile.
+    """
+    scope = {
+        "type": "http",
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+    }
+
+    token = _current_http_request.set(Request(scope))
+    try:
+        yield
+    finally:
+        _current_http_request.reset(token)
+
+
+def test_stdio_requests_use_the_env_account() -> None:
+    assert get_tenant() == Tenant("env@example.com", "secret")
+
+
+def test_http_requests_use_the_account_of_their_headers() -> None:
+    headers = {EMAIL_HEADER: "user@example.com", PASSWORD_HEADER: "other"}
+
+    with http_request(headers):
+        assert get_tenant() == Tenant("user@example.com", "other")
+
+
+def test_http_requests_without_headers_are_rejected() -> None:
+    with http_request({}), pytest.raises(ValueError, match="headers must be set"):
+        get_tenant()
+
+
+def test_http_requests_without_headers_may_use_the_env_account(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tenants, "HTTP_ENV_ACCOUNT", True)
+
+    with http_request({}):
+        assert get_tenant() == Tenant("env@example.com", "secret")
+
+
+@pytest.mark.anyio
+async def test_calls_of_other_tenants_are_not_coalesced(
+    server_api: FakeDevopnessApi,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # As if the client of an evicted account had its id reused by another's
+    devopness = client_pool.get(Tenant("env@example.com", "secret"))
+    monkeypatch.setattr(client_pool, "get", lambda tenant: devopness)
+
+    async def list_projects_as(email: str) -> Any:
+        with http_request({EMAIL_HEADER: email, PASSWORD_HEADER: "secret"}):
+            return await perform_operation("list_projects", {})
+
+    await asyncio.gather(
+        list_projects_as("first@example.com"),
+        list_projects_as("second@example.com"),
+    )
+
+    assert server_api.calls["GET /projects"] == 2
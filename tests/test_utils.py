@@ -0,0 +1,41 @@
+from typing import Any
+
+import pytest
+from devopness.models import CloudProviderServiceCode
+
+from mcp_server.services.instance_search import FindInstanceTypes
+from mcp_server.services.utils import get_args_from_helper
+
+
+def test_arguments_are_validated_and_converted() -> None:
+    parsed = get_args_from_helper(
+        {
+            "provider_service": "aws-ec2",
+            "regions": ["us-east-1"],
+            "min_memory_gb": 2,
+            "min_vcpus": None,
+        },
+        FindInstanceTypes,
+    )
+
+    assert parsed.provider_service is CloudProviderServiceCode("aws-ec2")
+    assert parsed.regions == ["us-east-1"]
+    assert parsed.min_memory_gb == 2.0 and isinstance(parsed.min_memory_gb, float)
+    assert parsed.min_vcpus is None
+
+
+@pytest.mark.parametrize(
+    ("args", "error"),
+    [
+        ({"regions": ["us-east-1"]}, "Missing argument: 'provider_service'"),
+        ({"provider_service": "nope", "regions": []}, "expected one of"),
+        ({"provider_service": "aws-ec2", "regions": [1]}, r"'regions\[\]'"),
+        (
+            {"provider_service": "aws-ec2", "regions": [], "min_vcpus": "2"},
+            "'min_vcpus'",
+        ),
+    ],
+)
+def test_invalid_arguments_are_rejected(args: dict[str, Any], error: str) -> None:
+    with pytest.raises((TypeError, ValueError), match=error):
+        get_args_from_helper(args, FindInstanceTypes)